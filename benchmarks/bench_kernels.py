@@ -0,0 +1,433 @@
+"""
+Benchmarks for the numerical kernels and the render path.
+
+Each case is timed (best of several repeats) and run once more under
+tracemalloc for its peak allocation.  Results are appended to a JSON history
+keyed by the current git commit, and --compare reports cases that became
+slower between two recorded runs.
+
+Usage:
+    python benchmarks/bench_kernels.py [--quick] [-k PATTERN]
+    python benchmarks/bench_kernels.py --compare HEAD~1 HEAD [--threshold 0.2]
+    python benchmarks/bench_kernels.py --compare '#-2' '#-1'   # last two recorded runs
+    python benchmarks/bench_kernels.py --list
+"""
+# Each case imports its own dependencies, so scipy and matplotlib load only
+# for the cases selected and the Agg backend is set before pyplot.
+# pylint: disable=import-outside-toplevel
+import argparse
+import datetime
+import fnmatch
+import importlib.util
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from functools import partial
+
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+# pylint: disable=wrong-import-position  # the package is found through REPO_DIR
+from teaching_support import instrumentation
+from teaching_support.angular import legendre_table, spherical_harmonics
+from teaching_support.consecutive_kinetics import conc_profiles
+from teaching_support.density_volume import density_volume
+from teaching_support.kinetics_fit import fit_consecutive
+from teaching_support.matrix_elements import DIPOLE, radial_matrix_elements
+from teaching_support.mechanism import Mechanism
+from teaching_support.orbital_mesh import orbital_mesh
+from teaching_support.potentials import V_eff, compute_potential_terms, effective_potential
+from teaching_support.radial_engine import radial_table, radial_wavefunction
+from teaching_support.radial_moments import radial_moments
+from teaching_support.radial_nodes import all_radial_nodes, radial_nodes
+from teaching_support.radial_solver import coulomb, solve_radial
+from teaching_support.stochastic_kinetics import ensemble_statistics
+# pylint: enable=wrong-import-position
+
+HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.json")
+GRID_SIZES = (10**3, 10**4, 10**5, 10**6)
+QUICK_LIMIT = 10**4
+STIFF_MECHANISM = "A -> X : k1; X -> Z : k2; X + X -> D : kd"
+VOLUME_PATH = os.path.join(tempfile.gettempdir(), "bench_density_volume.npy")
+
+
+# --- Reference implementations the package replaced, kept for comparison ---
+
+def legacy_radial_wavefunction(r, n, l, Z=1):
+    """R_nl from scipy's genlaguerre, one state per call, as the scripts computed it."""
+    from math import sqrt
+    from scipy.special import factorial, genlaguerre
+    rho = 2 * Z * r / n
+    norm_const = sqrt((2 * Z / n)**3 * factorial(n - l - 1) / (2 * n * factorial(n + l)))
+    return norm_const * np.exp(-rho / 2) * rho**l * genlaguerre(n - l - 1, 2 * l + 1)(rho)
+
+
+def legacy_find_nodes(r, R):
+    """Nodes by a Python loop over sign changes of R with linear interpolation."""
+    nodes = []
+    for i in range(1, len(R)):
+        if R[i-1]*R[i] < 0:
+            nodes.append(r[i-1] - R[i-1]*(r[i] - r[i-1]) / (R[i] - R[i-1]))
+    return nodes
+
+
+def legacy_brentq_nodes(n, l, r_max):
+    """Nodes by brentq on every bracketing interval of a 200-point scan."""
+    from scipy.optimize import brentq
+    guess_r = np.linspace(1e-5, r_max, 200)
+    nodes = []
+
+    def f(x):
+        return legacy_radial_wavefunction(x, n, l)
+
+    for a, b in zip(guess_r[:-1], guess_r[1:]):
+        if f(a) * f(b) < 0:
+            nodes.append(brentq(f, a, b))
+    return nodes
+
+
+def p_orbital_surface(n_points):
+    """The angular mesh and Cartesian surface built by plot_p_orbital."""
+    side = int(round(np.sqrt(n_points)))
+    theta, phi = np.meshgrid(np.linspace(0, np.pi, side), np.linspace(0, 2 * np.pi, side))
+    r = np.abs(np.sin(theta) * np.cos(phi))
+    return r * np.sin(theta) * np.cos(phi), r * np.sin(theta) * np.sin(phi), r * np.cos(theta)
+
+
+def _no_show(*_args, **_kwargs):
+    """Stands in for plt.show while rendering off screen."""
+
+
+def render_exponential_difference():
+    """The reaction-intermediate figure, rasterised to PNG in memory at 300 dpi."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from teaching_support.plotting import plot_exponential_difference
+    plt.show = _no_show
+    fig = plot_exponential_difference(k1=10e-3, k2=100)
+    fig.savefig(io.BytesIO(), format="png", dpi=300)
+    plt.close(fig)
+
+
+def render_p_orbital():
+    """The p_x orbital surface, rasterised to PNG in memory."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from teaching_support.plotting import plot_p_orbital
+    plt.show = _no_show
+    fig = plot_p_orbital("x")
+    fig.savefig(io.BytesIO(), format="png", dpi=100)
+    plt.close(fig)
+
+
+def synthetic_kinetics(n_sets, n_times=60, sigma=0.01, seed=0):
+    """Noisy [A], [X], [Z] profiles for log-uniform k1, k2 in [0.05, 5]."""
+    rng = np.random.default_rng(seed)
+    t = np.linspace(0, 10, n_times)
+    k1, k2 = np.exp(rng.uniform(np.log(0.05), np.log(5), (2, n_sets, 1)))
+    return t, [c + rng.normal(0, sigma, c.shape) for c in conc_profiles(t, 1.0, k1, k2)]
+
+
+def legacy_curve_fit_loop(t, profiles):
+    """One scipy curve_fit of (k1, k2) per measured data set."""
+    from scipy.optimize import curve_fit
+
+    def model(t, k1, k2):
+        return np.concatenate(conc_profiles(t, 1.0, k1, k2))
+
+    return [curve_fit(model, t, np.concatenate([c[i] for c in profiles]), p0=(1.0, 1.0))[0]
+            for i in range(len(profiles[0]))]
+
+
+def explorer_updates(kind, moves=20):
+    """Slider moves on an explorer, built and drawn on the first (warm-up) call; Agg blits are free."""
+    explorer = []
+
+    def run():
+        if not explorer:
+            import matplotlib
+            matplotlib.use("Agg")
+            from teaching_support.explorers import KineticsExplorer, PotentialExplorer
+            explorer.append(KineticsExplorer() if kind == "kinetics" else PotentialExplorer())
+            explorer[0].fig.canvas.draw()
+        for i in range(moves):
+            if kind == "kinetics":
+                explorer[0].update(k1=0.1 + 0.1 * i)
+            else:
+                explorer[0].update(l=i % 7)
+    return run
+
+
+def traced_calls(enabled, calls=10000):
+    """Calls of a traced no-op, with tracing off or recording in memory (no trace files)."""
+    # pylint: disable=protected-access  # swaps in an in-memory recorder, as the tests do
+    noop = instrumentation.traced("noop")(lambda: None)
+
+    def run():
+        saved = instrumentation._recorder
+        instrumentation._recorder = instrumentation._Recorder(None) if enabled else None
+        try:
+            for _ in range(calls):
+                noop()
+        finally:
+            instrumentation._recorder = saved
+    return run
+
+
+# --- Case table ---
+
+def _has_scipy():
+    return importlib.util.find_spec("scipy") is not None
+
+
+def _wavefunction_samples(size):
+    r = np.linspace(0, 100, size)
+    return r, radial_wavefunction(r, 20, 3)
+
+
+def _potential_grid(size):
+    return np.linspace(0.05e-10, 5e-10, size)
+
+
+def _fit_case(legacy=False):
+    t, profiles = synthetic_kinetics(1000)
+    if legacy:
+        return partial(legacy_curve_fit_loop, t, [c[:100] for c in profiles])
+    return partial(fit_consecutive, t, *profiles, sigma=0.01)
+
+
+def _mechanism_case(equations, batch, **k_fixed):
+    mechanism = Mechanism(equations)
+    t = np.concatenate(([0.0], np.geomspace(1e-6, 1e3, 100)))
+    k = {"k1": np.geomspace(1e-3, 1.0, batch), "k2": 1e6, **k_fixed}
+    return partial(mechanism.integrate, t, {"A": 1.0}, k)
+
+
+def build_cases(quick=False):  # pylint: disable=too-many-branches
+    """
+    Return {case_id: factory}; ids look like 'kernel[params]'.
+
+    A factory builds the inputs of its case and returns the zero-argument
+    callable that is timed, so listing or filtering the cases allocates
+    nothing and only the selected cases are set up.
+    """
+    sizes = [s for s in GRID_SIZES if not quick or s <= QUICK_LIMIT]
+    cases = {}
+    for size in sizes:
+        cases[f"radial_wavefunction[n=20,l=3,N={size}]"] = (
+            lambda size=size: partial(radial_wavefunction, np.linspace(0, 100, size), 20, 3))
+        cases[f"conc_profiles[N={size}]"] = (
+            lambda size=size: partial(conc_profiles, np.linspace(0, 40, size), 1.0, 0.5, 5.0))
+        cases[f"V_eff[l=0..3,N={size}]"] = (
+            lambda size=size: lambda r=_potential_grid(size): [V_eff(r, l) for l in range(4)])
+        cases[f"compute_potential_terms[l=0..3,N={size}]"] = (
+            lambda size=size: lambda r=_potential_grid(size): [compute_potential_terms(l, r) for l in range(4)])
+        cases[f"effective_potential[l=0..3,N={size}]"] = (
+            lambda size=size: partial(effective_potential, _potential_grid(size) * 1e10, range(4),
+                                      components=True))
+        cases[f"p_orbital_surface[N={size}]"] = lambda size=size: partial(p_orbital_surface, size)
+        cases[f"legacy_find_nodes[n=20,l=3,N={size}]"] = (
+            lambda size=size: partial(legacy_find_nodes, *_wavefunction_samples(size)))
+        if _has_scipy():
+            cases[f"legacy_radial_wavefunction[n=20,l=3,N={size}]"] = (
+                lambda size=size: partial(legacy_radial_wavefunction, np.linspace(0, 100, size), 20, 3))
+        for n_max in (10, 50):
+            if n_max * (n_max + 1) // 2 * size <= 2 * 10**7:  # keep the table under ~160 MB
+                cases[f"radial_table[n_max={n_max},N={size}]"] = (
+                    lambda size=size, n_max=n_max: partial(radial_table, n_max, np.linspace(0, 100, size)))
+    for n_max in (10, 50):
+        cases[f"all_radial_nodes[n_max={n_max}]"] = lambda n_max=n_max: partial(all_radial_nodes, n_max)
+    cases["radial_nodes[n=50,l=0]"] = lambda: partial(radial_nodes, 50, 0)
+    if _has_scipy():
+        for size in sizes:
+            cases[f"solve_radial[coulomb,l=0,k=5,N={size}]"] = (
+                lambda size=size: partial(solve_radial, coulomb(1), 0, 5, n_points=size))
+    for n_max in (10, 50):
+        cases[f"radial_moments[n_max={n_max},k=0,1,2,-1]"] = lambda n_max=n_max: partial(radial_moments, n_max)
+        cases[f"dipole_matrix_elements[n_max={n_max}]"] = (
+            lambda n_max=n_max: partial(radial_matrix_elements, n_max, 1, 1, DIPOLE, cache=False))
+    cases["fit_consecutive[D=1000,T=60]"] = _fit_case
+    if _has_scipy():
+        cases["legacy_curve_fit_loop[D=100,T=60]"] = partial(_fit_case, legacy=True)
+    for method in ("ssa", "leap"):
+        cases[f"ensemble_statistics[{method},N0=50,R=10^4,T=200]"] = (
+            lambda method=method: partial(ensemble_statistics, 50, 0.5, 5.0, np.linspace(0, 10, 200), 10**4,
+                                          method, seed=0))
+    for batch in (1, 100):
+        cases[f"mechanism_rosenbrock[k=1e-3..1e6,batch={batch}]"] = (
+            partial(_mechanism_case, STIFF_MECHANISM, batch, kd=10.0))
+    cases["mechanism_exact[batch=100,T=100]"] = partial(_mechanism_case, "A -> X : k1; X -> Z : k2", 100)
+    cases["legendre_table[l_max=10,N=200]"] = (
+        lambda: partial(legendre_table, 10, np.cos(np.linspace(0, np.pi, 200))))
+    cases["spherical_harmonics[l_max=10,200x200]"] = lambda: partial(spherical_harmonics, 10, 200, 200)
+    cases["orbital_mesh[l=3,m=-2,tol=2e-3]"] = lambda: partial(orbital_mesh, 3, -2)
+    cases["density_volume[n=3,l=2,m=0,64^3]"] = (
+        lambda: partial(density_volume, VOLUME_PATH, 3, 2, 0, size=64, workers=1))
+    if _has_scipy():
+        cases["legacy_brentq_nodes[n=3,l=0]"] = lambda: partial(legacy_brentq_nodes, 3, 0, 13)
+    cases["render_exponential_difference[dpi=300]"] = lambda: render_exponential_difference
+    for kind in ("kinetics", "potential"):
+        cases[f"explorer_update[{kind},20 moves]"] = partial(explorer_updates, kind)
+    for state in ("off", "on"):
+        cases[f"traced_call[{state},10^4 calls]"] = partial(traced_calls, state == "on")
+    if not quick:
+        cases["render_p_orbital[200x200]"] = lambda: render_p_orbital
+    return cases
+
+
+def select_cases(cases, pattern):
+    """
+    The ids matching a glob of * and ? wildcards.
+
+    Brackets are literal, so a full id such as 'conc_profiles[N=1000]'
+    selects that case rather than being read as a character class.
+    """
+    pattern = pattern.replace("[", "[[]")
+    return [case for case in cases if fnmatch.fnmatchcase(case, pattern)]
+
+
+def measure(func, repeat=5, min_time=0.2):
+    """Best wall time of func over repeats (looping fast calls) and its tracemalloc peak."""
+    func()  # warm-up: imports, caches
+    loops, elapsed = 1, 0.0
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / repeat or loops >= 10**6:
+            break
+        loops *= 10
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, (time.perf_counter() - start) / loops)
+
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak}
+
+
+# --- History ---
+
+def _git(*args):
+    try:
+        out = subprocess.run(["git", *args], cwd=REPO_DIR, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def load_history(path):
+    """Recorded runs from path, oldest first ([] if there is none yet)."""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def save_history(path, history):
+    """Writes history to path through a temporary file."""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(history, fh, indent=1)
+    os.replace(tmp, path)
+
+
+def find_run(history, ref):
+    """Latest run whose commit matches ref (a git revision, a commit prefix or '#index')."""
+    if ref.startswith("#"):
+        return history[int(ref[1:])]
+    commit = _git("rev-parse", ref) or ref
+    for run in reversed(history):
+        if run["commit"] and run["commit"].startswith(commit[:12]):
+            return run
+    raise SystemExit(f"no recorded benchmark run for {ref!r}")
+
+
+def compare(base, head, threshold):
+    """Print per-case ratios head/base; return the ids slower by more than threshold."""
+    slower = []
+    print(f"{'case':<52s} {'base':>11s} {'head':>11s} {'ratio':>7s}")
+    for case in sorted(set(base["results"]) & set(head["results"])):
+        b, h = base["results"][case]["seconds"], head["results"][case]["seconds"]
+        ratio = h / b if b else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            slower.append(case)
+            flag = "  SLOWER"
+        elif ratio < 1 / (1 + threshold):
+            flag = "  faster"
+        print(f"{case:<52s} {b * 1e3:9.3f}ms {h * 1e3:9.3f}ms {ratio:7.2f}{flag}")
+    return slower
+
+
+def main(argv=None):
+    """Runs (or lists, or compares) the benchmarks; returns the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0].strip())
+    parser.add_argument("-k", "--filter", default="*",
+                        help="glob over case ids, e.g. 'radial_*' (brackets are literal)")
+    parser.add_argument("--quick", action="store_true", help=f"grid sizes up to {QUICK_LIMIT} only")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--history", default=HISTORY)
+    parser.add_argument("--no-save", action="store_true", help="do not append this run to the history")
+    parser.add_argument("--list", action="store_true", help="list the case ids and exit")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "HEAD"),
+                        help="compare two recorded runs instead of measuring")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown that counts as a regression (default 0.2)")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        history = load_history(args.history)
+        slower = compare(find_run(history, args.compare[0]), find_run(history, args.compare[1]),
+                         args.threshold)
+        print(f"{len(slower)} case(s) slower by more than {args.threshold:.0%}")
+        return 1 if slower else 0
+
+    cases = build_cases(args.quick)
+    selected = select_cases(cases, args.filter)
+    if args.list:
+        print("\n".join(selected))
+        return 0
+
+    results = {}
+    for case in selected:
+        results[case] = measure(cases[case](), repeat=args.repeat)
+        res = results[case]
+        print(f"{case:<52s} {res['seconds'] * 1e3:10.3f} ms  peak {res['peak_bytes'] / 2**20:8.2f} MiB",
+              flush=True)
+
+    if not args.no_save:
+        history = load_history(args.history)
+        history.append({
+            "commit": _git("rev-parse", "HEAD"),
+            "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+            "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "results": results,
+        })
+        save_history(args.history, history)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,52 +1,67 @@
-def conc_profiles(t, A0, k1, k2):
-    A = A0 * np.exp(-k1 * t)
-    if abs(k1 - k2) < 1e-6:
-        X = k1 * t * np.exp(-k1 * t) * A0
-        Z = A0 * (1 - (1 + k1 * t) * np.exp(-k1 * t))
-    else:
-        X = (k1 * A0 / (k2 - k1)) * (np.exp(-k1 * t) - np.exp(-k2 * t))
-        Z = A0 * (1 - (k2 * np.exp(-k1 * t) - k1 * np.exp(-k2 * t)) / (k2 - k1))
-    return A, X, Z
-
-# User input with validation
-try:
-    A0 = float(input("Enter initial concentration of A (A0 > 0): "))
-    k1 = float(input("Enter rate constant k1 (> 0): "))
-    k2 = float(input("Enter rate constant k2 (> 0): "))
-
-    if A0 <= 0 or k1 <= 0 or k2 <= 0:
-        raise ValueError("All values must be positive.")
-
-except ValueError as e:
-    print(f"Invalid input: {e}")
-    exit()
-
-# Time array
-t = np.linspace(0, 40, 500)
-
-# Compute concentration profiles
-A, X, Z = conc_profiles(t, A0, k1, k2)
-
-# Plotting
-plt.figure(figsize=(10, 6))
-plt.plot(t, A, label='[A](t)', color='blue')
-plt.plot(t, X, label='[X](t)', color='orange')
-plt.plot(t, Z, label='[Z](t)', color='green')
-
-# Add horizontal line for A0
-plt.axhline(y=A0, color='gray', linestyle='--', linewidth=1, label='[A]₀')
-
-# Annotate each curve at suitable positions
-plt.text(t[-1], A[-1], ' [A](t)', color='blue', va='center')
-plt.text(t[np.argmax(X)], X.max(), ' [X](t)', color='orange', va='bottom')
-plt.text(t[-1], Z[-1], ' [Z](t)', color='green', va='center')
-
-# Labels and title
-plt.xlabel('Time')
-plt.ylabel('Concentration')
-plt.title(f'Concentration vs Time\n(k₁={k1}, k₂={k2}, [A]₀={A0})')
-plt.legend(loc='best')
-plt.grid(True)
-plt.tight_layout()
-plt.show()
+"""Concentration profiles of the consecutive reaction A -> X -> Z."""
+import argparse
 
+import matplotlib.pyplot as plt
+from teaching_support.consecutive_kinetics import conc_profiles, kinetic_features, kinetic_time_grid
+from teaching_support.explorers import explore_kinetics
+
+
+def main(argv=None):
+    """Prompt for A0, k1 and k2 and plot [A](t), [X](t) and [Z](t)."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--explore", action="store_true",
+                        help="open the slider explorer for A0, k1 and k2 instead of prompting")
+    args = parser.parse_args(argv)
+    if args.explore:
+        explore_kinetics()
+        return
+
+    # User input with validation
+    try:
+        A0 = float(input("Enter initial concentration of A (A0 > 0): "))
+        k1 = float(input("Enter rate constant k1 (> 0): "))
+        k2 = float(input("Enter rate constant k2 (> 0): "))
+
+        if A0 <= 0 or k1 <= 0 or k2 <= 0:
+            raise ValueError("All values must be positive.")
+
+    except ValueError as e:
+        print(f"Invalid input: {e}")
+        return
+
+    # Time array resolving both the 1/k1 and 1/k2 timescales
+    t = kinetic_time_grid(k1, k2, t_end=40, n_points=500)
+
+    # Compute concentration profiles and the analytic maximum of [X]
+    A, X, Z = conc_profiles(t, A0, k1, k2)
+    features = kinetic_features(A0, k1, k2)
+
+    # Plotting
+    plt.figure(figsize=(10, 6))
+    plt.plot(t, A, label='[A](t)', color='blue')
+    plt.plot(t, X, label='[X](t)', color='orange')
+    plt.plot(t, Z, label='[Z](t)', color='green')
+
+    # Add horizontal line for A0
+    plt.axhline(y=A0, color='gray', linestyle='--', linewidth=1, label='[A]₀')
+
+    # Annotate each curve at suitable positions
+    plt.text(t[-1], A[-1], ' [A](t)', color='blue', va='center')
+    if features['t_max'] <= t[-1]:
+        plt.text(features['t_max'], features['X_max'], ' [X](t)', color='orange', va='bottom')
+    else:  # the maximum lies beyond the plotted horizon
+        plt.text(t[-1], X[-1], ' [X](t)', color='orange', va='center')
+    plt.text(t[-1], Z[-1], ' [Z](t)', color='green', va='center')
+
+    # Labels and title
+    plt.xlabel('Time')
+    plt.ylabel('Concentration')
+    plt.title(f'Concentration vs Time\n(k₁={k1}, k₂={k2}, [A]₀={A0})')
+    plt.legend(loc='best')
+    plt.grid(True)
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
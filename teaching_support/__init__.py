@@ -0,0 +1,87 @@
+"""
+Numerical core and figure builders behind the teaching scripts.
+
+Importing the package is cheap: the names below are resolved from their
+submodules on first access, the numerical modules need only NumPy, and
+matplotlib, seaborn and scipy are imported inside the functions that use
+them.  Run ``python -m teaching_support --help`` for the command-line tools.
+"""
+import importlib
+
+_EXPORTS = {
+    "radial_wavefunction": "radial_engine",
+    "radial_probability_density": "radial_engine",
+    "radial_shell": "radial_engine",
+    "radial_table": "radial_engine",
+    "state_list": "radial_engine",
+    "state_index": "radial_engine",
+    "WavefunctionCache": "wavefunction_cache",
+    "cached_radial_wavefunction": "wavefunction_cache",
+    "radial_nodes": "radial_nodes",
+    "all_radial_nodes": "radial_nodes",
+    "laguerre_roots": "radial_nodes",
+    "adaptive_radial_grid": "adaptive_grid",
+    "radial_moments": "radial_moments",
+    "expectation_value": "radial_moments",
+    "hydrogenic_moment": "radial_moments",
+    "gauss_laguerre": "radial_moments",
+    "radial_matrix_elements": "matrix_elements",
+    "dipole_radial_table": "matrix_elements",
+    "conc_profiles": "consecutive_kinetics",
+    "kinetic_features": "consecutive_kinetics",
+    "kinetic_time_grid": "consecutive_kinetics",
+    "iter_conc_profiles": "consecutive_kinetics",
+    "profile_derivatives": "consecutive_kinetics",
+    "fit_consecutive": "kinetics_fit",
+    "ensemble_statistics": "stochastic_kinetics",
+    "iter_ensemble": "stochastic_kinetics",
+    "binomial_statistics": "stochastic_kinetics",
+    "Mechanism": "mechanism",
+    "parse_reactions": "mechanism",
+    "solve_radial": "radial_solver",
+    "radial_grid": "radial_solver",
+    "effective_potential": "potentials",
+    "effective_potential_extrema": "potentials",
+    "V_eff": "potentials",
+    "compute_potential_terms": "potentials",
+    "spherical_harmonics": "angular",
+    "spherical_harmonic": "angular",
+    "legendre_table": "angular",
+    "angular_mesh": "angular",
+    "harmonic_index": "angular",
+    "harmonic_list": "angular",
+    "orbital_mesh": "orbital_mesh",
+    "orbital_surface_grid": "orbital_mesh",
+    "reduce_orbital_surface": "orbital_mesh",
+    "save_mesh": "orbital_mesh",
+    "density_volume": "density_volume",
+    "wavefunction_values": "density_volume",
+    "isosurface_level": "density_volume",
+    "isosurface": "density_volume",
+    "TableWriter": "tables",
+    "write_table": "tables",
+    "read_table": "tables",
+    "export_csv": "tables",
+    "explore_kinetics": "explorers",
+    "explore_potential": "explorers",
+    "FigureCache": "figure_cache",
+    "render_batch": "batch_render",
+    "enable_tracing": "instrumentation",
+    "trace_span": "instrumentation",
+    "traced": "instrumentation",
+    "summarize_traces": "instrumentation",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
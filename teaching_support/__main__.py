@@ -0,0 +1,6 @@
+"""python -m teaching_support: see teaching_support.cli."""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Error-controlled radial grids for hydrogen-like wavefunctions.
+
+Instead of a dense uniform linspace, points are placed where the requested
+states need them: log-spaced near the origin, at every radial node and
+between neighbouring nodes (where the extrema sit), and then refined by
+bisection until linear interpolation between neighbouring points reproduces
+every R_{nl} to a relative tolerance.  The result is an ordinary sorted
+array, so it can be passed to any routine that takes a radial grid.
+"""
+import math
+import warnings
+
+import numpy as np
+
+from .radial_engine import radial_wavefunction
+from .radial_nodes import radial_nodes
+
+
+def tail_radius(n, Z=1, tol=1e-4):
+    """Radius beyond which the exponential tail of shell n is below ~tol."""
+    return n * (2 * n + math.log(1 / tol)) / Z
+
+
+def _seed_points(states, Z, r_max, n_log):
+    n_min = min(n for n, _ in states)
+    seeds = [np.zeros(1), np.geomspace(1e-3 * n_min / Z, r_max, n_log)]
+    for n, l in states:
+        nodes = radial_nodes(n, l, Z)
+        edges = np.concatenate(([0.0], nodes, [tail_radius(n, Z, 1e-2)]))
+        seeds.append(nodes)
+        seeds.append((edges[:-1] + edges[1:]) / 2)  # near the lobe extrema
+    r = np.unique(np.concatenate(seeds))
+    return np.append(r[r < r_max], r_max)
+
+
+def adaptive_radial_grid(states, Z=1, tol=1e-4, r_max=None, max_points=200000, n_log=32):  # pylint: disable=design
+    """
+    Builds a radial grid resolving every state to a given interpolation tolerance.
+
+    Parameters:
+        states (iterable): (n, l) pairs the grid must resolve.
+        Z (float): Nuclear charge.
+        tol (float): Largest allowed error of linear interpolation between
+                     grid points, relative to max |R_{nl}| of each state.
+        r_max (float, optional): Outer edge of the grid (units of a0).
+                                 Defaults to where the slowest tail has decayed to tol.
+        max_points (int): Hard limit on the number of grid points.
+        n_log (int): Number of log-spaced seed points between the origin and r_max.
+
+    Returns:
+        ndarray: Sorted radial grid starting at r = 0.
+    """
+    states = list(states)
+    if r_max is None:
+        r_max = max(tail_radius(n, Z, tol) for n, _ in states)
+
+    def evaluate(x):
+        return np.array([radial_wavefunction(x, n, l, Z) for n, l in states])
+
+    r = _seed_points(states, Z, r_max, n_log)
+    R = evaluate(r)
+    active = np.ones(r.size - 1, dtype=bool)
+    min_width = 1e-12 * r_max
+
+    while active.any():
+        idx = np.flatnonzero(active)
+        mid = (r[idx] + r[idx + 1]) / 2
+        R_mid = evaluate(mid)
+        scale = np.maximum(np.abs(R).max(axis=1), np.abs(R_mid).max(axis=1))[:, None]
+        err = (np.abs(R_mid - (R[:, idx] + R[:, idx + 1]) / 2) / scale).max(axis=0)
+        split = (err > tol) & (r[idx + 1] - r[idx] > min_width)
+
+        budget = max_points - r.size
+        exhausted = split.sum() > budget
+        if exhausted:
+            warnings.warn(f"adaptive_radial_grid: max_points={max_points} reached before tol={tol:g}")
+            keep = np.argsort(err)[::-1][:max(budget, 0)]
+            split = np.zeros_like(split)
+            split[keep] = True
+        if not split.any():
+            break
+
+        is_new = np.concatenate((np.zeros(r.size, dtype=bool), np.ones(split.sum(), dtype=bool)))
+        r = np.concatenate((r, mid[split]))
+        R = np.concatenate((R, R_mid[:, split]), axis=1)
+        order = np.argsort(r, kind='stable')
+        r, R, is_new = r[order], R[:, order], is_new[order]
+        # Only the two halves of each split interval need another look.
+        active = is_new[:-1] | is_new[1:]
+        if exhausted:
+            break
+    return r
@@ -0,0 +1,234 @@
+"""
+Spherical harmonics Y_lm(theta, phi) for every (l, m) up to l_max at once.
+
+The theta dependence comes from the fully normalised associated Legendre
+functions
+
+    P~_lm(x) = sqrt((2l + 1)/(4 pi) (l - m)!/(l + m)!) P_lm(x),    x = cos(theta)
+
+built column by column in m with the standard stable recurrences
+
+    P~_00     = 1 / sqrt(4 pi)
+    P~_mm     = sqrt((2m + 1)/(2m)) sin(theta) P~_{m-1,m-1}
+    P~_{m+1,m} = sqrt(2m + 3) x P~_mm
+    P~_lm     = a_lm (x P~_{l-1,m} - b_lm P~_{l-2,m})
+
+which never form the factorials, so l_max in the hundreds stays finite.
+
+On the plotting meshes (theta from 0 to pi, phi from 0 to 2 pi) the trig
+tables and the Legendre table are cached per resolution, the Legendre
+functions are evaluated on the upper hemisphere only and mirrored with the
+parity P~_lm(-x) = (-1)^(l+m) P~_lm(x), and m = 0 rows are built once along
+theta and copied across phi.
+
+Two conventions are provided:
+    'real'    : Y_l0 = P~_l0, Y_lm = sqrt(2) P~_lm cos(m phi) and
+                Y_l,-m = sqrt(2) P~_lm sin(m phi) for m > 0 (no Condon-Shortley
+                phase, so Y_11 is p_x and Y_1,-1 is p_y with positive lobes
+                along +x and +y);
+    'complex' : Y_lm = (-1)^m P~_lm e^{i m phi}, Y_l,-m = (-1)^m conj(Y_lm),
+                the convention of scipy.special.sph_harm_y.
+
+Rows are ordered (0, 0), (1, -1), (1, 0), (1, 1), (2, -2), ...; see
+harmonic_index.
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from .instrumentation import traced
+
+AngularMesh = namedtuple("AngularMesh", "theta phi cos_theta sin_theta")
+
+KINDS = ("real", "complex")
+
+
+def harmonic_list(l_max):
+    """Returns the (l, m) pairs in row order, m running from -l to l."""
+    return [(l, m) for l in range(l_max + 1) for m in range(-l, l + 1)]
+
+
+def harmonic_index(l, m):
+    """Row of (l, m) in the arrays returned by spherical_harmonics."""
+    return l * (l + 1) + m
+
+
+def legendre_index(l, m):
+    """Row of (l, m >= 0) in the arrays returned by legendre_table."""
+    return l * (l + 1) // 2 + m
+
+
+def _check_lm(l, m):
+    if l < 0 or abs(m) > l:
+        raise ValueError(f"Need l >= 0 and |m| <= l, got l={l}, m={m}.")
+
+
+def _check_kind(kind):
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of {KINDS}, got {kind!r}.")
+
+
+def _readonly(a):
+    a.setflags(write=False)
+    return a
+
+
+def _legendre_column(l_max, m, x, p_mm, out):
+    """Fills out[l - m] = P~_lm(x) for l = m..l_max, given the seed P~_mm."""
+    out[0] = p_mm
+    if l_max > m:
+        out[1] = np.sqrt(2 * m + 3) * x * p_mm
+    for l in range(m + 2, l_max + 1):
+        a = np.sqrt((4 * l * l - 1) / (l * l - m * m))
+        b = np.sqrt(((l - 1)**2 - m * m) / (4 * (l - 1)**2 - 1))
+        out[l - m] = a * (x * out[l - m - 1] - b * out[l - m - 2])
+    return out
+
+
+def legendre_table(l_max, x):
+    """
+    Fully normalised associated Legendre functions P~_lm(x) for 0 <= m <= l <= l_max.
+
+    Parameters:
+        l_max (int): Largest degree l.
+        x (array_like): Points in [-1, 1] (cos(theta)), any shape.
+
+    Returns:
+        ndarray: Shape ((l_max+1)(l_max+2)/2,) + x.shape; row legendre_index(l, m).
+    """
+    if l_max < 0:
+        raise ValueError(f"l_max must be non-negative, got {l_max}.")
+    x = np.asarray(x, dtype=float)
+    s = np.sqrt(np.clip(1.0 - x * x, 0.0, None))
+    table = np.empty(((l_max + 1) * (l_max + 2) // 2,) + x.shape)
+
+    p_mm = np.full(x.shape, 1.0 / np.sqrt(4 * np.pi))
+    for m in range(l_max + 1):
+        if m:
+            p_mm = np.sqrt((2 * m + 1) / (2 * m)) * s * p_mm
+        # Rows of fixed m are not contiguous in the (l, m) order; fill a
+        # column buffer and scatter it.
+        column = _legendre_column(l_max, m, x, p_mm, np.empty((l_max - m + 1,) + x.shape))
+        table[[legendre_index(l, m) for l in range(m, l_max + 1)]] = column
+    return table
+
+
+@lru_cache(maxsize=16)
+def _theta_table(n_theta):
+    """theta over [0, pi] with cos and sin exactly mirror-symmetric about pi/2."""
+    theta = np.linspace(0, np.pi, n_theta)
+    cos_theta = np.cos(theta)
+    half = n_theta // 2
+    cos_theta[n_theta - half:] = -cos_theta[:half][::-1]
+    if n_theta % 2:
+        cos_theta[half] = 0.0
+    sin_theta = np.sqrt(1.0 - cos_theta**2)
+    return _readonly(theta), _readonly(cos_theta), _readonly(sin_theta)
+
+
+@lru_cache(maxsize=16)
+def _phi_table(n_phi, m_max):
+    """cos(m phi) and sin(m phi) for m = 0..m_max, phi over [0, 2 pi]."""
+    m_phi = np.outer(np.arange(m_max + 1), np.linspace(0, 2 * np.pi, n_phi))
+    return _readonly(np.cos(m_phi)), _readonly(np.sin(m_phi))
+
+
+def angular_mesh(n_theta=200, n_phi=200):
+    """
+    The cached (theta, phi) plotting mesh with its trig tables (read-only).
+
+    theta runs over [0, pi] and phi over [0, 2 pi], both endpoints included;
+    the harmonics are laid out like np.meshgrid(theta, phi), shape (n_phi, n_theta).
+    """
+    theta, cos_theta, sin_theta = _theta_table(n_theta)
+    return AngularMesh(theta, _readonly(np.linspace(0, 2 * np.pi, n_phi)), cos_theta, sin_theta)
+
+
+@lru_cache(maxsize=16)
+def _legendre_mesh(l_max, n_theta):
+    """legendre_table on the cached theta mesh, computed on one hemisphere."""
+    x = _theta_table(n_theta)[1]
+    n_upper = (n_theta + 1) // 2
+    upper = legendre_table(l_max, x[:n_upper])
+    table = np.empty((len(upper), n_theta))
+    table[:, :n_upper] = upper
+    for l in range(l_max + 1):
+        for m in range(l + 1):
+            row = legendre_index(l, m)
+            sign = -1.0 if (l + m) % 2 else 1.0
+            table[row, n_upper:] = sign * upper[row, :n_theta - n_upper][::-1]
+    return _readonly(table)
+
+
+@traced()
+def spherical_harmonics(l_max, n_theta=200, n_phi=200, kind="real"):
+    """
+    Evaluates every Y_lm with l <= l_max on the cached plotting mesh.
+
+    Parameters:
+        l_max (int): Largest degree l.
+        n_theta (int): Points in theta over [0, pi].
+        n_phi (int): Points in phi over [0, 2 pi].
+        kind (str): 'real' or 'complex' (see the module docstring).
+
+    Returns:
+        ndarray: Shape ((l_max+1)^2, n_phi, n_theta); row harmonic_index(l, m).
+                 angular_mesh(n_theta, n_phi) gives the matching angles.
+    """
+    _check_kind(kind)
+    P = _legendre_mesh(l_max, n_theta)
+    cos_mphi, sin_mphi = _phi_table(n_phi, l_max)
+    Y = np.empty(((l_max + 1)**2, n_phi, n_theta), dtype=float if kind == "real" else complex)
+
+    for l in range(l_max + 1):
+        Y[harmonic_index(l, 0)] = P[legendre_index(l, 0)]  # phi-independent
+        for m in range(1, l + 1):
+            p = P[legendre_index(l, m)]
+            if kind == "real":
+                p = np.sqrt(2.0) * p
+                np.multiply.outer(cos_mphi[m], p, out=Y[harmonic_index(l, m)])
+                np.multiply.outer(sin_mphi[m], p, out=Y[harmonic_index(l, -m)])
+            else:
+                sign = -1.0 if m % 2 else 1.0
+                plus = Y[harmonic_index(l, m)]
+                plus.real = np.multiply.outer(cos_mphi[m], sign * p)
+                plus.imag = np.multiply.outer(sin_mphi[m], sign * p)
+                Y[harmonic_index(l, -m)] = sign * np.conj(plus)
+    return Y
+
+
+def spherical_harmonic(l, m, theta, phi, kind="real"):
+    """
+    Evaluates a single Y_lm at arbitrary angles.
+
+    Parameters:
+        l (int): Degree.
+        m (int): Order, -l <= m <= l.
+        theta (array_like): Polar angle(s).
+        phi (array_like): Azimuthal angle(s), broadcast against theta.
+        kind (str): 'real' or 'complex'.
+
+    Returns:
+        ndarray: Y_lm with the broadcast shape of theta and phi.
+    """
+    _check_lm(l, m)
+    _check_kind(kind)
+    theta, phi = np.broadcast_arrays(np.asarray(theta, dtype=float), np.asarray(phi, dtype=float))
+    x = np.cos(theta)
+    s = np.sin(theta)
+    k = abs(m)
+
+    p_mm = np.full(x.shape, 1.0 / np.sqrt(4 * np.pi))
+    for j in range(1, k + 1):
+        p_mm = np.sqrt((2 * j + 1) / (2 * j)) * s * p_mm
+    p = _legendre_column(l, k, x, p_mm, np.empty((l - k + 1,) + x.shape))[-1]
+
+    if kind == "real":
+        if m == 0:
+            return p
+        return np.sqrt(2.0) * p * (np.cos(k * phi) if m > 0 else np.sin(k * phi))
+    Y = p * np.exp(1j * k * phi)
+    if m > 0:
+        return -Y if k % 2 else Y
+    return np.conj(Y)
@@ -0,0 +1,263 @@
+"""
+Headless batch rendering of the teaching figures.
+
+A job list describes what to draw; every job runs in a worker process on the
+non-interactive Agg backend, and each figure it leaves open is written in the
+requested formats.  A manifest.json with the outputs, timings and any errors
+is written next to the figures.
+
+Job entries (JSON objects) take one of two forms:
+
+    {"name": "pz", "function": "teaching_support.plotting:plot_p_orbital", "params": {"axis": "z"}}
+    {"name": "conc", "script": "concentration_vs_time_plots.py", "inputs": ["1", "0.5", "5"]}
+
+"function" imports module:callable and calls it with params; "script" runs a
+file from the repository root as __main__, answering any input() prompts
+from "inputs" and passing "args" as its command line.  A script runs in a
+private working directory; files it saves there itself are moved into the
+output directory and listed with its figures.  Optional keys are "formats"
+and "dpi", which override the command-line defaults.
+
+Rendered files go through figure_cache: a job whose parameters, code and
+style are unchanged is served from the cache directory instead of drawn.
+Scripts set their own style, which their source already covers, so their
+key has no style term.
+
+With tracing on (python -m teaching_support --trace DIR render ...), every
+worker records a span per job with its build and savefig phases and the
+kernels they call, and writes its own trace into DIR (see instrumentation).
+
+Usage:
+    python -m teaching_support render [jobs.json] -o figures -j 4 --formats png pdf [--no-cache]
+"""
+import argparse
+import builtins
+import importlib
+import json
+import os
+import runpy
+import shutil
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from .figure_cache import FigureCache, figure_key
+from .instrumentation import trace_span
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Every figure in the repository, used when no job file is given.
+DEFAULT_JOBS = (
+    [{"name": f"intermediate_k1_{k1:g}_k2_{k2:g}",
+      "function": "teaching_support.plotting:plot_exponential_difference",
+      "params": {"k1": k1, "k2": k2}}
+     for k1, k2 in [(10e-3, 100), (10e-2, 1000), (10e-1, 10000), (10, 100000), (100, 1000000)]]
+    + [{"name": f"p_orbital_{axis}", "function": "teaching_support.plotting:plot_p_orbital", "params": {"axis": axis}}
+       for axis in "xyz"]
+    + [{"name": "radial_data_n3", "function": "teaching_support.plotting:plot_radial_data",
+        "params": {"n": 3, "r_max": 20}},
+       {"name": "effective_potential_components", "script": "hydrogenic_potential_visualizer.py"},
+       {"name": "hydrogen_radial_wavefunctions", "script": "hydrogen_radial_wavefunctions.py"},
+       {"name": "effective_potential_vs_l",
+        "script": "hydrogenic_effective_potential_vs_angular_momentum_quantum_number.py"},
+       {"name": "radial_wavefunctions_all_l", "script": "test2.py"},
+       {"name": "radial_wavefunctions_nodes", "script": "test3.py"},
+       {"name": "concentration_vs_time", "script": "concentration_vs_time_plots.py",
+        "inputs": ["1.0", "0.5", "5.0"]}]
+)
+
+
+def _no_show(*_args, **_kwargs):
+    """Stands in for plt.show: scripts call it, and there is nothing to display here."""
+
+
+def _init_worker():
+    import matplotlib  # pylint: disable=import-outside-toplevel
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+    plt.show = _no_show
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+
+
+def _run_job(job, out_dir):
+    """
+    Draw one job's figures, which stay open.
+
+    Returns:
+        list: Paths of the files a script saved itself, moved into out_dir
+              (empty for function jobs).
+    """
+    if "function" in job:
+        module_name, func_name = job["function"].split(":")
+        func = getattr(importlib.import_module(module_name), func_name)
+        func(**job.get("params", {}))
+        return []
+
+    answers = iter(job.get("inputs", []))
+    real_input, real_argv, cwd = builtins.input, sys.argv, os.getcwd()
+
+    def scripted_input(_prompt=""):
+        return next(answers)
+
+    builtins.input = scripted_input
+    script = os.path.join(REPO_DIR, job["script"])
+    sys.argv = [script] + list(job.get("args", []))  # scripts parse their own options, not ours
+    # Other workers write into out_dir at the same time, so the files this
+    # script saves are told apart in a directory of its own.
+    work_dir = tempfile.mkdtemp(prefix=".job-", dir=out_dir)
+    os.chdir(work_dir)
+    try:
+        runpy.run_path(script, run_name="__main__")
+        saved = []
+        for name in sorted(os.listdir(work_dir)):
+            src = os.path.join(work_dir, name)
+            if os.path.isfile(src) and not name.startswith("."):  # hidden files stay in work_dir
+                saved.append(os.path.join(out_dir, name))
+                os.replace(src, saved[-1])
+        return saved
+    finally:
+        builtins.input = real_input
+        sys.argv = real_argv
+        os.chdir(cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _job_source(job):
+    if "function" in job:
+        return os.path.join(REPO_DIR, job["function"].split(":")[0].replace(".", os.sep) + ".py")
+    return os.path.join(REPO_DIR, job["script"])
+
+
+def render_job(job, out_dir, formats=("png",), dpi=None, cache_dir=None):  # pylint: disable=too-many-locals
+    """
+    Runs one job and saves every figure it produced.
+
+    If cache_dir is given, an identical earlier render is copied from there
+    instead, and fresh renders are added to it.
+
+    Returns:
+        dict: Manifest entry with the job, output paths, wall time, status
+              and whether it was served from the cache.
+    """
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
+    formats = job.get("formats", formats)
+    dpi = job.get("dpi", dpi)
+    name = job.get("name") or job.get("function", job.get("script", "job")).replace(":", "_")
+    entry = {"name": name, "job": job, "outputs": [], "status": "ok", "cached": False}
+    start = time.perf_counter()
+    # Styles set by one job (plt.style.use) must not leak into the next job in this worker.
+    with trace_span("render_job", job=name), plt.rc_context():
+        try:
+            if cache_dir is not None:
+                cache = FigureCache(cache_dir)
+                source = _job_source(job)
+                key = figure_key({"job": job, "name": name, "formats": list(formats), "dpi": dpi},
+                                 [source] if os.path.exists(source) else (),
+                                 style=None if "function" in job else "")
+                restored = cache.restore(key, out_dir)
+                if restored is not None:
+                    entry["outputs"], entry["cached"] = restored, True
+                    entry["seconds"] = time.perf_counter() - start
+                    return entry
+            with trace_span("build", job=name):
+                entry["outputs"] = _run_job(job, out_dir)
+            numbers = plt.get_fignums()
+            for i, num in enumerate(numbers):
+                stem = name if len(numbers) == 1 else f"{name}_{i + 1}"
+                fig = plt.figure(num)
+                for fmt in formats:
+                    path = os.path.join(out_dir, f"{stem}.{fmt}")
+                    with trace_span("savefig", file=os.path.basename(path)):
+                        fig.savefig(path, dpi=dpi)
+                    entry["outputs"].append(path)
+            if cache_dir is not None:
+                cache.store(key, entry["outputs"])
+        # One broken job must not take down the batch: whatever a script
+        # raises is recorded in its entry and the other jobs go on.
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            entry["status"] = "error"
+            entry["error"] = f"{type(err).__name__}: {err}"
+            entry["traceback"] = traceback.format_exc()
+        finally:
+            plt.close("all")
+    entry["seconds"] = time.perf_counter() - start
+    return entry
+
+
+def render_batch(jobs, out_dir="figures", workers=None, formats=("png",), dpi=None,  # pylint: disable=design
+                 cache_dir=".figure_cache"):
+    """
+    Renders a list of jobs in parallel and writes out_dir/manifest.json.
+
+    Parameters:
+        jobs (list of dict): Job descriptions (see module docstring).
+        out_dir (str): Directory for the figures and the manifest.
+        workers (int, optional): Number of worker processes (default: CPU count).
+        formats (sequence of str): Output formats, e.g. ("png", "svg", "pdf").
+        dpi (float, optional): Resolution for raster formats.
+        cache_dir (str, optional): Figure cache directory; None renders everything.
+
+    Returns:
+        dict: The manifest.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    out_dir = os.path.abspath(out_dir)
+    if cache_dir is not None:
+        cache_dir = os.path.abspath(cache_dir)
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [pool.submit(render_job, job, out_dir, tuple(formats), dpi, cache_dir) for job in jobs]
+        entries = [f.result() for f in futures]
+    hits = sum(e["cached"] for e in entries)
+    manifest = {
+        "out_dir": out_dir,
+        "workers": workers or os.cpu_count(),
+        "seconds": time.perf_counter() - start,
+        "failed": sum(e["status"] != "ok" for e in entries),
+        "cache": {"dir": cache_dir, "hits": hits,
+                  "misses": len(entries) - hits if cache_dir is not None else 0},
+        "jobs": entries,
+    }
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=2)
+    return manifest
+
+
+def main(argv=None):
+    """Command line of python -m teaching_support render; returns the exit status."""
+    parser = argparse.ArgumentParser(prog="python -m teaching_support render",
+                                     description="Render teaching figures headlessly in parallel.")
+    parser.add_argument("jobs", nargs="?", help="JSON file with a list of jobs (default: every repository figure)")
+    parser.add_argument("-o", "--out-dir", default="figures")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("--formats", nargs="+", default=["png"], choices=["png", "svg", "pdf"])
+    parser.add_argument("--dpi", type=float, default=None)
+    parser.add_argument("--cache-dir", default=os.environ.get("FIGURE_CACHE_DIR", ".figure_cache"))
+    parser.add_argument("--no-cache", action="store_true", help="render every job even if cached")
+    args = parser.parse_args(argv)
+
+    if args.jobs:
+        with open(args.jobs, encoding="utf-8") as fh:
+            jobs = json.load(fh)
+    else:
+        jobs = DEFAULT_JOBS
+    cache_dir = None if args.no_cache else args.cache_dir
+    manifest = render_batch(jobs, args.out_dir, args.workers, args.formats, args.dpi, cache_dir)
+    for entry in manifest["jobs"]:
+        status = entry["status"] if entry["status"] == "ok" else entry["error"]
+        if entry["cached"]:
+            status += " (cached)"
+        print(f"{entry['name']:<40s} {entry['seconds']:7.2f} s  {len(entry['outputs'])} files  {status}")
+    print(f"{len(manifest['jobs'])} jobs in {manifest['seconds']:.2f} s, {manifest['failed']} failed")
+    if cache_dir is not None:
+        print(f"figure cache: {manifest['cache']['hits']} hits, {manifest['cache']['misses']} misses")
+    return 1 if manifest["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,442 @@
+"""
+Command-line entry point: python -m teaching_support <command> [options].
+
+Only argparse is imported up front; each command imports what it needs when
+it runs, so starting the CLI (or a worker that imports the package) does not
+pay for NumPy, matplotlib or scipy it never uses.
+"""
+# pylint: disable=import-outside-toplevel
+import argparse
+import ast
+import os
+import sys
+
+
+def _cmd_radial(args):
+    import numpy as np
+    from .radial_engine import radial_table, state_list
+
+    r = np.linspace(0, args.r_max, args.points)
+    table = radial_table(args.n_max, r, args.Z)
+    if args.output and args.output.endswith(".npy"):
+        np.save(args.output, table)
+        print(f"saved {table.shape} table to {args.output}")
+    elif args.output:
+        from .tables import linspace_spec, write_table
+
+        columns = {"r": r, **{f"R_{n}_{l}": row for (n, l), row in zip(state_list(args.n_max), table)}}
+        units = {name: "a0^-3/2" for name in columns}
+        units["r"] = "a0"
+        write_table(args.output, columns, units,
+                    metadata={"quantity": "radial wavefunction R_nl(r)", "Z": args.Z,
+                              "states": state_list(args.n_max), "grid": linspace_spec(0, args.r_max, args.points)})
+        print(f"saved {len(columns) - 1} states x {len(r)} points to table {args.output}")
+    else:
+        for (n, l), row in zip(state_list(args.n_max), table):
+            print(f"n={n:<3d} l={l:<3d} max|R|={np.abs(row).max():.6g}")
+
+
+def _cmd_moments(args):
+    from .radial_engine import state_list
+    from .radial_moments import hydrogenic_moment, radial_moments
+
+    moments = radial_moments(args.n_max, args.k, args.Z)
+    print(f"{'n':>3s} {'l':>3s} " + " ".join(f"{f'<r^{k:g}>':>14s}" for k in args.k)
+          + ("  max rel. dev." if args.check else ""))
+    for (n, l), row in zip(state_list(args.n_max), moments):
+        line = f"{n:3d} {l:3d} " + " ".join(f"{v:14.8g}" for v in row)
+        if args.check:
+            exact = [hydrogenic_moment(n, l, k, args.Z) for k in args.k]
+            dev = max((abs(v / e - 1) for v, e in zip(row, exact) if 0 < abs(e) < float("inf")), default=0.0)
+            line += f"  {dev:.2e}"
+        print(line)
+
+
+def _cmd_dipoles(args):
+    import numpy as np
+    from .matrix_elements import dipole_radial_table
+    from .radial_engine import state_list
+
+    table = dipole_radial_table(args.n_max, args.Z)
+    if args.output:
+        np.save(args.output, table)
+        print(f"saved {table.shape} table to {args.output}")
+        return
+    states = state_list(args.n_max)
+    letters = "spdfghiklmnoqrtuv"
+    for a, (n, l) in enumerate(states):
+        for b, (n2, l2) in enumerate(states):
+            if b > a and table[a, b] != 0:
+                print(f"{n}{letters[l]:<2s}-> {n2}{letters[l2]:<2s} <r> = {table[a, b]: .10g}")
+
+
+def _cmd_bound(args):
+    from . import radial_solver
+
+    if args.potential == "coulomb":
+        potential = radial_solver.coulomb(args.Z)
+    elif args.potential == "screened":
+        potential = radial_solver.screened_coulomb(args.Z, args.length)
+    else:
+        potential = radial_solver.truncated_coulomb(args.Z, args.length)
+    sol = radial_solver.solve_radial(potential, args.l, args.states, r_max=args.r_max,
+                                     n_points=args.points, workers=args.workers)
+    for l, energies in zip(sol.l, sol.energies):
+        levels = " ".join(f"{E:.10g}" if E < 0 else f"({E:.3g})" for E in energies)
+        print(f"l={l:<3d} E/Eh = {levels}")
+
+
+def _cmd_nodes(args):
+    from .radial_nodes import radial_nodes
+
+    print(" ".join(f"{x:.10g}" for x in radial_nodes(args.n, args.l, args.Z)))
+
+
+def _cmd_kinetics(args):
+    from .consecutive_kinetics import kinetic_features
+
+    for key, value in kinetic_features(args.A0, args.k1, args.k2).items():
+        print(f"{key:<15s} {float(value):.10g}")
+    if args.table:
+        from .consecutive_kinetics import iter_conc_profiles
+        from .tables import TableWriter
+
+        metadata = {"mechanism": "A -> X -> Z", "A0": args.A0, "k1": args.k1, "k2": args.k2,
+                    "grid": {"kind": "kinetic_time_grid", "num": args.points}}
+        with TableWriter(args.table, ["t", "A", "X", "Z"], units={"t": "s"}, metadata=metadata) as writer:
+            for chunk in iter_conc_profiles(args.A0, args.k1, args.k2, n_points=args.points):
+                writer.append(*chunk)
+        print(f"saved {args.points} time points to table {args.table}")
+
+
+def _cmd_fit(args):
+    from .kinetics_fit import fit_consecutive
+    from .tables import read_table
+
+    table = read_table(args.path)
+    data = {s: table[s] for s in ("A", "X", "Z") if s in table.columns}
+    if not data:
+        raise SystemExit(f"{args.path} has none of the columns A, X, Z")
+    fit = fit_consecutive(table["t"], **data, A0=args.A0, fit_A0=args.fit_A0, sigma=args.sigma)
+    print(f"fitted {', '.join(data)} at {len(table)} times"
+          f"{'' if fit.converged else ' (not converged)'}")
+    print(f"k1 = {float(fit.k1):.8g} +- {float(fit.k1_err):.2g}")
+    print(f"k2 = {float(fit.k2):.8g} +- {float(fit.k2_err):.2g}")
+    if args.fit_A0:
+        print(f"A0 = {float(fit.A0):.8g} +- {float(fit.A0_err):.2g}")
+    print(f"chi2 / dof = {float(fit.chi2):.6g} / {int(fit.dof)}")
+
+
+def _cmd_stochastic(args):  # pylint: disable=too-many-locals
+    import numpy as np
+    from .consecutive_kinetics import kinetic_time_grid
+    from .stochastic_kinetics import SPECIES, binomial_statistics, iter_ensemble
+
+    t = kinetic_time_grid(args.k1, args.k2, args.t_end, args.points)
+    stats = None
+    for stats in iter_ensemble(args.N0, args.k1, args.k2, t, args.replicates, args.method, args.seed,
+                               args.chunk_size, args.workers):
+        print(f"\r{stats.replicates}/{args.replicates} replicates", end="", file=sys.stderr)
+    print(file=sys.stderr)
+    mean, variance = binomial_statistics(args.N0, args.k1, args.k2, t)
+    if args.table:
+        from .tables import write_table
+
+        columns = {"t": t}
+        for s, name in enumerate(SPECIES):
+            columns[f"mean_{name}"], columns[f"var_{name}"] = stats.mean[s], stats.variance[s]
+        metadata = {"mechanism": "A -> X -> Z", "N0": args.N0, "k1": args.k1, "k2": args.k2,
+                    "method": args.method, "replicates": stats.replicates, "seed": args.seed,
+                    "grid": {"kind": "kinetic_time_grid", "num": args.points}}
+        write_table(args.table, columns, {"t": "s"}, metadata)
+        print(f"saved mean and variance at {t.size} times to table {args.table}")
+    print(f"{'t':>12s} {'<X>':>10s} {'N0 p_X':>10s} {'var X':>10s} {'N0 p(1-p)':>10s}")
+    for i in np.unique(np.linspace(0, t.size - 1, min(t.size, 11)).astype(int)):
+        print(f"{t[i]:12.6g} {stats.mean[1, i]:10.4g} {mean[1, i]:10.4g} "
+              f"{stats.variance[1, i]:10.4g} {variance[1, i]:10.4g}")
+
+
+def _parse_assignments(items, what):
+    values = {}
+    for item in items:
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise SystemExit(f"{what} must be given as name=value, got {item!r}")
+        values[key] = float(value)
+    return values
+
+
+def _cmd_mechanism(args):
+    import numpy as np
+    from .mechanism import Mechanism
+
+    mech = Mechanism(args.reactions)
+    k = _parse_assignments(args.rates, "rate constants")
+    c0 = _parse_assignments(args.init, "initial concentrations")
+    t = np.linspace(0, args.t_end, args.points)
+    sol = mech.integrate(t, c0, k, method=args.method, rtol=args.rtol)
+    print(f"species {' '.join(mech.species)}; rates {' '.join(mech.rate_names)}; "
+          f"{'first order (exact)' if mech.first_order else 'nonlinear'}")
+    if args.table:
+        from .tables import write_table
+
+        metadata = {"mechanism": args.reactions, "rate_constants": k, "initial": c0,
+                    "grid": {"kind": "linspace", "start": 0.0, "stop": args.t_end, "num": args.points}}
+        write_table(args.table, {"t": t, **{s: sol[s] for s in mech.species}}, {"t": "s"}, metadata)
+        print(f"saved {args.points} time points to table {args.table}")
+    else:
+        print(f"{'t':>12s} " + " ".join(f"{s:>12s}" for s in mech.species))
+        for i in np.unique(np.linspace(0, t.size - 1, min(t.size, 11)).astype(int)):
+            print(f"{t[i]:12.6g} " + " ".join(f"{v:12.6g}" for v in sol.c[i]))
+
+
+def _cmd_table(args):
+    from .tables import export_csv, read_table
+
+    table = read_table(args.path)
+    print(f"{table.path}: {len(table)} rows")
+    for name in table.columns:
+        unit = f" ({table.units[name]})" if table.units[name] else ""
+        print(f"  {name}{unit}  {table[name].dtype}")
+    for key, value in table.metadata.items():
+        print(f"  {key} = {value}")
+    if args.csv:
+        export_csv(table, args.csv)
+        print(f"exported CSV to {args.csv}")
+
+
+def _cmd_mesh(args):
+    from .orbital_mesh import orbital_mesh, save_mesh
+
+    mesh = orbital_mesh(args.l, args.m, args.tol, args.max_triangles, args.kind)
+    save_mesh(mesh, args.output)
+    print(f"saved {len(mesh.vertices)} vertices, {len(mesh.faces)} triangles to {args.output}")
+
+
+def _cmd_volume(args):
+    import numpy as np
+    from .density_volume import density_volume, isosurface
+    from .orbital_mesh import save_mesh
+
+    volume = density_volume(args.output, args.n, args.l, args.m, args.size, args.extent, args.Z,
+                            dtype=np.float64 if args.float64 else np.float32, workers=args.workers)
+    print(f"saved {volume.data.shape} {volume.data.dtype} volume over "
+          f"[{volume.axis[0]:g}, {volume.axis[-1]:g}] a0 to {args.output}")
+    if args.isosurface:
+        mesh = isosurface(volume, fraction=args.fraction, n=args.n, l=args.l, m=args.m, Z=args.Z)
+        save_mesh(mesh, args.isosurface)
+        print(f"saved {args.fraction:g} isosurface ({len(mesh.faces)} triangles) to {args.isosurface}")
+
+
+def _cmd_plot(args):
+    from . import plotting
+
+    params = {}
+    for item in args.params:
+        key, _, value = item.partition("=")
+        try:
+            params[key] = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            params[key] = value
+    getattr(plotting, f"plot_{args.name}")(**params)
+
+
+def _cmd_explore(args):
+    from . import explorers
+
+    if args.name == "kinetics":
+        explorers.explore_kinetics(args.A0, args.k1, args.k2, args.t_end)
+    else:
+        explorers.explore_potential(args.l, args.Z)
+
+
+def _cmd_trace(args):
+    from .instrumentation import summarize_traces
+
+    merged = summarize_traces(args.directory, args.folded)
+    if not merged["processes"]:
+        raise SystemExit(f"no trace files in {args.directory}")
+    print(f"{merged['processes']} traced processes")
+    print(f"{'span':<44s} {'calls':>7s} {'wall/s':>10s} {'self/s':>10s} {'peak RSS/MB':>12s} {'alloc/MB':>9s}")
+    spans = sorted(merged["spans"].items(), key=lambda item: -item[1]["self_s"])
+    for name, entry in spans[:args.top]:
+        alloc = "" if entry["alloc_peak_mb"] is None else f"{entry['alloc_peak_mb']:.1f}"
+        print(f"{name:<44s} {entry['count']:7d} {entry['wall_s']:10.4f} {entry['self_s']:10.4f} "
+              f"{entry['rss_peak_mb']:12.1f} {alloc:>9s}")
+    if args.folded:
+        print(f"saved merged stacks to {args.folded}")
+
+
+def _tracing_parser():
+    """Options that come before the command, shared with render (which has its own parser)."""
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("--trace", metavar="DIR",
+                        help="write per-process timing traces (.json) and flame-graph stacks (.folded) to DIR")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="also record tracemalloc peaks per span (slower)")
+    return parser
+
+
+def build_parser():  # pylint: disable=too-many-statements
+    """The argparse parser with one sub-command per task."""
+    parser = argparse.ArgumentParser(prog="python -m teaching_support", parents=[_tracing_parser()],
+                                     description="Teaching support numerics and figures.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("radial", help="tabulate R_nl(r) for every state up to n_max")
+    p.add_argument("--n-max", type=int, default=3)
+    p.add_argument("--r-max", type=float, default=40.0)
+    p.add_argument("--points", type=int, default=1000)
+    p.add_argument("--Z", type=float, default=1.0)
+    p.add_argument("-o", "--output", help="save the (state x r) table as .npy, or any other path as a binary table")
+    p.set_defaults(func=_cmd_radial)
+
+    p = sub.add_parser("moments", help="<r^k> of every state up to n_max by Gauss-Laguerre quadrature")
+    p.add_argument("--n-max", type=int, default=3)
+    p.add_argument("-k", type=int, nargs="+", default=[0, 1, 2, -1], help="powers of r")
+    p.add_argument("--Z", type=float, default=1.0)
+    p.add_argument("--check", action="store_true", help="compare with the closed-form hydrogenic moments")
+    p.set_defaults(func=_cmd_moments)
+
+    p = sub.add_parser("dipoles", help="radial dipole matrix elements <nl|r|n'l'> for l' = l +- 1")
+    p.add_argument("--n-max", type=int, default=3)
+    p.add_argument("--Z", type=float, default=1.0)
+    p.add_argument("-o", "--output", help="save the full (state x state) table as .npy")
+    p.set_defaults(func=_cmd_dipoles)
+
+    p = sub.add_parser("bound", help="bound-state energies of a central potential (tridiagonal solver)")
+    p.add_argument("--potential", choices=["coulomb", "screened", "truncated"], default="coulomb")
+    p.add_argument("--Z", type=float, default=1.0)
+    p.add_argument("--length", type=float, default=1.0,
+                   help="screening length (screened) or cut-off radius (truncated), in a0")
+    p.add_argument("--l", type=int, nargs="+", default=[0, 1, 2])
+    p.add_argument("--states", type=int, default=4, help="eigenvalues per l")
+    p.add_argument("--r-max", type=float)
+    p.add_argument("--points", type=int, default=20000)
+    p.add_argument("-j", "--workers", type=int)
+    p.set_defaults(func=_cmd_bound)
+
+    p = sub.add_parser("nodes", help="radial nodes of R_nl")
+    p.add_argument("n", type=int)
+    p.add_argument("l", type=int)
+    p.add_argument("--Z", type=float, default=1.0)
+    p.set_defaults(func=_cmd_nodes)
+
+    p = sub.add_parser("kinetics", help="peak, inflection points and half-lives of A -> X -> Z")
+    p.add_argument("--A0", type=float, default=1.0)
+    p.add_argument("--k1", type=float, required=True)
+    p.add_argument("--k2", type=float, required=True)
+    p.add_argument("--table", help="also write t, [A], [X], [Z] to this binary table directory")
+    p.add_argument("--points", type=int, default=1000, help="time points written to --table")
+    p.set_defaults(func=_cmd_kinetics)
+
+    p = sub.add_parser("fit", help="fit k1 and k2 of A -> X -> Z to a table with columns t and A, X and/or Z")
+    p.add_argument("path", help="binary table directory, e.g. written by kinetics --table")
+    p.add_argument("--A0", type=float, default=1.0, help="initial [A] (the starting value with --fit-A0)")
+    p.add_argument("--fit-A0", action="store_true")
+    p.add_argument("--sigma", type=float, help="measurement standard deviation (absolute errors)")
+    p.set_defaults(func=_cmd_fit)
+
+    p = sub.add_parser("stochastic", help="stochastic ensemble of A -> X -> Z: mean and variance of the counts")
+    p.add_argument("--N0", type=int, default=100, help="initial number of A molecules")
+    p.add_argument("--k1", type=float, required=True)
+    p.add_argument("--k2", type=float, required=True)
+    p.add_argument("--replicates", type=int, default=10000)
+    p.add_argument("--method", choices=["leap", "ssa"], default="leap")
+    p.add_argument("--seed", type=int)
+    p.add_argument("--t-end", type=float)
+    p.add_argument("--points", type=int, default=200)
+    p.add_argument("--chunk-size", type=int, default=10000)
+    p.add_argument("-j", "--workers", type=int)
+    p.add_argument("--table", help="write t and the mean and variance of every species to this table")
+    p.set_defaults(func=_cmd_stochastic)
+
+    p = sub.add_parser("mechanism", help="integrate a mass-action mechanism, e.g. 'A -> X : k1; X -> Z : k2'")
+    p.add_argument("reactions", help="reactions separated by ';' or newlines, each 'lhs -> rhs : k'")
+    p.add_argument("--rates", nargs="+", required=True, metavar="NAME=VALUE")
+    p.add_argument("--init", nargs="+", required=True, metavar="SPECIES=CONC",
+                   help="initial concentrations; unlisted species start at zero")
+    p.add_argument("--t-end", type=float, required=True)
+    p.add_argument("--points", type=int, default=200)
+    p.add_argument("--method", choices=["auto", "exact", "rosenbrock"], default="auto")
+    p.add_argument("--rtol", type=float, default=1e-6)
+    p.add_argument("--table", help="write t and every concentration to this binary table directory")
+    p.set_defaults(func=_cmd_mechanism)
+
+    p = sub.add_parser("table", help="describe a binary table, optionally exporting it as CSV")
+    p.add_argument("path")
+    p.add_argument("--csv", help="write the table as CSV to this file")
+    p.set_defaults(func=_cmd_table)
+
+    p = sub.add_parser("mesh", help="export the |Y_lm| orbital surface as a .ply or .npz mesh")
+    p.add_argument("l", type=int)
+    p.add_argument("m", type=int)
+    p.add_argument("-o", "--output", required=True, help="output file (.ply or .npz)")
+    p.add_argument("--tol", type=float, default=2e-3, help="surface error as a fraction of the lobe size")
+    p.add_argument("--max-triangles", type=int)
+    p.add_argument("--kind", choices=["real", "complex"], default="real")
+    p.set_defaults(func=_cmd_mesh)
+
+    p = sub.add_parser("volume", help="write the |psi_nlm|^2 volume to a memory-mapped .npy file")
+    p.add_argument("n", type=int)
+    p.add_argument("l", type=int)
+    p.add_argument("m", type=int)
+    p.add_argument("-o", "--output", required=True, help="output .npy file")
+    p.add_argument("--size", type=int, default=512, help="grid points per axis")
+    p.add_argument("--extent", type=float, help="half-width of the cube in a0")
+    p.add_argument("--Z", type=float, default=1.0)
+    p.add_argument("--float64", action="store_true", help="store float64 instead of float32")
+    p.add_argument("-j", "--workers", type=int)
+    p.add_argument("--isosurface", help="also write the isosurface mesh (.ply or .npz)")
+    p.add_argument("--fraction", type=float, default=0.9, help="probability enclosed by the isosurface")
+    p.set_defaults(func=_cmd_volume)
+
+    p = sub.add_parser("plot", help="draw one figure, e.g. plot exponential_difference k1=0.01 k2=100")
+    p.add_argument("name", choices=["exponential_difference", "radial_data", "p_orbital",
+                                     "real_orbital", "orbital_gallery"])
+    p.add_argument("params", nargs="*", help="key=value arguments of the plotting function")
+    p.set_defaults(func=_cmd_plot)
+
+    p = sub.add_parser("explore", help="interactive slider explorer: kinetics (A0, k1, k2) or potential (l, Z)")
+    p.add_argument("name", choices=["kinetics", "potential"])
+    p.add_argument("--A0", type=float, default=1.0)
+    p.add_argument("--k1", type=float, default=0.5)
+    p.add_argument("--k2", type=float, default=5.0)
+    p.add_argument("--t-end", type=float, help="fixed time axis length (default 10 / min(k1, k2))")
+    p.add_argument("--l", type=int, default=1)
+    p.add_argument("--Z", type=float, default=1.0)
+    p.set_defaults(func=_cmd_explore)
+
+    p = sub.add_parser("trace", help="merge the traces written with --trace: time and memory per span")
+    p.add_argument("directory")
+    p.add_argument("--folded", metavar="PATH", help="write the merged collapsed stacks for a flame graph")
+    p.add_argument("--top", type=int, default=30, help="number of spans listed")
+    p.set_defaults(func=_cmd_trace)
+
+    # Listed for --help only; main() hands "render ..." to batch_render unchanged.
+    sub.add_parser("render", help="headless batch rendering (see render --help)")
+    return parser
+
+
+def main(argv=None):
+    """Runs one command (with tracing if asked for) and returns its exit status."""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    options, argv = _tracing_parser().parse_known_args(argv)
+    if options.trace or options.trace_memory:
+        from .instrumentation import ENV_DIR, enable_tracing
+
+        directory = options.trace or os.environ.get(ENV_DIR)
+        if not directory:
+            build_parser().error("--trace-memory needs --trace DIR")
+        enable_tracing(directory, options.trace_memory)
+    if argv[:1] == ["render"]:
+        from .batch_render import main as render_main
+        from .instrumentation import trace_span
+
+        with trace_span("cli.render"):
+            return render_main(argv[1:])
+    args = build_parser().parse_args(argv)
+    from .instrumentation import trace_span
+
+    with trace_span(f"cli.{args.command}"):
+        return args.func(args) or 0
@@ -0,0 +1,173 @@
+"""
+Probability-density volumes |psi_nlm(x, y, z)|^2 of hydrogen-like atoms.
+
+psi_nlm = R_nl(r) Y_lm(theta, phi) is evaluated on a cubic Cartesian grid
+centred on the nucleus.  The grid is cut into slabs of a few x-planes; each
+slab is computed by a worker process and written straight into a .npy file
+opened as a memory map, so a 512^3 volume never has to fit in memory (at
+float32 it takes 512 MiB on disk, and each worker holds one slab).  The file
+is an ordinary .npy array and can be reopened with
+np.load(path, mmap_mode='r').
+
+isosurface_level finds the density that encloses a given fraction of the
+probability, and isosurface extracts that surface (marching cubes from
+scikit-image) as an OrbitalMesh whose values carry the sign of psi, so it
+can be drawn or written with save_mesh like the angular surfaces.
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .adaptive_grid import tail_radius
+from .angular import spherical_harmonic
+from .instrumentation import traced
+from .orbital_mesh import OrbitalMesh
+from .radial_engine import _check_state, radial_wavefunction
+
+DensityVolume = namedtuple("DensityVolume", "data axis")
+
+
+def volume_axis(size, extent):
+    """Grid coordinates (units of a0) along each axis: size points over [-extent, extent]."""
+    return np.linspace(-extent, extent, size)
+
+
+def wavefunction_values(x, y, z, n, l, m, Z=1, kind="real"):  # pylint: disable=design
+    """
+    psi_nlm = R_nl(r) Y_lm(theta, phi) at Cartesian points (units of a0).
+
+    x, y and z are broadcast against each other; kind selects real or
+    complex harmonics (see angular).
+    """
+    x, y, z = np.broadcast_arrays(*(np.asarray(c, dtype=float) for c in (x, y, z)))
+    r = np.sqrt(x * x + y * y + z * z)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cos_theta = np.where(r > 0, z / r, 1.0)
+    theta = np.arccos(np.clip(cos_theta, -1.0, 1.0))
+    phi = np.arctan2(y, x)
+    return radial_wavefunction(r, n, l, Z) * spherical_harmonic(l, m, theta, phi, kind)
+
+
+@traced()
+def _fill_slab(path, start, stop, axis, n, l, m, Z, kind):  # pylint: disable=design
+    """Writes |psi|^2 for x-planes start..stop-1 into the memory-mapped volume."""
+    volume = np.load(path, mmap_mode='r+')
+    psi = wavefunction_values(axis[start:stop, None, None], axis[None, :, None], axis[None, None, :],
+                              n, l, m, Z, kind)
+    volume[start:stop] = np.abs(psi)**2
+    volume.flush()
+    del volume
+    return stop - start
+
+
+@traced()
+def density_volume(path, n, l, m, size=512, extent=None, Z=1, kind="real",  # pylint: disable=design
+                   dtype=np.float32, slab=16, workers=None):
+    """
+    Writes the |psi_nlm|^2 volume to a memory-mapped .npy file.
+
+    Parameters:
+        path (str): Output .npy file (overwritten).
+        n, l, m (int): Quantum numbers.
+        size (int): Grid points along each axis.
+        extent (float, optional): Half-width of the cube in units of a0.
+                                  Defaults to where the density tail has fallen below ~1e-6.
+        Z (float): Nuclear charge.
+        kind (str): 'real' or 'complex' harmonics; the density is the same
+                    for m = 0 and differs only in shape for m != 0.
+        dtype: Storage type, np.float32 (default) or np.float64.
+        slab (int): x-planes computed per task.
+        workers (int, optional): Worker processes (default: CPU count);
+                                 1 computes every slab in this process.
+
+    Returns:
+        DensityVolume: the read-only memory map (shape (size, size, size),
+                       indexed [x, y, z]) and the axis coordinates.
+    """
+    _check_state(n, l)
+    if abs(m) > l:
+        raise ValueError(f"Need |m| <= l, got l={l}, m={m}.")
+    if extent is None:
+        extent = tail_radius(n, Z, 1e-3)
+    axis = volume_axis(size, extent)
+
+    volume = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(size, size, size))
+    del volume  # header and file size are on disk; workers reopen it
+    bounds = [(start, min(start + slab, size)) for start in range(0, size, slab)]
+    if workers == 1:
+        for start, stop in bounds:
+            _fill_slab(path, start, stop, axis, n, l, m, Z, kind)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_fill_slab, path, start, stop, axis, n, l, m, Z, kind)
+                       for start, stop in bounds]
+            for f in futures:
+                f.result()
+    return DensityVolume(np.load(path, mmap_mode='r'), axis)
+
+
+def isosurface_level(volume, fraction=0.9, slab=16, bins=4096):
+    """
+    Density level whose isosurface encloses the given fraction of the probability.
+
+    The volume is read slab by slab into a histogram of log10(density)
+    weighted by the density, so the level is found without loading or
+    sorting the whole array; its resolution is that of the histogram bins.
+    """
+    data = volume.data if isinstance(volume, DensityVolume) else volume
+    peak = max(float(data[i:i + slab].max()) for i in range(0, data.shape[0], slab))
+    edges = np.linspace(np.log10(peak) - 12, np.log10(peak), bins + 1)
+    weight = np.zeros(bins)
+    for i in range(0, data.shape[0], slab):
+        block = np.asarray(data[i:i + slab], dtype=float).ravel()
+        block = block[block > 0]
+        weight += np.histogram(np.log10(block), bins=edges, weights=block)[0]
+    # Probability held by voxels at or above each bin, from the top down.
+    enclosed = np.cumsum(weight[::-1])[::-1] / weight.sum()
+    k = np.flatnonzero(enclosed >= fraction)[-1]
+    return 10**edges[k]
+
+
+@traced()
+def isosurface(volume, level=None, fraction=0.9, n=None, l=None, m=None, Z=1, kind="real",  # pylint: disable=design
+               step=1):
+    """
+    Extracts an isosurface of a density volume as an OrbitalMesh.
+
+    Parameters:
+        volume (DensityVolume): As returned by density_volume.
+        level (float, optional): Density of the surface; defaults to
+                                 isosurface_level(volume, fraction).
+        fraction (float): Enclosed probability used when level is not given.
+        n, l, m (int, optional): Quantum numbers of the volume; when given,
+                                 the vertex values are the sign of psi, so
+                                 lobes can be coloured by phase.  Otherwise they are 1.
+        Z (float), kind (str): As passed to density_volume.
+        step (int): Marching-cubes step size; 2 or more gives a coarser, faster mesh.
+
+    Returns:
+        OrbitalMesh: vertices in units of a0, faces and per-vertex values.
+    """
+    try:
+        from skimage.measure import marching_cubes  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError("isosurface needs scikit-image (pip install scikit-image)") from exc
+
+    if level is None:
+        level = isosurface_level(volume, fraction)
+    axis = volume.axis
+    spacing = axis[1] - axis[0]
+    data = volume.data
+    if not data.flags.writeable:
+        # marching_cubes wants a writeable buffer; copy-on-write keeps the file untouched.
+        data = np.load(data.filename, mmap_mode='c') if isinstance(data, np.memmap) else data.copy()
+    vertices, faces, _, _ = marching_cubes(data, level, spacing=(spacing,) * 3,
+                                           step_size=step, allow_degenerate=False)
+    vertices += axis[0]
+    if n is None:
+        values = np.ones(len(vertices))
+    else:
+        psi = wavefunction_values(*vertices.T, n, l, m, Z, kind)
+        values = np.sign(psi.real if np.iscomplexobj(psi) else psi)
+    return OrbitalMesh(vertices.astype(np.float32), faces.astype(np.int32), values.astype(np.float32))
@@ -0,0 +1,263 @@
+"""
+Slider-driven explorers for classroom parameter sweeps.
+
+Each explorer builds its figure once and keeps the grid, the output buffers
+and every line artist.  A slider move recomputes the curves into the same
+buffers, moves the artists with set_data and blits: the static background
+(axes, grid, labels) is cached as a bitmap after each full draw and only the
+changing artists are drawn over it.  The sliders redraw themselves the same
+way (drawon is off), so a move never triggers a full figure redraw.  The
+analytic landmarks (kinetic_features, effective_potential_extrema) place
+the markers without searching the curves.
+
+Each explorer's update() can also be called directly, e.g. to time a
+redraw under the Agg backend.
+"""
+# matplotlib is imported by each explorer, so the module imports without it.
+# pylint: disable=import-outside-toplevel
+import numpy as np
+
+from .consecutive_kinetics import conc_profiles, kinetic_features, kinetic_time_grid
+from .instrumentation import traced
+from .potentials import effective_potential, effective_potential_extrema
+
+
+class _Blitter:
+    """
+    Caches the figure background on every full draw and redraws only the animated artists.
+
+    artists change on every move.  Each slider's own artists are animated
+    only while it is the one being moved (activate); the other sliders stay
+    in the cached background, since text is the slowest thing to draw.
+    """
+
+    def __init__(self, fig, artists, sliders):
+        self.fig = fig
+        self.canvas = fig.canvas
+        self.artists = list(artists)
+        self.slider_artists = {}
+        for name, slider in sliders.items():
+            slider.drawon = False
+            self.slider_artists[name] = [a for a in (slider.poly, slider.valtext, getattr(slider, "_handle", None))
+                                         if a is not None]
+        for artist in self.artists:
+            artist.set_animated(True)
+        self.active = None
+        self.background = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def activate(self, name):
+        """Animates the artists of slider name instead of the previous one (one full redraw)."""
+        if name == self.active:
+            return
+        for artist in self.slider_artists.get(self.active, []):
+            artist.set_animated(False)
+        for artist in self.slider_artists.get(name, []):
+            artist.set_animated(True)
+        self.active = name
+        self.background = None
+
+    def _on_draw(self, _event):
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        for artist in self.artists + self.slider_artists.get(self.active, []):
+            self.fig.draw_artist(artist)
+
+    @traced()
+    def redraw(self):
+        """Restores the cached background and draws the changed artists over it."""
+        if self.background is None:
+            self.canvas.draw()  # the draw_event caches the background
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_artists()
+        self.canvas.blit(self.fig.bbox)
+        self.canvas.flush_events()
+
+
+class KineticsExplorer:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """
+    [A](t), [X](t) and [Z](t) of A -> X -> Z with sliders for A0, k1 and k2.
+
+    The rate constants move on log10 scales between k_range[0] and
+    k_range[1].  The time axis runs from 0 to t_end; the n_points times on
+    it follow kinetic_time_grid for the current k1 and k2, so a rise much
+    faster than the decay stays resolved.  The [X] maximum and its
+    inflection point are marked from kinetic_features.
+    """
+
+    def __init__(self, A0=1.0, k1=0.5, k2=5.0, t_end=None, n_points=500,  # pylint: disable=design
+                 k_range=(1e-3, 1e3), A0_max=None):
+        import matplotlib.pyplot as plt
+        from matplotlib.widgets import Slider
+
+        t_end = t_end if t_end is not None else 10 / min(k1, k2)
+        A0_max = A0_max or 2 * A0
+        self.t_end = t_end
+        self.t = kinetic_time_grid(k1, k2, t_end, n_points)
+        self.buffers = tuple(np.empty(n_points) for _ in range(3))
+        self.A0, self.k1, self.k2 = A0, k1, k2
+
+        self.fig, self.ax = plt.subplots(figsize=(10, 6))
+        self.fig.subplots_adjust(bottom=0.3)
+        colors = ("blue", "orange", "green")
+        self.lines = [self.ax.plot(self.t, b, label=f"[{s}](t)", color=c)[0]
+                      for s, b, c in zip("AXZ", self.buffers, colors)]
+        self.A0_line = self.ax.axhline(A0, color="gray", linestyle="--", linewidth=1, label="[A]₀")
+        self.peak, = self.ax.plot([], [], "o", color="orange", label="[X] maximum")
+        self.inflection, = self.ax.plot([], [], "s", color="orange", markerfacecolor="none",
+                                        label="[X] inflection")
+        self.info = self.ax.text(0.98, 0.6, "", transform=self.ax.transAxes, ha="right", va="top",
+                                 bbox={"facecolor": "whitesmoke", "edgecolor": "gray"})
+        self.ax.set_xlim(0, t_end)
+        self.ax.set_ylim(0, 1.05 * A0_max)
+        self.ax.set_xlabel("Time")
+        self.ax.set_ylabel("Concentration")
+        self.ax.set_title("Concentration vs Time (A → X → Z)")
+        self.ax.legend(loc="upper right")
+        self.ax.grid(True)
+
+        lo, hi = np.log10(k_range)
+        self.sliders = {
+            "A0": Slider(self.fig.add_axes([0.15, 0.17, 0.7, 0.03]), "[A]₀", 0.0, A0_max, valinit=A0),
+            "k1": Slider(self.fig.add_axes([0.15, 0.11, 0.7, 0.03]), "k₁", lo, hi, valinit=np.log10(k1)),
+            "k2": Slider(self.fig.add_axes([0.15, 0.05, 0.7, 0.03]), "k₂", lo, hi, valinit=np.log10(k2)),
+        }
+        for name in ("k1", "k2"):
+            self.sliders[name].valtext.set_text(f"{getattr(self, name):.3g}")
+        for name, slider in self.sliders.items():
+            slider.on_changed(lambda value, name=name: self._on_slider(name, value))
+        self.blitter = _Blitter(self.fig, self.lines + [self.A0_line, self.peak, self.inflection, self.info],
+                                self.sliders)
+        self.update()
+
+    def _on_slider(self, name, value):
+        self.blitter.activate(name)
+        if name == "A0":
+            self.update(A0=value)
+        else:
+            self.sliders[name].valtext.set_text(f"{10**value:.3g}")
+            self.update(**{name: 10**value})
+
+    @traced()
+    def update(self, A0=None, k1=None, k2=None):
+        """Recomputes the curves for the given parameters (others unchanged) and blits them."""
+        self.A0 = self.A0 if A0 is None else A0
+        if (k1 is not None and k1 != self.k1) or (k2 is not None and k2 != self.k2):
+            self.k1 = self.k1 if k1 is None else k1
+            self.k2 = self.k2 if k2 is None else k2
+            self.t[:] = kinetic_time_grid(self.k1, self.k2, self.t_end, self.t.size)
+        conc_profiles(self.t, self.A0, self.k1, self.k2, out=self.buffers)
+        for line, values in zip(self.lines, self.buffers):
+            line.set_data(self.t, values)
+        self.A0_line.set_ydata([self.A0, self.A0])
+
+        features = kinetic_features(self.A0, self.k1, self.k2)
+        t_max = float(features["t_max"])
+        t_infl = float(features["t_inflection_X"])
+        X_infl = float(conc_profiles(t_infl, self.A0, self.k1, self.k2)[1])
+        self.peak.set_data([t_max], [float(features["X_max"])])
+        self.inflection.set_data([t_infl], [X_infl])
+        # Kept short: each line of text costs about as much to draw as all the curves.
+        self.info.set_text(f"t_max = {t_max:.3g}, [X]max = {float(features['X_max']):.3g}\n"
+                           f"t½(A) = {float(features['half_life_1']):.3g}")
+        self.blitter.redraw()
+
+
+class PotentialExplorer:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """
+    Effective potential of a hydrogen-like atom with sliders for l and Z.
+
+    The centrifugal terms for l = 0..l_max and the Coulomb term for Z = 1
+    are tabulated once on the grid; a move only scales and adds them.
+    The minimum r_min = l(l+1) a0 / Z and the zero crossing r_min / 2 are
+    marked from effective_potential_extrema.
+    """
+
+    def __init__(self, l=1, Z=1, l_max=6, Z_max=5, r_min=0.1, r_max=10.0,  # pylint: disable=design
+                 n_points=500, ylim=(-30, 50)):
+        import matplotlib.pyplot as plt
+        from matplotlib.widgets import Slider
+
+        self.r = np.linspace(r_min, r_max, n_points)
+        self.centrifugal, coulomb, _ = effective_potential(self.r, np.arange(l_max + 1), components=True)
+        self.coulomb_1 = np.broadcast_to(coulomb, self.r.shape)
+        self.coulomb = np.empty_like(self.r)
+        self.total = np.empty_like(self.r)
+        self.l, self.Z = int(l), float(Z)
+
+        self.fig, self.ax = plt.subplots(figsize=(9, 6), dpi=120)
+        self.fig.subplots_adjust(bottom=0.25)
+        self.lines = [
+            self.ax.plot(self.r, self.r, label="Centrifugal Term", linestyle="dashed", color="royalblue",
+                         linewidth=2)[0],
+            self.ax.plot(self.r, self.r, label="Coulomb Term", linestyle="dotted", color="crimson",
+                         linewidth=2)[0],
+            self.ax.plot(self.r, self.r, label="Total Effective Potential", color="black", linewidth=2)[0],
+        ]
+        self.minimum, = self.ax.plot([], [], "o", color="black", label="Minimum")
+        self.zero, = self.ax.plot([], [], "x", color="black", label="Zero crossing")
+        self.info = self.ax.text(0.97, 0.6, "", transform=self.ax.transAxes, ha="right", va="top", fontsize=12,
+                                 bbox={"facecolor": "lightyellow", "edgecolor": "black", "boxstyle": "round,pad=0.4"})
+        self.ax.axhline(0, color="gray", linewidth=1, linestyle="--")
+        self.ax.set_xlim(r_min, r_max)
+        self.ax.set_ylim(*ylim)
+        self.ax.set_xlabel(r"Radial Distance $r$ (Å)", fontsize=14, fontweight="bold")
+        self.ax.set_ylabel(r"Potential Energy $V_{\text{eff}}(r)$ (eV)", fontsize=14, fontweight="bold")
+        self.ax.set_title("Effective Potential in a Hydrogen-like Atom", fontsize=16, fontweight="bold",
+                          color="darkblue")
+        self.ax.legend(fontsize=12, loc="upper right", frameon=True, edgecolor="black")
+        self.ax.grid(True, linestyle="--", alpha=0.5)
+
+        self.sliders = {
+            "l": Slider(self.fig.add_axes([0.15, 0.1, 0.7, 0.03]), "l", 0, l_max, valinit=self.l, valstep=1),
+            "Z": Slider(self.fig.add_axes([0.15, 0.04, 0.7, 0.03]), "Z", 1, Z_max, valinit=self.Z, valstep=1),
+        }
+        for name, slider in self.sliders.items():
+            slider.on_changed(lambda value, name=name: self._on_slider(name, value))
+        self.blitter = _Blitter(self.fig, self.lines + [self.minimum, self.zero, self.info], self.sliders)
+        self.update()
+
+    def _on_slider(self, name, value):
+        self.blitter.activate(name)
+        self.update(**{name: value})
+
+    @traced()
+    def update(self, l=None, Z=None):
+        """Redraws for the given l and/or Z and blits the changed artists."""
+        self.l = self.l if l is None else int(l)
+        self.Z = self.Z if Z is None else float(Z)
+        np.multiply(self.coulomb_1, self.Z, out=self.coulomb)
+        np.add(self.centrifugal[self.l], self.coulomb, out=self.total)
+        for line, values in zip(self.lines, (self.centrifugal[self.l], self.coulomb, self.total)):
+            line.set_ydata(values)
+
+        extrema = effective_potential_extrema(self.l, self.Z)
+        r_min, V_min, r_zero = (float(extrema[key]) for key in ("r_min", "V_min", "r_zero"))
+        self.minimum.set_data([r_min], [V_min])
+        self.zero.set_data([r_zero], [0.0])
+        text = f"$l = {self.l}$, $Z = {self.Z:g}$"
+        if self.l:
+            text += f"\n$r_{{min}}$ = {r_min:.3g} Å, $V_{{min}}$ = {V_min:.3g} eV"
+        self.info.set_text(text)
+        self.blitter.redraw()
+
+
+def explore_kinetics(A0=1.0, k1=0.5, k2=5.0, t_end=None, **options):
+    """Opens the A -> X -> Z explorer (see KineticsExplorer) and returns it."""
+    import matplotlib.pyplot as plt
+
+    explorer = KineticsExplorer(A0, k1, k2, t_end, **options)
+    plt.show()
+    return explorer
+
+
+def explore_potential(l=1, Z=1, **options):
+    """Opens the effective-potential explorer (see PotentialExplorer) and returns it."""
+    import matplotlib.pyplot as plt
+
+    explorer = PotentialExplorer(l, Z, **options)
+    plt.show()
+    return explorer
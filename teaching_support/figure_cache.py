@@ -0,0 +1,196 @@
+"""
+Content-addressed cache for rendered figures.
+
+A figure is identified by a hash of its input parameters, the source of the
+plotting code (the file itself plus every repository module it imports) and
+the active matplotlib style.  Rendered files are stored under that key, so an
+unchanged figure is copied from disk instead of being rasterised again.  The
+cache directory defaults to .figure_cache in the working directory the
+package was imported from and can be moved with the FIGURE_CACHE_DIR
+environment variable.
+"""
+import ast
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from .instrumentation import trace_span, traced
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _module_file(base, parts):
+    """Source file of module base/parts[0]/.../parts[-1], if it exists in the repository."""
+    path = os.path.join(base, *parts)
+    for candidate in (path + ".py", os.path.join(path, "__init__.py")):
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def _local_imports(path):
+    """Repository modules (top-level scripts or package modules) imported by the file at path."""
+    with open(path, encoding="utf-8") as fh:
+        tree = ast.parse(fh.read(), filename=path)
+    found = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                parts = alias.name.split(".")
+                found.extend(_module_file(REPO_DIR, parts[:i]) for i in range(1, len(parts) + 1))
+        elif isinstance(node, ast.ImportFrom):
+            base = REPO_DIR
+            if node.level:
+                base = os.path.dirname(path)
+                for _ in range(node.level - 1):
+                    base = os.path.dirname(base)
+            parts = node.module.split(".") if node.module else []
+            found.extend(_module_file(base, parts[:i]) for i in range(1, len(parts) + 1))
+            # "from package import submodule"
+            found.extend(_module_file(base, parts + [alias.name]) for alias in node.names)
+    return [p for p in found if p is not None and os.path.abspath(p).startswith(REPO_DIR)]
+
+
+def code_fingerprint(*paths):
+    """Hash of the given source files and, recursively, the repository modules they import."""
+    seen, stack = {}, [os.path.abspath(p) for p in paths]
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen[path] = _file_digest(path)
+        stack.extend(_local_imports(path))
+    h = hashlib.sha256()
+    for path in sorted(seen):
+        h.update(f"{os.path.relpath(path, REPO_DIR)}:{seen[path]}\n".encode())
+    return h.hexdigest()
+
+
+def style_fingerprint():
+    """Hash of the matplotlib version and every rcParams entry currently in effect."""
+    import matplotlib  # pylint: disable=import-outside-toplevel
+    items = sorted((k, repr(v)) for k, v in matplotlib.rcParams.items())
+    return hashlib.sha256(repr((matplotlib.__version__, items)).encode()).hexdigest()
+
+
+@traced()
+def figure_key(params, code_paths=(), style=None):
+    """
+    Cache key of one figure.
+
+    Parameters:
+        params: JSON-serialisable inputs of the figure (including output options such as dpi).
+        code_paths (sequence of str): Source files that draw the figure.
+        style (str, optional): Style fingerprint; the current rcParams are used if omitted.
+    """
+    payload = {
+        "params": params,
+        "code": code_fingerprint(*code_paths) if code_paths else None,
+        "style": style if style is not None else style_fingerprint(),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=repr).encode()).hexdigest()
+
+
+class FigureCache:
+    """
+    Stores rendered files under their figure key.
+
+    Parameters:
+        cache_dir (str): Directory holding one sub-directory per key.  A
+                         relative path is resolved once, here, so a later
+                         chdir (as batch_render does per job) does not move it.
+    """
+
+    def __init__(self, cache_dir=".figure_cache"):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_dir(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def lookup(self, key):
+        """Return the cached file paths for key, or None on a miss."""
+        entry = self._entry_dir(key)
+        if not os.path.isdir(entry):
+            return None
+        return sorted(os.path.join(entry, f) for f in os.listdir(entry))
+
+    def store(self, key, paths):
+        """Copy rendered files into the cache under key."""
+        entry = self._entry_dir(key)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        # A directory of its own: workers rendering the same figure store concurrently.
+        tmp = tempfile.mkdtemp(prefix=key + ".", suffix=".tmp", dir=os.path.dirname(entry))
+        try:
+            for path in paths:
+                shutil.copy2(path, tmp)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        # Renames only: readers see the old entry, none or the new one, never a partial one.
+        stale = tmp + ".old"
+        try:
+            os.replace(entry, stale)
+        except FileNotFoundError:
+            pass
+        try:
+            os.replace(tmp, entry)
+        except OSError:  # another process stored the same key in the meantime
+            shutil.rmtree(tmp, ignore_errors=True)
+        shutil.rmtree(stale, ignore_errors=True)
+
+    def restore(self, key, dest_dir):
+        """
+        Copy the files cached under key into dest_dir.
+
+        Returns:
+            list or None: The restored paths, or None on a miss.
+        """
+        cached = self.lookup(key)
+        if cached is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        out = []
+        for src in cached:
+            dest = os.path.join(dest_dir, os.path.basename(src))
+            if not (os.path.exists(dest) and _file_digest(dest) == _file_digest(src)):
+                shutil.copy2(src, dest)
+            out.append(dest)
+        return out
+
+    def savefig(self, fig, path, params=None, code_paths=(), **savefig_kwargs):
+        """
+        fig.savefig(path, **savefig_kwargs), skipped when an identical render is cached.
+
+        The key covers params, code_paths, the current style, the file name
+        and the savefig keyword arguments.
+        """
+        key = figure_key({"params": params, "file": os.path.basename(path),
+                          "savefig": savefig_kwargs}, code_paths)
+        if self.restore(key, os.path.dirname(os.path.abspath(path))) is not None:
+            return path
+        with trace_span("savefig", file=os.path.basename(path)):
+            fig.savefig(path, **savefig_kwargs)
+        self.store(key, [path])
+        return path
+
+    def stats(self):
+        """Hit/miss counts of this cache object."""
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0}
+
+
+default_cache = FigureCache(os.environ.get("FIGURE_CACHE_DIR", ".figure_cache"))
@@ -0,0 +1,322 @@
+"""
+Opt-in timing and memory tracing of the numerical kernels and figure phases.
+
+Tracing is off unless the environment variable TEACHING_SUPPORT_TRACE names
+an output directory (python -m teaching_support --trace DIR sets it).  When
+off, a traced function costs one extra call and a test of a module global.
+When on, every span records:
+
+    - its wall time (perf_counter_ns) and its self time (minus nested spans);
+    - the peak resident set size of the process when it ends (getrusage);
+    - with TEACHING_SUPPORT_TRACE_MEMORY=1 (--trace-memory), the peak of the
+      memory allocated through Python while it ran (tracemalloc).  This
+      slows allocation-heavy code noticeably, so it is off by default.
+      Python 3.8 has no tracemalloc.reset_peak; there a span's peak is only
+      seen when it sets a new high for the process, and otherwise the
+      memory in use when it ends is recorded.
+
+Spans nest: a kernel called while a figure is built is recorded under it.
+When the process exits it writes two files into the directory, named
+trace-<host>-<pid>-<start>:
+
+    .json    Chrome trace-event format ("X" events with the span attributes
+             and memory figures as args), which chrome://tracing, Perfetto
+             and speedscope open.  "summary" totals the count, wall time,
+             self time and memory peaks per span name.
+    .folded  Collapsed stacks, "outer;inner <self time in us>" per line, for
+             flamegraph.pl, inferno or speedscope.
+
+The environment variables are inherited, so worker processes (render jobs,
+process pools) trace themselves and write their own files into the same
+directory.  The event timestamps are wall-clock based, so the traces of one
+batch line up.  summarize_traces merges a directory of them.
+"""
+import atexit
+import contextlib
+import functools
+import glob
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ENV_DIR = "TEACHING_SUPPORT_TRACE"
+ENV_MEMORY = "TEACHING_SUPPORT_TRACE_MEMORY"
+MAX_EVENTS = 200000  # events kept per process; the summary and stacks keep counting past it
+
+# ru_maxrss is in KiB on Linux and in bytes on macOS.
+_RSS_BYTES = 1 if sys.platform == "darwin" else 1024
+_MB = 2.0**20
+_NULL_SPAN = contextlib.nullcontext()
+
+_recorder = None  # pylint: disable=invalid-name  # rebound by enable_tracing
+
+
+def _peak_rss():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_BYTES
+
+
+class _Span:
+    """One timed region; entered and exited through the recorder that created it."""
+
+    __slots__ = ("recorder", "name", "attrs", "path", "start", "child_ns", "mem_base", "mem_peak",
+                 "mem_mark")
+
+    def __init__(self, recorder, name, attrs):
+        self.recorder = recorder
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        self.recorder.enter(self)
+        return self
+
+    def __exit__(self, *exc):
+        self.recorder.exit(self, time.perf_counter_ns())
+        return False
+
+
+class _Recorder:  # pylint: disable=too-many-instance-attributes
+    """
+    Collects the spans of one process.
+
+    directory=None keeps everything in memory (flush writes nothing), which
+    is what the overhead benchmark uses.
+    """
+
+    def __init__(self, directory, memory=False):
+        self.directory = directory
+        self.memory = memory
+        if memory:
+            import tracemalloc  # pylint: disable=import-outside-toplevel
+            self._tracemalloc = tracemalloc
+            self._reset_peak = getattr(tracemalloc, "reset_peak", None)  # Python 3.9+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+        self._reset()
+        if directory is not None:
+            atexit.register(self.flush)
+            if hasattr(os, "register_at_fork"):  # not on Windows
+                os.register_at_fork(after_in_child=self._reset)
+            # Pool workers leave through os._exit, which skips atexit; the
+            # multiprocessing finalizers still run.
+            import multiprocessing  # pylint: disable=import-outside-toplevel
+            import multiprocessing.util  # pylint: disable=import-outside-toplevel
+            multiprocessing.util.register_after_fork(self, _Recorder._register_finalizer)
+            if multiprocessing.parent_process() is not None:
+                self._register_finalizer()
+
+    def _reset(self):
+        self.pid = os.getpid()
+        self.origin_ns = time.perf_counter_ns()
+        self.epoch_ns = time.time_ns()
+        self.stacks = {}
+        self.events = []
+        self.folded = {}
+        self.totals = {}
+        self.dropped = 0
+
+    def _register_finalizer(self):
+        import multiprocessing.util  # pylint: disable=import-outside-toplevel
+        multiprocessing.util.Finalize(None, self.flush, exitpriority=10)
+
+    def enter(self, span):
+        """Opens span on this thread's stack, under the span currently open there."""
+        stack = self.stacks.setdefault(threading.get_ident(), [])
+        parent = stack[-1] if stack else None
+        name = span.name.replace(";", ",")
+        span.path = name if parent is None else f"{parent.path};{name}"
+        span.child_ns = 0
+        if self.memory:
+            current, peak = self._tracemalloc.get_traced_memory()
+            if parent is not None:
+                parent.mem_peak = max(parent.mem_peak, peak)
+            if self._reset_peak is not None:
+                self._reset_peak()
+                peak = current
+            span.mem_base = span.mem_peak = current
+            span.mem_mark = peak
+        stack.append(span)
+        span.start = time.perf_counter_ns()
+
+    def exit(self, span, end):
+        """Closes span at end (ns) and adds its times and memory peaks to the totals."""
+        duration = end - span.start
+        stack = self.stacks[threading.get_ident()]
+        stack.pop()
+        parent = stack[-1] if stack else None
+        if parent is not None:
+            parent.child_ns += duration
+        alloc = None
+        if self.memory:
+            current, peak = self._tracemalloc.get_traced_memory()
+            if self._reset_peak is None and peak <= span.mem_mark:
+                peak = current  # no new high since the span began; its own peak is unknown
+            peak = max(span.mem_peak, peak)
+            alloc = peak - span.mem_base
+            if parent is not None:
+                parent.mem_peak = max(parent.mem_peak, peak)
+        rss = _peak_rss()
+        self_ns = duration - span.child_ns
+
+        self.folded[span.path] = self.folded.get(span.path, 0) + self_ns
+        total = self.totals.get(span.name)
+        if total is None:
+            total = self.totals[span.name] = {"count": 0, "wall_ns": 0, "self_ns": 0, "rss_peak": 0,
+                                              "alloc_peak": 0}
+        total["count"] += 1
+        total["wall_ns"] += duration
+        total["self_ns"] += self_ns
+        total["rss_peak"] = max(total["rss_peak"], rss or 0)
+        total["alloc_peak"] = max(total["alloc_peak"], alloc or 0)
+        if len(self.events) >= MAX_EVENTS:
+            self.dropped += 1
+            return
+        args = dict(span.attrs) if span.attrs else {}
+        if rss is not None:
+            args["rss_peak_mb"] = round(rss / _MB, 3)
+        if alloc is not None:
+            args["alloc_peak_mb"] = round(alloc / _MB, 3)
+        self.events.append({"name": span.name, "ph": "X", "pid": self.pid, "tid": threading.get_ident(),
+                            "ts": (self.epoch_ns + span.start - self.origin_ns) / 1e3,
+                            "dur": duration / 1e3, "args": args})
+
+    def summary(self):
+        """Per span name: count, wall and self seconds, and the memory peaks in MB."""
+        return {name: {"count": t["count"], "wall_s": t["wall_ns"] / 1e9, "self_s": t["self_ns"] / 1e9,
+                       "rss_peak_mb": t["rss_peak"] / _MB,
+                       "alloc_peak_mb": t["alloc_peak"] / _MB if self.memory else None}
+                for name, t in self.totals.items()}
+
+    def flush(self):
+        """Writes the .json trace and the .folded stacks of this process (overwriting earlier flushes)."""
+        if self.directory is None or not self.totals or os.getpid() != self.pid:
+            return None
+        stem = os.path.join(self.directory, f"trace-{socket.gethostname()}-{self.pid}-{self.epoch_ns // 10**6}")
+        meta = {"name": "process_name", "ph": "M", "pid": self.pid,
+                "args": {"name": " ".join([os.path.basename(sys.argv[0])] + sys.argv[1:])}}
+        trace = {
+            "traceEvents": [meta] + self.events,
+            "displayTimeUnit": "ms",
+            "otherData": {"argv": sys.argv, "pid": self.pid, "host": socket.gethostname(),
+                          "python": sys.version.split()[0], "start": self.epoch_ns / 1e9,
+                          "memory": self.memory, "dropped_events": self.dropped},
+            "summary": self.summary(),
+        }
+        os.makedirs(self.directory, exist_ok=True)
+        with open(stem + ".json", "w", encoding="utf-8") as fh:
+            json.dump(trace, fh, default=repr)
+        with open(stem + ".folded", "w", encoding="utf-8") as fh:
+            for path, ns in sorted(self.folded.items()):
+                if ns >= 1000:
+                    fh.write(f"{path} {ns // 1000}\n")
+        return stem + ".json"
+
+
+def enable_tracing(directory, memory=False):
+    """
+    Starts tracing this process and every process it starts afterwards.
+
+    Parameters:
+        directory (str): Where the trace files are written at exit.
+        memory (bool): Also record tracemalloc peaks per span.
+    """
+    global _recorder  # pylint: disable=global-statement  # the one switch the hot path tests
+    directory = os.path.abspath(directory)
+    os.environ[ENV_DIR] = directory
+    if memory:
+        os.environ[ENV_MEMORY] = "1"
+    if _recorder is not None and _recorder.directory == directory and _recorder.memory == memory:
+        return
+    if _recorder is not None:
+        _recorder.flush()
+    _recorder = _Recorder(directory, memory)
+
+
+def tracing_enabled():
+    """True when this process records spans."""
+    return _recorder is not None
+
+
+def trace_span(name, /, **attrs):
+    """
+    Context manager timing the enclosed block as a span called name.
+
+    The keyword arguments are stored with the span (they must be
+    JSON-serialisable).  Does nothing unless tracing is enabled.
+    """
+    if _recorder is None:
+        return _NULL_SPAN
+    return _Span(_recorder, name, attrs)
+
+
+def traced(name=None):
+    """
+    Decorator recording every call of the function as a span.
+
+    The span is called name, or module.qualname of the function by default
+    (e.g. 'radial_engine.radial_table').  Not for generator functions, whose
+    body runs after the call returns.
+    """
+    def decorate(func):
+        label = name or f"{func.__module__.rpartition('.')[2]}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _recorder is None:
+                return func(*args, **kwargs)
+            with _Span(_recorder, label, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def summarize_traces(directory, folded=None):
+    """
+    Merges the trace files of a directory, e.g. of every worker of a batch render.
+
+    Parameters:
+        directory (str): Directory written by a traced run.
+        folded (str, optional): Write the summed collapsed stacks of all
+                processes to this file, for one flame graph of the batch.
+
+    Returns:
+        dict: Per span name the total count, wall and self seconds and the
+              largest memory peaks, plus 'processes' (the number of traces).
+    """
+    summary, stacks = {}, {}
+    paths = sorted(glob.glob(os.path.join(directory, "trace-*.json")))
+    for path in paths:
+        with open(path, encoding="utf-8") as fh:
+            for name, entry in json.load(fh)["summary"].items():
+                total = summary.setdefault(name, {"count": 0, "wall_s": 0.0, "self_s": 0.0,
+                                                  "rss_peak_mb": 0.0, "alloc_peak_mb": None})
+                total["count"] += entry["count"]
+                total["wall_s"] += entry["wall_s"]
+                total["self_s"] += entry["self_s"]
+                total["rss_peak_mb"] = max(total["rss_peak_mb"], entry["rss_peak_mb"])
+                if entry["alloc_peak_mb"] is not None:
+                    total["alloc_peak_mb"] = max(total["alloc_peak_mb"] or 0.0, entry["alloc_peak_mb"])
+        if folded is not None:
+            with open(path[:-len(".json")] + ".folded", encoding="utf-8") as fh:
+                for line in fh:
+                    stack, _, value = line.rstrip("\n").rpartition(" ")
+                    stacks[stack] = stacks.get(stack, 0) + int(value)
+    if folded is not None:
+        with open(folded, "w", encoding="utf-8") as fh:
+            for stack, value in sorted(stacks.items()):
+                fh.write(f"{stack} {value}\n")
+    return {"processes": len(paths), "spans": summary}
+
+
+if os.environ.get(ENV_DIR):
+    enable_tracing(os.environ[ENV_DIR], os.environ.get(ENV_MEMORY, "") not in ("", "0"))
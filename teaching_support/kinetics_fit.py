@@ -0,0 +1,227 @@
+"""
+Least-squares fits of k1 and k2 (and optionally A0) of A -> X -> Z to measured profiles.
+
+Many independent datasets are fitted together.  Every Levenberg-Marquardt
+iteration evaluates the closed-form profiles and their analytic derivatives
+(consecutive_kinetics.profile_derivatives) for all datasets at once,
+forms the small normal equations with einsum and solves them as one
+stacked linear system.  Each dataset keeps its own damping and drops out
+of the iteration when it has converged.  The rate constants are fitted as
+ln k, which keeps them positive and makes the steps scale-free.  The model
+is smooth through k1 = k2, so no dataset needs special handling.
+
+Any of [A], [X] and [Z] may be missing, either as a whole (None) or per
+point (NaN).  Unless k0 is given, starting values come from a coarse
+log-spaced (k1, k2) grid and a few local refinements of it, evaluated for
+every dataset at once on a subsample of the times.  Large batches
+can be split across worker processes.
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .consecutive_kinetics import conc_profiles, profile_derivatives
+from .instrumentation import traced
+
+KineticFit = namedtuple("KineticFit", "k1 k2 A0 k1_err k2_err A0_err covariance chi2 dof converged")
+KineticFit.__doc__ = """\
+Fitted parameters and one-sigma standard errors, each of the batch shape
+(A0_err is zero when A0 was held fixed).  covariance has shape
+batch + (P, P) for the parameters (k1, k2[, A0]).  chi2 is the weighted
+sum of squared residuals and dof the number of observations minus P."""
+
+
+# Starting values: a coarse grid, then local 3 x 3 searches with halving
+# steps, on at most this many time points per dataset.
+START_POINTS = 24
+REFINE_ROUNDS = 5
+MAX_LOG_STEP = 2.0
+
+
+def _evaluate(t, y, sqrt_w, species, p, A0, fit_A0, jacobian=True):  # pylint: disable=design
+    """Weighted residuals (D, N) and, optionally, their Jacobian (D, N, P) at the parameters p.
+
+    y and sqrt_w have shape (D, len(species), T); y holds zeros where
+    sqrt_w is zero (missing points)."""
+    k1, k2 = np.exp(p[:, :1]), np.exp(p[:, 1:2])
+    a0 = p[:, 2:3] if fit_A0 else A0
+    profiles = conc_profiles(t, a0, k1, k2)
+    model = np.stack([profiles[s] for s in species], axis=1)
+    r = ((model - y) * sqrt_w).reshape(len(p), -1)
+    if not jacobian:
+        return r, None
+    d = profile_derivatives(t, a0, k1, k2)[species]                     # (S, 3, D, T)
+    columns = [d[:, 1] * k1, d[:, 2] * k2] + ([d[:, 0]] if fit_A0 else [])
+    J = np.stack([np.moveaxis(c, 0, 1) * sqrt_w for c in columns], axis=-1)
+    return r, J.reshape(len(p), -1, J.shape[-1])
+
+
+def _starting_values(t, y, sqrt_w, species, A0, n_grid):  # pylint: disable=design
+    """ln(k1, k2) minimising the cost over a log-spaced grid, then refined locally."""
+    # Log-spaced indices keep the early points, where the fast phase is.
+    keep = np.unique(np.geomspace(1, t.shape[-1], START_POINTS).astype(int) - 1)
+    t, y, sqrt_w = t[..., keep], y[..., keep], sqrt_w[..., keep]
+    t_pos = np.where(t > 0, t, np.inf)
+    log_lo = np.log(0.1 / np.max(t, axis=-1))
+    log_hi = np.minimum(np.log(10 / np.min(t_pos, axis=-1)), log_lo + np.log(1e8))
+    D = len(y)
+    log_lo, log_hi = np.broadcast_to(log_lo, D), np.broadcast_to(log_hi, D)
+    best = np.full(D, np.inf)
+    p0 = np.zeros((D, 2))
+
+    def consider(p):
+        r, _ = _evaluate(t, y, sqrt_w, species, p, A0, False, jacobian=False)
+        cost = np.einsum("dn,dn->d", r, r)
+        better = cost < best
+        best[better] = cost[better]
+        p0[better] = p[better]
+
+    u = np.linspace(0.0, 1.0, n_grid)
+    for i in u:
+        for j in u:
+            consider(np.stack([log_lo + (log_hi - log_lo) * i, log_lo + (log_hi - log_lo) * j], axis=-1))
+    step = (log_hi - log_lo)[:, None] / (n_grid - 1)
+    for _ in range(REFINE_ROUNDS):
+        step = step / 2
+        centre = p0.copy()
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                if di or dj:
+                    consider(centre + step * (di, dj))
+    return p0
+
+
+def _levenberg_marquardt(t, y, sqrt_w, species, p, A0, fit_A0, max_iter, tol):  # pylint: disable=design
+    D, P = p.shape
+    lam = np.full(D, 1e-3)
+    converged = np.zeros(D, dtype=bool)
+    r, J = _evaluate(t, y, sqrt_w, species, p, A0, fit_A0)
+    cost = np.einsum("dn,dn->d", r, r)
+    active = np.arange(D)
+    for _ in range(max_iter):
+        if not active.size:
+            break
+        Ja, ra = J[active], r[active]
+        JTJ = Ja.swapaxes(1, 2) @ Ja
+        g = (Ja.swapaxes(1, 2) @ ra[..., None])[..., 0]
+        diag = np.maximum(np.einsum("dpp->dp", JTJ), 1e-12 * np.einsum("dpp->d", JTJ)[:, None] + 1e-300)
+        step = np.linalg.solve(JTJ + (lam[active, None] * diag)[..., None] * np.eye(P), -g[..., None])[..., 0]
+        # At most a factor e^2 in k per iteration, which also keeps exp(ln k) finite.
+        step *= np.minimum(1.0, MAX_LOG_STEP / np.max(np.abs(step[:, :2]), axis=-1))[:, None]
+        p_try = p[active] + step
+        r_try, J_try = _evaluate(t if t.shape[0] == 1 else t[active], y[active], sqrt_w[active], species,
+                                 p_try, A0[active], fit_A0)
+        cost_try = np.einsum("dn,dn->d", r_try, r_try)
+
+        better = cost_try <= cost[active]
+        accepted = active[better]
+        gain = cost[accepted] - cost_try[better]
+        p[accepted], r[accepted], J[accepted] = p_try[better], r_try[better], J_try[better]
+        cost[accepted] = cost_try[better]
+        lam[accepted] = np.maximum(lam[accepted] * 0.3, 1e-12)
+        rejected = active[~better]
+        lam[rejected] *= 10.0
+
+        small_step = np.all(np.abs(step[better]) <= tol * (1 + np.abs(p_try[better])), axis=-1)
+        done = np.zeros(active.size, dtype=bool)
+        done[better] = small_step | (gain <= tol * cost[accepted])
+        converged[active[done]] = True
+        done |= lam[active] > 1e12                                      # no downhill step left
+        active = active[~done]
+    return p, J, cost, converged
+
+
+@traced()
+def _fit_block(t, y, w, species, A0, fit_A0, p0, max_iter, tol, n_grid):  # pylint: disable=design
+    sqrt_w = np.sqrt(w)
+    y = np.where(w > 0, y, 0.0)
+    if p0 is None:
+        p0 = _starting_values(t, y, sqrt_w, species, A0, n_grid)
+    if fit_A0:
+        p0 = np.concatenate([p0, np.broadcast_to(A0, (len(y), 1))], axis=1)
+    return _levenberg_marquardt(t, y, sqrt_w, species, p0.copy(), A0, fit_A0, max_iter, tol)
+
+
+@traced()
+def fit_consecutive(t, A=None, X=None, Z=None, A0=1.0, fit_A0=False, sigma=None, k0=None,  # pylint: disable=design
+                    max_iter=200, tol=1e-10, n_grid=8, workers=None, chunk_size=2000):
+    """
+    Fits A -> X -> Z to one or many measured concentration profiles.
+
+    Parameters:
+        t (array_like): Times, shape (T,) shared by every dataset or batch + (T,).
+        A, X, Z (array_like, optional): Measured concentrations, each of shape
+            batch + (T,) or (T,); None for a species that was not measured
+            and NaN for individual missing points.
+        A0 (array_like): Initial [A] per dataset (broadcast to the batch);
+            the starting value when fit_A0 is set.
+        fit_A0 (bool): Fit A0 as well as k1 and k2.
+        sigma (array_like, optional): Measurement standard deviation(s),
+            broadcast against the data.  When given, the errors are absolute
+            (chi2 / dof should be near 1); otherwise they are scaled by the
+            residual variance chi2 / dof, as scipy's curve_fit does by default.
+        k0 (array_like, optional): Starting (k1, k2), shape (2,) or batch + (2,);
+            defaults to the best point of an n_grid x n_grid log-spaced grid
+            from 0.1 / t_max to 10 / (first t > 0), refined locally.
+        max_iter (int): Levenberg-Marquardt iterations.
+        tol (float): Relative change of the cost or of ln k that counts as converged.
+        workers (int, optional): Fit chunks of chunk_size datasets in this
+            many worker processes; None or 1 fits them here.
+
+    Returns:
+        KineticFit: Parameters, standard errors and covariance per dataset.
+    """
+    species = [s for s, v in enumerate((A, X, Z)) if v is not None]
+    observed = [np.asarray(v, dtype=float) for v in (A, X, Z) if v is not None]
+    if not observed:
+        raise ValueError("At least one of A, X and Z is needed.")
+    t = np.asarray(t, dtype=float)
+    full = np.broadcast_shapes(*(v.shape for v in observed), t.shape)
+    batch, T = full[:-1], full[-1]
+    D = int(np.prod(batch))
+    y = np.stack([np.broadcast_to(v, full).reshape(D, T) for v in observed], axis=1)
+    w = np.isfinite(y).astype(float)
+    if sigma is not None:
+        variance = np.asarray(sigma, dtype=float)**2
+        w /= np.broadcast_to(variance, full).reshape(D, 1, T) if variance.shape[-1:] else variance
+    t = t.reshape(1, T) if t.ndim == 1 else np.broadcast_to(t, full).reshape(D, T)
+    A0 = np.broadcast_to(np.asarray(A0, dtype=float), batch).reshape(D, 1)
+    P = 3 if fit_A0 else 2
+    n_obs = np.count_nonzero(w, axis=(1, 2))
+    if np.any(n_obs <= P):
+        raise ValueError(f"Every dataset needs more than {P} observed points.")
+    p0 = None
+    if k0 is not None:
+        p0 = np.log(np.broadcast_to(np.asarray(k0, dtype=float), batch + (2,)).reshape(D, 2))
+
+    blocks = [slice(start, min(start + chunk_size, D)) for start in range(0, D, chunk_size)]
+
+    def block_args(b):
+        return (t if t.shape[0] == 1 else t[b], y[b], w[b], species, A0[b], fit_A0,
+                None if p0 is None else p0[b], max_iter, tol, n_grid)
+
+    if workers is None or workers == 1 or len(blocks) == 1:
+        results = [_fit_block(*block_args(b)) for b in blocks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_fit_block, *block_args(b)) for b in blocks]
+            results = [f.result() for f in futures]
+    p = np.concatenate([res[0] for res in results])
+    J = np.concatenate([res[1] for res in results])
+    chi2 = np.concatenate([res[2] for res in results])
+    converged = np.concatenate([res[3] for res in results])
+
+    dof = n_obs - P
+    cov = np.linalg.pinv(J.swapaxes(1, 2) @ J)
+    if sigma is None:
+        cov *= (chi2 / np.maximum(dof, 1))[:, None, None]
+    # From ln k to k: scale rows and columns by k.
+    scale = np.concatenate([np.exp(p[:, :2]), np.ones((D, P - 2))], axis=1)
+    cov = cov * scale[:, :, None] * scale[:, None, :]
+    err = np.sqrt(np.maximum(np.einsum("dpp->dp", cov), 0.0))
+    fitted_A0 = p[:, 2] if fit_A0 else A0[:, 0]
+    A0_err = err[:, 2] if fit_A0 else np.zeros(D)
+    out = [scale[:, 0], scale[:, 1], fitted_A0, err[:, 0], err[:, 1], A0_err]
+    return KineticFit(*(v.reshape(batch) for v in out), cov.reshape(batch + (P, P)),
+                      chi2.reshape(batch), dof.reshape(batch), converged.reshape(batch))
@@ -0,0 +1,140 @@
+"""
+Radial matrix elements <n l | r^k | n' l'> between all hydrogen-like states up to n_max.
+
+Every state is evaluated once on a shared quadrature: Gauss-Legendre nodes
+on t in (0, 1) mapped to r = L t / (1 - t), with L = 2 n_max / Z, the decay
+length of the most diffuse shell.  The nodes cluster near the nucleus and
+spread through the tails, so one rule of about 16 n_max points resolves
+every pair to ~1e-12 relative accuracy; the table is then
+R diag(w r^(2+k)) R^T, a dense matrix product.  With delta_l given, only
+the blocks of l -> l + delta_l are multiplied; the other entries are left
+at zero.
+
+Tables are read-only, the most recently used MEMORY_ENTRIES of them are
+kept in memory, and they are optionally saved under a cache
+directory (the MATRIX_ELEMENT_CACHE_DIR environment variable, or the
+cache_dir argument) keyed by the radial engine version, n_max, k, Z,
+delta_l and the quadrature order.  Saved files are renamed into place
+only once complete.  cache=False bypasses both, e.g. for timing.
+"""
+import os
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+
+from .instrumentation import traced
+from .radial_engine import ENGINE_VERSION, radial_table, state_list
+from .wavefunction_cache import _save_atomic
+
+DEFAULT_CACHE_DIR = os.environ.get("MATRIX_ELEMENT_CACHE_DIR")
+DIPOLE = (-1, 1)
+MEMORY_ENTRIES = 16  # tables kept in memory; n_max = 50 takes 13 MB each
+
+_memo = OrderedDict()
+
+
+@lru_cache(maxsize=16)
+def shared_radial_quadrature(order, scale):
+    """
+    Nodes r_j and weights w_j of the mapped Gauss-Legendre rule on [0, inf).
+
+    sum_j w_j f(r_j) approximates the integral of f(r) dr; scale is L in
+    r = L t / (1 - t).  Arrays are read-only.
+    """
+    t, w = np.polynomial.legendre.leggauss(order)
+    t, w = (t + 1) / 2, w / 2
+    r = scale * t / (1 - t)
+    w = w * scale / (1 - t)**2
+    r.setflags(write=False)
+    w.setflags(write=False)
+    return r, w
+
+
+def default_order(n_max):
+    """Quadrature order used when none is given."""
+    return max(128, 16 * n_max)
+
+
+def _cache_path(cache_dir, n_max, k, Z, delta_l, order):  # pylint: disable=design
+    dl = "all" if delta_l is None else "_".join(f"{d:+d}" for d in delta_l)
+    return os.path.join(cache_dir, f"rk_v{ENGINE_VERSION}_nmax{n_max}_k{k!r}_Z{Z!r}_dl{dl}_N{order}.npy")
+
+
+@traced()
+def _compute(n_max, k, Z, delta_l, order):  # pylint: disable=too-many-locals
+    r, w = shared_radial_quadrature(order, 2.0 * n_max / Z)
+    R = radial_table(n_max, r, Z)
+    weighted = R * (w * r**(2 + k))
+    if delta_l is None:
+        return R @ weighted.T
+
+    l_of = np.array([l for _, l in state_list(n_max)])
+    rows = {l: np.flatnonzero(l_of == l) for l in range(n_max)}
+    table = np.zeros((len(l_of), len(l_of)))
+    for l, i in rows.items():
+        for d in delta_l:
+            j = rows.get(l + d)
+            if j is not None and j.size:
+                table[np.ix_(i, j)] = R[i] @ weighted[j].T
+    return table
+
+
+@traced()
+def radial_matrix_elements(n_max, k=1, Z=1, delta_l=None, order=None,  # pylint: disable=design
+                           cache_dir=DEFAULT_CACHE_DIR, cache=True):
+    """
+    Table of <n l | r^k | n' l'> = integral of R_nl R_n'l' r^(2+k) dr.
+
+    Parameters:
+        n_max (int): Largest principal quantum number.
+        k (float): Power of r (k > -3; k = 1 for dipole transitions).
+        Z (float): Nuclear charge.
+        delta_l (sequence of int, optional): Allowed l' - l, e.g. DIPOLE = (-1, 1).
+                Pairs outside it are not integrated and stay zero.  None computes every pair.
+        order (int, optional): Quadrature nodes; defaults to default_order(n_max).
+        cache_dir (str, optional): Directory for saved tables; None keeps them in memory only.
+        cache (bool): False always computes the table, without looking it up
+                      in or adding it to the memory and disk caches.
+
+    Returns:
+        ndarray: Read-only array of shape (S, S), S = n_max (n_max + 1) / 2, rows
+                 and columns following state_list(n_max), in units of a0^k.
+    """
+    if n_max < 1:
+        raise ValueError(f"n_max must be >= 1, got {n_max}.")
+    delta_l = None if delta_l is None else tuple(sorted(set(int(d) for d in delta_l)))
+    order = order or default_order(n_max)
+    key = (n_max, float(k), float(Z), delta_l, order)
+    if not cache:
+        table = _compute(*key)
+        table.setflags(write=False)
+        return table
+    table = _memo.get(key)
+    if table is not None:
+        _memo.move_to_end(key)
+        return table
+
+    path = _cache_path(cache_dir, *key) if cache_dir is not None else None
+    if path is not None and os.path.exists(path):
+        table = np.load(path)
+    else:
+        table = _compute(*key)
+        if path is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            _save_atomic(path, table)
+    table.setflags(write=False)
+    _memo[key] = table
+    if len(_memo) > MEMORY_ENTRIES:
+        _memo.popitem(last=False)
+    return table
+
+
+def dipole_radial_table(n_max, Z=1, cache_dir=DEFAULT_CACHE_DIR):
+    """<n l | r | n' l'> for the dipole-allowed pairs l' = l +- 1 (others zero)."""
+    return radial_matrix_elements(n_max, 1, Z, DIPOLE, cache_dir=cache_dir)
+
+
+def clear_memory_cache():
+    """Drops the in-memory tables (files in the cache directory are kept)."""
+    _memo.clear()
@@ -0,0 +1,218 @@
+"""
+Level-of-detail surfaces r = |Y_lm(theta, phi)| for the 3-D orbital figures.
+
+The surface is first sampled on a fine (theta, phi) mesh from the angular
+engine.  Whole theta and phi lines are then kept only where they are needed:
+each direction starts from a coarse uniform set of lines and an interval is
+bisected while the midpoint line deviates from the chord between its
+neighbours by more than tol anywhere along it (in units of the largest lobe
+radius, so tol is roughly the on-screen error as a fraction of the figure
+size).  Lobes that are smooth in one direction get few lines across it, and
+the cusps of |Y| at the nodal planes and cones keep the fine spacing.
+
+The result stays a tensor-product grid, so this is not local decimation: a
+line kept for one cusp runs across the whole surface, and a flat patch
+crossed by it keeps that resolution.  That is what ax.plot_surface needs;
+an adaptive triangulation would cut the triangle count further.
+
+reduce_orbital_surface (or orbital_surface_grid, which evaluates Y_lm
+first) returns the reduced grid as 2-D arrays for ax.plot_surface;
+orbital_mesh welds the seam, poles and origin into an indexed triangle
+mesh, and save_mesh writes it as binary PLY or as NumPy arrays.
+"""
+from collections import namedtuple
+import warnings
+
+import numpy as np
+
+from .angular import angular_mesh, harmonic_index, spherical_harmonics
+from .instrumentation import traced
+
+OrbitalMesh = namedtuple("OrbitalMesh", "vertices faces values")
+
+# Fine sampling the levels of detail are chosen from; 2^k + 1 lines so every
+# interval of a uniform seed can be bisected down to single steps.
+FINE_THETA = 257
+FINE_PHI = 513
+SEED_LINES = 17
+
+
+def _surface_points(Y):
+    """Cartesian points (3, n_phi, n_theta) of r = |Y| / max|Y| and the scaled signed Y."""
+    n_phi, n_theta = Y.shape
+    mesh = angular_mesh(n_theta, n_phi)
+    # For complex harmonics the shape is |Y| and the colour its real part.
+    values = Y.real if np.iscomplexobj(Y) else Y
+    scale = np.abs(Y).max()
+    r = np.abs(Y) / scale
+    phi = mesh.phi[:, None]
+    points = np.stack((r * mesh.sin_theta * np.cos(phi),
+                       r * mesh.sin_theta * np.sin(phi),
+                       r * mesh.cos_theta * np.ones_like(phi)))
+    return points, values / scale
+
+
+def _refine_lines(points, axis, tol):
+    """
+    Indices of the lines along axis (1 = phi, 2 = theta) needed for chord error <= tol.
+
+    A line is kept or dropped as a whole, judged by its worst point.
+    """
+    n = points.shape[axis]
+    keep = np.zeros(n, dtype=bool)
+    keep[np.linspace(0, n - 1, min(SEED_LINES, n)).astype(int)] = True
+    while True:
+        idx = np.flatnonzero(keep)
+        lo, hi = idx[:-1], idx[1:]
+        mid = (lo + hi) // 2
+        wide = hi - lo > 1
+        if not wide.any():
+            return idx
+        lo, hi, mid = lo[wide], hi[wide], mid[wide]
+        chord = (np.take(points, lo, axis) + np.take(points, hi, axis)) / 2
+        dev = np.sqrt(((np.take(points, mid, axis) - chord)**2).sum(axis=0))
+        err = dev.max(axis=0 if axis == 2 else 1)
+        split = err > tol
+        if not split.any():
+            return idx
+        keep[mid[split]] = True
+
+
+@traced()
+def reduce_orbital_surface(Y, tol=2e-3, max_triangles=None):
+    """
+    Reduced (theta, phi) grid of the surface r = |Y|, scaled so the largest lobe has radius 1.
+
+    Only whole theta rows and phi columns are dropped (see the module
+    docstring), so the grid is coarse only where a direction is smooth
+    everywhere along it.
+
+    Parameters:
+        Y (ndarray): One harmonic on angular_mesh(n_theta, n_phi), shape
+                     (n_phi, n_theta), e.g. a row of spherical_harmonics.
+        tol (float): Largest allowed deviation of the drawn surface from the
+                     full one, in units of the largest lobe radius.
+        max_triangles (int, optional): Triangle budget (two per grid quad);
+                     tol is loosened until the grid fits.
+
+    Returns:
+        tuple: x, y, z and the signed Y scaled to [-1, 1], each of shape
+               (n_phi_kept, n_theta_kept), ready for ax.plot_surface.
+    """
+    points, values = _surface_points(Y)
+    while True:
+        rows = _refine_lines(points, 2, tol)
+        cols = _refine_lines(points, 1, tol)
+        n_triangles = 2 * (rows.size - 1) * (cols.size - 1)
+        if max_triangles is None or n_triangles <= max_triangles:
+            break
+        if rows.size == min(SEED_LINES, Y.shape[1]) and cols.size == min(SEED_LINES, Y.shape[0]):
+            warnings.warn(f"reduce_orbital_surface: max_triangles={max_triangles} is below the "
+                          f"{n_triangles}-triangle seed grid")
+            break
+        tol *= 1.5
+    grid = np.ix_(cols, rows)
+    x, y, z = (p[grid] for p in points)
+    return x, y, z, values[grid]
+
+
+@traced()
+def orbital_surface_grid(l, m, tol=2e-3, max_triangles=None, kind="real",  # pylint: disable=design
+                         n_theta=FINE_THETA, n_phi=FINE_PHI):
+    """
+    reduce_orbital_surface for Y_lm sampled on the fine n_theta x n_phi mesh.
+
+    kind is 'real' or 'complex' (see angular); see reduce_orbital_surface
+    for the other arguments and the return value.
+    """
+    if l < 0 or abs(m) > l:
+        raise ValueError(f"Need l >= 0 and |m| <= l, got l={l}, m={m}.")
+    Y = spherical_harmonics(l, n_theta, n_phi, kind=kind)[harmonic_index(l, m)]
+    return reduce_orbital_surface(Y, tol, max_triangles)
+
+
+@traced()
+def orbital_mesh(l, m, tol=2e-3, max_triangles=None, kind="real",  # pylint: disable=design
+                 n_theta=FINE_THETA, n_phi=FINE_PHI):
+    """
+    Indexed triangle mesh of the surface r = |Y_lm| at a given level of detail.
+
+    Takes the same arguments as orbital_surface_grid.  The phi = 0 / 2 pi
+    seam, the two poles and every point at the origin are welded, degenerate
+    triangles (where a nodal plane or cone collapses a ring onto the origin)
+    are dropped and unused vertices removed.
+
+    Returns:
+        OrbitalMesh: vertices (float32, (N, 3)), faces (int32, (M, 3)) and
+                     the signed Y at each vertex scaled to [-1, 1] (float32, (N,)).
+    """
+    x, y, z, values = orbital_surface_grid(l, m, tol, max_triangles, kind, n_theta, n_phi)
+    n_ring, n_row = x.shape[0] - 1, x.shape[1]  # last phi column repeats the first
+
+    # Vertex layout: north pole, the interior theta rows ring by ring, south pole.
+    xyz = np.stack((x, y, z), axis=-1)[:n_ring]
+    vertices = np.concatenate((xyz[:1, 0], xyz[:, 1:-1].transpose(1, 0, 2).reshape(-1, 3),
+                               xyz[:1, -1]))
+    vals = np.concatenate((values[:1, 0], values[:n_ring, 1:-1].T.ravel(), values[:1, -1]))
+
+    def ring(k):  # vertex indices of interior theta row k (1..n_row-2)
+        return 1 + (k - 1) * n_ring + np.arange(n_ring)
+
+    south = vertices.shape[0] - 1
+    faces = []
+    a, b = ring(1), np.roll(ring(1), -1)
+    faces.append(np.column_stack((np.zeros(n_ring, dtype=int), a, b)))
+    for k in range(1, n_row - 2):
+        a, b = ring(k), np.roll(ring(k), -1)
+        c, d = ring(k + 1), np.roll(ring(k + 1), -1)
+        faces.append(np.column_stack((a, c, b)))
+        faces.append(np.column_stack((b, c, d)))
+    a, b = ring(n_row - 2), np.roll(ring(n_row - 2), -1)
+    faces.append(np.column_stack((a, np.full(n_ring, south), b)))
+    faces = np.concatenate(faces)
+
+    # Nodal planes and cones pass through the origin: weld every vertex there.
+    at_origin = np.flatnonzero(np.abs(vertices).max(axis=1) < 1e-12)
+    if at_origin.size:
+        remap = np.arange(vertices.shape[0])
+        remap[at_origin] = at_origin[0]
+        faces = remap[faces]
+
+    p0, p1, p2 = (vertices[faces[:, i]] for i in range(3))
+    area = np.linalg.norm(np.cross(p1 - p0, p2 - p0), axis=1)
+    faces = faces[area > 1e-14]
+    used, faces = np.unique(faces, return_inverse=True)
+    return OrbitalMesh(vertices[used].astype(np.float32),
+                       faces.reshape(-1, 3).astype(np.int32),
+                       vals[used].astype(np.float32))
+
+
+def save_mesh(mesh, path):
+    """
+    Writes an OrbitalMesh as binary little-endian PLY (.ply) or NumPy arrays (.npz).
+
+    The PLY file stores x, y, z and the signed value per vertex and the
+    triangle indices, which most mesh viewers (MeshLab, Blender, ParaView) read.
+    """
+    vertices, faces, values = mesh
+    if str(path).endswith(".npz"):
+        np.savez_compressed(path, vertices=vertices, faces=faces, values=values)
+        return
+    if not str(path).endswith(".ply"):
+        raise ValueError(f"Unsupported mesh format for {path!r}; use .ply or .npz.")
+
+    vertex = np.empty(len(vertices), dtype=[("x", "<f4"), ("y", "<f4"), ("z", "<f4"), ("value", "<f4")])
+    vertex["x"], vertex["y"], vertex["z"] = vertices.T
+    vertex["value"] = values
+    face = np.empty(len(faces), dtype=[("n", "u1"), ("index", "<i4", (3,))])
+    face["n"] = 3
+    face["index"] = faces
+    header = ("ply\nformat binary_little_endian 1.0\n"
+              f"element vertex {len(vertex)}\n"
+              "property float x\nproperty float y\nproperty float z\nproperty float value\n"
+              f"element face {len(face)}\n"
+              "property list uchar int vertex_indices\nend_header\n")
+    with open(path, "wb") as f:
+        f.write(header.encode("ascii"))
+        f.write(vertex.tobytes())
+        f.write(face.tobytes())
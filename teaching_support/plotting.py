@@ -0,0 +1,274 @@
+"""
+Figure builders for the teaching scripts.
+
+matplotlib (and seaborn, where used) is imported inside each function, so
+importing this module, or the numerical modules it draws on, stays cheap.
+Every function shows its figure and returns it, which lets the batch
+renderer save it afterwards.
+"""
+# pylint: disable=import-outside-toplevel
+import numpy as np
+
+from .adaptive_grid import adaptive_radial_grid
+from .angular import harmonic_index, harmonic_list, spherical_harmonics
+from .consecutive_kinetics import kinetic_features, kinetic_time_grid
+from .instrumentation import trace_span, traced
+from .orbital_mesh import orbital_surface_grid, reduce_orbital_surface
+from .radial_nodes import radial_nodes
+from .wavefunction_cache import cached_radial_wavefunction
+
+# Bohr radius in atomic units (a.u.)
+a0 = 1  # pylint: disable=invalid-name
+
+
+@traced()
+def plot_exponential_difference(k1, k2, t_max=None):
+    """
+    Plots exp(-k1 * t), exp(-k2 * t), and their difference.
+
+    Parameters:
+        k1 (float): Rate constant 1 (s⁻¹)
+        k2 (float): Rate constant 2 (s⁻¹)
+        t_max (float, optional): Maximum time for plotting (s).
+    """
+    import matplotlib.pyplot as plt
+
+    # Set default t_max based on slower rate
+    if t_max is None:
+        t_max = 10e-3/ min(k1, k2)
+
+    # Time array: log-spaced through the fast rise, linear over the slow decay
+    t = kinetic_time_grid(k1, k2, t_end=t_max, n_points=1000)
+
+    # Exponential terms
+    exp_k1 = np.exp(-k1 * t)
+    exp_k2 = np.exp(-k2 * t)
+    difference = exp_k1 - exp_k2
+
+    # Plotting
+    fig = plt.figure(figsize=(10, 6))
+    plt.plot(t, exp_k1, label=fr'$e^{{-k_1 t}},\ k_1 = {k1}\ \mathrm{{s^{{-1}}}}$', linestyle='--', color='tab:blue')
+    plt.plot(t, exp_k2, label=fr'$e^{{-k_2 t}},\ k_2 = {k2}\ \mathrm{{s^{{-1}}}}$', linestyle='--', color='tab:orange')
+    plt.plot(t, difference, label=r'$e^{-k_1 t} - e^{-k_2 t}$', linewidth=2, color='tab:green')
+
+    # Annotate peak of the difference at the analytic t_peak = ln(k2/k1)/(k2 - k1)
+    t_peak = float(kinetic_features(1.0, k1, k2)['t_max'])
+    peak = np.exp(-k1 * t_peak) - np.exp(-k2 * t_peak)
+    plt.annotate('Peak of intermediate',
+                 xy=(t_peak, peak),
+                 xytext=(t_peak + 0.05 * t_max, peak + 0.05),
+                 arrowprops={'facecolor': 'black', 'arrowstyle': '->'},
+                 fontsize=10)
+
+    # Display rate constants
+    rate_text = fr'$k_1 = {k1}\ \mathrm{{s^{{-1}}}},\ k_2 = {k2}\ \mathrm{{s^{{-1}}}}$'
+    plt.text(0.7 * t_max, 0.85, rate_text, fontsize=11, bbox={'facecolor': 'whitesmoke', 'edgecolor': 'gray'})
+
+    # Labels and formatting
+    plt.xlabel('Time (t)', fontsize=12)
+    plt.ylabel('Function Value', fontsize=12)
+    plt.title(r'Decay Curves and Intermediate Term ($k_2 \neq k_1$)', fontsize=14)
+    plt.grid(True, linestyle=':')
+    plt.legend(fontsize=10)
+    plt.tight_layout()
+    plt.show()
+    return fig
+
+
+@traced()
+def plot_radial_data(n, r_max=13, Z=1):
+    """Plots R_{nl}(r) with its nodes and r^2 |R_{nl}|^2 for every l of shell n."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    # Seaborn style for these two figures only, not for later plots in the process
+    with sns.axes_style('whitegrid'), sns.plotting_context('notebook'), sns.color_palette('bright'):
+        r = adaptive_radial_grid([(n, l) for l in range(n)], Z=Z, r_max=r_max)  # Radial grid
+        colors = sns.color_palette("tab10", n)  # Distinct colors for each ℓ
+
+        # --- Plot Radial Wavefunctions R_{nℓ}(r) ---
+        fig_R = plt.figure(figsize=(10, 6))
+        for l in range(n):
+            R = cached_radial_wavefunction(r, n, l, Z)  # Compute R_{nℓ}(r)
+            plt.plot(r / a0, R, label=fr'$\ell={l}$', linewidth=2, color=colors[l])  # Plot line
+
+            # Annotate curve with LaTeX label R_{n,l}(r)
+            idx = np.searchsorted(r, 0.8 * r_max)  # Choose a point near the right of the curve
+            plt.text(
+                r[idx] / a0,
+                R[idx],
+                fr'$R_{{{n},{l}}}(r)$',
+                fontsize=12,
+                color=colors[l]
+            )
+
+            # Annotate nodes (where R crosses zero)
+            for root in radial_nodes(n, l, Z, r=r):
+                plt.axvline(x=root / a0, color='gray', linestyle='--', alpha=0.6)
+                plt.text(root / a0 + 0.2, 0.02, f'{root:.2f}', fontsize=9, color='gray')
+
+        plt.title(fr'Radial Wavefunctions $R_{{n\ell}}(r)$ for $n={n}$', fontsize=15)
+        plt.xlabel(r'Radial distance $r / a_0$', fontsize=13)
+        plt.ylabel(r'$R_{n\ell}(r)$', fontsize=13)
+        plt.legend()
+        plt.tight_layout()
+        plt.show()
+
+        # --- Plot Radial Probability Densities r²|R_{nℓ}(r)|² ---
+        fig_P = plt.figure(figsize=(10, 6))
+        for l in range(n):
+            R = cached_radial_wavefunction(r, n, l, Z)
+            prob_density = r**2 * np.abs(R)**2  # Radial probability density
+            plt.plot(r / a0, prob_density, label=fr'$\ell={l}$', linewidth=2, color=colors[l])
+
+            # Optional annotation (similar to R_{nℓ}) can be added here if needed
+            idx = np.argmax(prob_density)
+            plt.text(
+                r[idx] / a0,
+                prob_density[idx],
+                fr'$r^2|R_{{{n},{l}}}(r)|^2$',
+                fontsize=12,
+                color=colors[l]
+            )
+
+        plt.title(fr'Radial Probability Densities $r^2 |R_{{n\ell}}(r)|^2$ for $n={n}$', fontsize=15)
+        plt.xlabel(r'Radial distance $r / a_0$', fontsize=13)
+        plt.ylabel(r'$r^2 |R_{n\ell}(r)|^2$', fontsize=13)
+        plt.legend()
+        plt.tight_layout()
+        plt.show()
+    return fig_R, fig_P
+
+
+@traced()
+def plot_potential(l, r_angstrom, V_centrifugal, V_coulomb, V_eff):
+    """Plot the effective potential and its components."""
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(9, 6), dpi=120)
+
+    # Plot each potential term
+    plt.plot(r_angstrom, V_centrifugal, label=r'Centrifugal Term', linestyle='dashed', color='royalblue', linewidth=2)
+    plt.plot(r_angstrom, V_coulomb, label=r'Coulomb Term', linestyle='dotted', color='crimson', linewidth=2)
+    plt.plot(r_angstrom, V_eff, label=r'Total Effective Potential', color='black', linewidth=2)
+
+    # Annotate l value inside the plot
+    plt.text(7, 3.6, f"Quantum Number $l = {l}$", fontsize=14,
+             bbox={'facecolor': 'lightyellow', 'edgecolor': 'black', 'boxstyle': 'round,pad=0.4'})
+
+    # Formatting the plot
+    plt.axhline(0, color='gray', linewidth=1, linestyle='--')
+    plt.xlabel(r'Radial Distance $r$ (Å)', fontsize=14, fontweight='bold')
+    plt.ylabel(r'Potential Energy $V_{\text{eff}}(r)$ (eV)', fontsize=14, fontweight='bold')
+    plt.title(f'Effective Potential for $l = {l}$ in a Hydrogen-like Atom', fontsize=16, fontweight='bold',
+              color='darkblue')
+
+    # Enhance legend
+    plt.legend(fontsize=12, loc='upper right', frameon=True, edgecolor='black')
+
+    # Improve grid visibility
+    plt.grid(True, linestyle="--", alpha=0.5)
+
+    # Adjust y-axis limits for better visualization
+    plt.ylim(-30, 50)
+
+    # Show the plot
+    plt.show()
+    return fig
+
+
+def _draw_orbital(ax, surface, title):
+    """Draws an (x, y, z, signed Y) surface grid, coloured blue/red by the sign of Y."""
+    import matplotlib.pyplot as plt
+
+    x, y, z, color_data = surface
+    colors = plt.cm.seismic((color_data + 1) / 2)
+    with trace_span("plot_surface", faces=int((x.shape[0] - 1) * (x.shape[1] - 1))):
+        ax.plot_surface(x, y, z, facecolors=colors,
+                        rstride=1, cstride=1, linewidth=0, antialiased=False, shade=False)
+    ax.set_title(title)
+    ax.set_box_aspect([1, 1, 1])
+
+
+@traced()
+def plot_real_orbital(l, m, tol=2e-3, max_triangles=None, title=None):
+    """
+    Plots the angular shape |Y_lm| of a real spherical harmonic, coloured by sign.
+
+    Parameters:
+        l (int): Degree.
+        m (int): Order, -l <= m <= l (m > 0 ~ cos(m phi), m < 0 ~ sin(|m| phi)).
+        tol (float): Surface error allowed by the level-of-detail mesh, as a
+                     fraction of the largest lobe radius.
+        max_triangles (int, optional): Triangle budget for the surface.
+        title (str, optional): Figure title.
+    """
+    import matplotlib.pyplot as plt
+
+    surface = orbital_surface_grid(l, m, tol, max_triangles)
+
+    fig = plt.figure(figsize=(8, 6))
+    ax = fig.add_subplot(111, projection='3d')
+    _draw_orbital(ax, surface, title or f"Real $Y_{{{l},{m}}}$")
+    ax.set_xlabel("x")
+    ax.set_ylabel("y")
+    ax.set_zlabel("z")
+    plt.tight_layout()
+    plt.show()
+    return fig
+
+
+@traced()
+def plot_orbital_gallery(l_max=3, n_theta=129, n_phi=129, tol=1e-2):
+    """
+    Plots every real Y_lm with l <= l_max, one row per l and one column per m.
+
+    All harmonics come from a single spherical_harmonics call on the cached
+    mesh; each panel is then drawn from its level-of-detail surface.
+    """
+    import matplotlib.pyplot as plt
+
+    Y = spherical_harmonics(l_max, n_theta, n_phi)
+    n_cols = 2 * l_max + 1
+
+    fig = plt.figure(figsize=(1.6 * n_cols, 1.6 * (l_max + 1)))
+    for l, m in harmonic_list(l_max):
+        ax = fig.add_subplot(l_max + 1, n_cols, l * n_cols + l_max + m + 1, projection='3d')
+        _draw_orbital(ax, reduce_orbital_surface(Y[harmonic_index(l, m)], tol), f"({l}, {m})")
+        ax.title.set_fontsize(8)
+        ax.set_axis_off()
+    plt.tight_layout()
+    plt.show()
+    return fig
+
+
+# Real harmonic order m of each p orbital (Y_11 ~ x, Y_1,-1 ~ y, Y_10 ~ z).
+_P_ORBITAL_M = {'x': 1, 'y': -1, 'z': 0}
+
+
+@traced()
+def plot_p_orbital(axis='z', tol=2e-3, max_triangles=None):
+    """Plots the angular shape of a p orbital along the given axis."""
+    import matplotlib.pyplot as plt
+
+    # Choose orbital based on axis
+    if axis not in _P_ORBITAL_M:
+        raise ValueError("Axis must be 'x', 'y', or 'z'")
+    title = {'z': "p\u2093 Orbital (Dumbbell Along z-axis)",
+             'x': "p\u2090 Orbital (Dumbbell Along x-axis)",
+             'y': "p\u2091 Orbital (Dumbbell Along y-axis)"}[axis]
+
+    # Level-of-detail surface of Y_1m: coarse over the lobes, fine at the nodal plane
+    surface = orbital_surface_grid(1, _P_ORBITAL_M[axis], tol, max_triangles)
+
+    # Plotting
+    fig = plt.figure(figsize=(8, 6))
+    ax = fig.add_subplot(111, projection='3d')
+    _draw_orbital(ax, surface, title)
+
+    ax.set_xlabel("x")
+    ax.set_ylabel("y")
+    ax.set_zlabel("z")
+    plt.tight_layout()
+    plt.show()
+    return fig
@@ -0,0 +1,115 @@
+"""
+Effective radial potential of hydrogen-like atoms.
+
+    V_eff(r) = hbar^2 l (l + 1) / (2 m_e r^2) - Z e^2 / (4 pi epsilon_0 r)
+
+effective_potential evaluates a whole (Z x l x r) block in one broadcast, in
+atomic units, eV with r in Angstrom, or SI, with the unit prefactors worked
+out once at import.  effective_potential_extrema gives the analytic minimum
+and zero crossing used to place annotations.
+
+The physical constants are written out (CODATA 2018, the values
+scipy.constants provides) so that this module needs nothing beyond NumPy.
+"""
+import numpy as np
+
+# pylint: disable=invalid-name
+hbar = 1.054571817e-34        # J s
+m_e = 9.1093837015e-31        # kg
+e = 1.602176634e-19           # C
+epsilon_0 = 8.8541878128e-12  # F m^-1
+# pylint: enable=invalid-name
+
+# Prefactors of l(l+1)/r^2 and Z/r in SI (J m^2 and J m).
+_CENTRIFUGAL_SI = hbar**2 / (2 * m_e)
+_COULOMB_SI = e**2 / (4 * np.pi * epsilon_0)
+
+bohr_radius = 4 * np.pi * epsilon_0 * hbar**2 / (m_e * e**2)  # m
+hartree = hbar**2 / (m_e * bohr_radius**2)                     # J
+
+# units -> (centrifugal prefactor, Coulomb prefactor, length unit in a0, energy unit in Eh)
+UNITS = {
+    "atomic": (0.5, 1.0, 1.0, 1.0),
+    "eV/angstrom": (_CENTRIFUGAL_SI / e * 1e20, _COULOMB_SI / e * 1e10,
+                    1e-10 / bohr_radius, e / hartree),
+    "SI": (_CENTRIFUGAL_SI, _COULOMB_SI, 1 / bohr_radius, 1 / hartree),
+}
+
+
+def _unit_factors(units):
+    try:
+        return UNITS[units]
+    except KeyError:
+        raise ValueError(f"Unknown units {units!r}; choose one of {sorted(UNITS)}.") from None
+
+
+def effective_potential(r, l, Z=1, units="eV/angstrom", out=None, components=False):  # pylint: disable=design
+    """
+    Computes V_eff(r) for many l values and nuclear charges in one broadcast.
+
+    Parameters:
+        r (array_like): 1-D radial grid (a0, Angstrom or m, following units).
+        l (int or array_like): Angular momentum quantum number(s).
+        Z (float or array_like): Nuclear charge(s).  An array adds a leading axis.
+        units (str): 'atomic' (Hartree, a0), 'eV/angstrom' or 'SI' (J, m).
+        out (ndarray, optional): Buffer of the result shape to write the total into.
+        components (bool): Also return the centrifugal and Coulomb terms.
+
+    Returns:
+        ndarray: Total potential of shape (len(l), len(r)), or
+                 (len(Z), len(l), len(r)) if Z is an array.  With
+                 components=True, a tuple (centrifugal, coulomb, total) whose
+                 first two broadcast against the total.
+    """
+    c_cent, c_coul = _unit_factors(units)[:2]
+    r = np.asarray(r, dtype=float)
+    l = np.atleast_1d(np.asarray(l))
+    Z = np.asarray(Z, dtype=float)
+    inv_r = 1.0 / r
+    inv_r2 = inv_r * inv_r
+
+    centrifugal = (c_cent * l * (l + 1))[:, None] * inv_r2            # (l, r)
+    coulomb = -(c_coul * Z)[..., None, None] * inv_r if Z.ndim else -(c_coul * Z) * inv_r
+    shape = np.broadcast_shapes(centrifugal.shape, np.shape(coulomb))
+    if out is None:
+        out = np.empty(shape)
+    elif out.shape != shape:
+        raise ValueError(f"out must have shape {shape}, got {out.shape}.")
+    np.add(centrifugal, coulomb, out=out)
+    if components:
+        return centrifugal, coulomb, out
+    return out
+
+
+def effective_potential_extrema(l, Z=1, units="eV/angstrom"):
+    """
+    Analytic landmarks of V_eff for l >= 1.
+
+    The minimum sits at r_min = l(l+1) a0 / Z with V_min = -Z^2 Eh / (2 l(l+1)),
+    and V_eff crosses zero at r_zero = r_min / 2.  For l = 0 there is no
+    minimum and all three entries are NaN.
+
+    Returns:
+        dict: Arrays 'r_min', 'V_min' and 'r_zero' broadcast over l and Z.
+    """
+    length, energy = _unit_factors(units)[2:]
+    l = np.asarray(l, dtype=float)
+    Z = np.asarray(Z, dtype=float)
+    ll1 = l * (l + 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ll1 = np.where(ll1 > 0, ll1, np.nan)
+        r_min = ll1 / Z / length
+        V_min = -Z**2 / (2 * ll1) / energy
+    return {"r_min": r_min, "V_min": V_min, "r_zero": r_min / 2}
+
+
+def V_eff(r, l):
+    """Compute the effective potential (J) for a given r (m) and l."""
+    total = effective_potential(np.atleast_1d(r), l, units="SI")[0]
+    return total if np.ndim(r) else float(total[0])
+
+
+def compute_potential_terms(l, r):
+    """Compute centrifugal, Coulomb, and total effective potentials (eV) for r in m."""
+    centrifugal, coulomb, total = effective_potential(np.asarray(r) * 1e10, l, components=True)
+    return centrifugal[0], coulomb, total[0]
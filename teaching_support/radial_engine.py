@@ -0,0 +1,146 @@
+"""
+Batched radial wavefunctions R_{nl}(r) of hydrogen-like atoms.
+
+Every state up to a chosen principal quantum number is generated in one pass
+on a shared radial grid.  The associated Laguerre polynomials are built with
+the three-term recurrence, seeded with the normalised prefactor
+N_{nl} exp(-rho/2) rho^l so that no factorial or power of rho is ever formed
+on its own.  The normalisation is taken from log-gamma, which keeps large n
+(n ~ 40 and beyond) free of overflow.
+"""
+import math
+
+import numpy as np
+
+from .instrumentation import traced
+
+# Revision of the values this module computes.  It is part of every on-disk
+# cache key (wavefunction_cache, matrix_elements); bump it whenever a change
+# alters the results, so arrays saved by earlier code are no longer used.
+ENGINE_VERSION = 1
+
+
+def state_list(n_max):
+    """Return the (n, l) pairs for n = 1..n_max in the row order of radial_table."""
+    return [(n, l) for n in range(1, n_max + 1) for l in range(n)]
+
+
+def state_index(n, l):
+    """Return the row of state (n, l) in the array returned by radial_table."""
+    return n * (n - 1) // 2 + l
+
+
+def _check_state(n, l):
+    if n < 1 or not 0 <= l < n:
+        raise ValueError(f"Invalid quantum numbers n={n}, l={l} (need n >= 1, 0 <= l < n).")
+
+
+def _log_norm(n, l, Z):
+    # log of sqrt((2Z/n)^3 (n-l-1)! / (2n (n+l)!))
+    return 0.5 * (3 * math.log(2 * Z / n) + math.lgamma(n - l)
+                  - math.log(2 * n) - math.lgamma(n + l + 1))
+
+
+def _log_prefactor(x, l, log_norm):
+    """log of N exp(-x/2) x^l, with x^0 taken as 1 at the origin."""
+    l = np.asarray(l)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        power = np.where(l == 0, 0.0, l * np.log(x))
+    return log_norm - x / 2 + power
+
+
+def _scaled_laguerre(k, alpha, x, w):
+    """w * L_k^(alpha)(x) via the three-term recurrence, starting from w * L_0 = w."""
+    prev = w
+    if k == 0:
+        return prev
+    cur = w * (1 + alpha - x)
+    for j in range(1, k):
+        prev, cur = cur, ((2 * j + 1 + alpha - x) * cur - (j + alpha) * prev) / (j + 1)
+    return cur
+
+
+@traced()
+def radial_wavefunction(r, n, l, Z=1):
+    """
+    Computes the radial wavefunction R_{nl}(r) for hydrogen-like atoms.
+
+    Parameters:
+        r (array_like): Radial distance(s) in units of a0 (r >= 0).
+        n (int): Principal quantum number (n >= 1).
+        l (int): Angular momentum quantum number (0 <= l < n).
+        Z (float): Nuclear charge.
+
+    Returns:
+        ndarray: R_{nl}(r) with the shape of r.
+    """
+    _check_state(n, l)
+    x = 2 * Z * np.asarray(r, dtype=float) / n
+    w = np.exp(_log_prefactor(x, l, _log_norm(n, l, Z)))
+    return _scaled_laguerre(n - l - 1, 2 * l + 1, x, w)
+
+
+def radial_probability_density(r, n, l, Z=1):
+    """Computes the radial probability density r^2 |R_{nl}(r)|^2."""
+    r = np.asarray(r, dtype=float)
+    return r**2 * radial_wavefunction(r, n, l, Z)**2
+
+
+@traced()
+def radial_shell(r, n, Z=1):
+    """
+    Computes R_{nl}(r) for every l = 0..n-1 of one shell in a single recurrence.
+
+    All rows share the scaled coordinate rho = 2Zr/n, so one sweep of the
+    Laguerre recurrence serves the whole shell; rows drop out of the sweep as
+    soon as their degree n-l-1 is reached.
+
+    Returns:
+        ndarray: Array of shape (n,) + r.shape, row l holding R_{nl}(r).
+    """
+    if n < 1:
+        raise ValueError(f"Invalid principal quantum number n={n} (need n >= 1).")
+    r = np.asarray(r, dtype=float)
+    x = 2 * Z * r.ravel() / n
+    l = np.arange(n)
+    log_norm = np.array([_log_norm(n, li, Z) for li in l])
+    alpha = (2 * l + 1)[:, None]
+    w = np.exp(_log_prefactor(x[None, :], l[:, None], log_norm[:, None]))
+
+    out = np.empty((n, x.size))
+    # Row l is finished once the recurrence reaches degree n-l-1, so the
+    # active block shrinks from the bottom (l = n-1 needs only L_0).
+    prev = w
+    out[n - 1] = prev[n - 1]
+    if n > 1:
+        cur = w[:n - 1] * (1 + alpha[:n - 1] - x)
+        out[n - 2] = cur[n - 2]
+        for j in range(1, n - 1):
+            m = n - j - 1  # rows still needing degree j+1
+            a = alpha[:m]
+            prev, cur = cur[:m], ((2 * j + 1 + a - x) * cur[:m] - (j + a) * prev[:m]) / (j + 1)
+            out[m - 1] = cur[m - 1]
+    return out.reshape((n,) + r.shape)
+
+
+@traced()
+def radial_table(n_max, r, Z=1):
+    """
+    Computes R_{nl}(r) for every state with n <= n_max on a shared grid.
+
+    Parameters:
+        n_max (int): Largest principal quantum number to include.
+        r (array_like): Radial grid in units of a0 (r >= 0).
+        Z (float): Nuclear charge.
+
+    Returns:
+        ndarray: Dense array of shape (n_max (n_max + 1) / 2,) + r.shape.
+                 Rows follow state_list(n_max); use state_index(n, l) to look
+                 up a single state.
+    """
+    r = np.asarray(r, dtype=float)
+    table = np.empty((n_max * (n_max + 1) // 2,) + r.shape)
+    for n in range(1, n_max + 1):
+        start = state_index(n, 0)
+        table[start:start + n] = radial_shell(r, n, Z)
+    return table
@@ -0,0 +1,121 @@
+"""
+Radial moments <r^k>_nl = integral of r^(2+k) |R_nl(r)|^2 dr by Gauss-Laguerre quadrature.
+
+With x = 2Zr/n the integrand of shell n is e^{-x} times a polynomial in x
+of degree 2(n-1) + 2 + k, so a Gauss-Laguerre rule with enough nodes is
+exact for integer k (and k = 0 gives the normalisation integral).  Each
+shell is sampled at its own scaled nodes r = n x/(2Z), all states up to
+n_max are stacked into one (state x node) matrix and every requested power
+k comes out of a single weighted contraction.  Nodes and weights are cached
+per order.
+
+hydrogenic_moment gives the closed forms (Kramers' recursion for k >= 1)
+to check against.
+"""
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from .instrumentation import traced
+from .radial_engine import _check_state, radial_shell, state_index, state_list
+
+# Beyond ~170 nodes exp(x) of the largest node overflows float64.
+MAX_ORDER = 160
+
+
+@lru_cache(maxsize=32)
+def gauss_laguerre(order):
+    """
+    Nodes x_j and scaled weights w_j e^{x_j} of the order-point Gauss-Laguerre rule.
+
+    The weights are scaled so that sum_j w_j e^{x_j} f(x_j) approximates the
+    integral of f over [0, inf) directly.  Arrays are read-only.
+    """
+    if not 1 <= order <= MAX_ORDER:
+        raise ValueError(f"Gauss-Laguerre order must be in 1..{MAX_ORDER}, got {order}.")
+    x, w = np.polynomial.laguerre.laggauss(order)
+    w = w * np.exp(x)
+    x.setflags(write=False)
+    w.setflags(write=False)
+    return x, w
+
+
+def _default_order(n_max, k):
+    k_max = max(0.0, float(np.max(k)))
+    return n_max + 2 + math.ceil(k_max / 2)
+
+
+@traced()
+def radial_moments(n_max, k=(0, 1, 2, -1), Z=1, order=None):
+    """
+    Computes <r^k> for every state with n <= n_max and every power in k.
+
+    Parameters:
+        n_max (int): Largest principal quantum number.
+        k (float or sequence): Power(s) of r; <r^k>_nl exists for k > -2l - 3.
+        Z (float): Nuclear charge.
+        order (int, optional): Number of quadrature nodes.  Defaults to the
+                               smallest order exact for integer k at n = n_max.
+
+    Returns:
+        ndarray: Shape (n_max (n_max + 1) / 2, len(k)) in units of a0^k, rows
+                 following state_list(n_max); a scalar k gives shape (states,).
+                 Moments that diverge are inf.
+    """
+    if n_max < 1:
+        raise ValueError(f"n_max must be >= 1, got {n_max}.")
+    powers = np.atleast_1d(np.asarray(k, dtype=float))
+    x, w = gauss_laguerre(order or _default_order(n_max, powers))
+
+    # (state x node) radial coordinates and |R|^2 dr weights, one shell at a time.
+    n_states = n_max * (n_max + 1) // 2
+    r = np.empty((n_states, x.size))
+    density = np.empty((n_states, x.size))
+    for n in range(1, n_max + 1):
+        rows = slice(state_index(n, 0), state_index(n, 0) + n)
+        r_n = n * x / (2 * Z)
+        r[rows] = r_n
+        density[rows] = radial_shell(r_n, n, Z)**2 * (n / (2 * Z) * w)
+
+    moments = np.einsum("sj,skj->sk", density, r[:, None, :]**(2 + powers[:, None]))
+    l = np.array([l for _, l in state_list(n_max)])
+    moments[powers[None, :] <= -2 * l[:, None] - 3] = np.inf
+    return moments[:, 0] if np.ndim(k) == 0 else moments
+
+
+def expectation_value(n, l, k=1, Z=1, order=None):
+    """<r^k> of a single state (n, l), in units of a0^k."""
+    _check_state(n, l)
+    if k <= -2 * l - 3:
+        return np.inf
+    x, w = gauss_laguerre(order or _default_order(n, k))
+    r = n * x / (2 * Z)
+    R = radial_shell(r, n, Z)[l]
+    return float(np.sum(r**(2 + k) * R**2 * w) * n / (2 * Z))
+
+
+def hydrogenic_moment(n, l, k, Z=1):
+    """
+    Closed-form <r^k>_nl for integer k >= -3, in units of a0^k.
+
+    k = -3, -2, -1 and 0 use the textbook expressions; higher powers follow
+    from Kramers' relation
+        (k+1)/n^2 <r^k> - (2k+1) <r^(k-1)> + k/4 ((2l+1)^2 - k^2) <r^(k-2)> = 0
+    (for Z = 1; <r^k> scales as Z^-k).
+    """
+    _check_state(n, l)
+    if k != int(k) or k < -3:
+        raise ValueError(f"Closed forms are available for integer k >= -3, got {k}.")
+    k = int(k)
+    if k == -3:
+        value = math.inf if l == 0 else 1 / (n**3 * l * (l + 0.5) * (l + 1))
+    elif k == -2:
+        value = 1 / (n**3 * (l + 0.5))
+    else:
+        # Kramers upward from <r^-1> = 1/n^2 and <r^0> = 1.
+        prev, cur = 1 / n**2, 1.0
+        for j in range(1, k + 1):
+            prev, cur = cur, n**2 / (j + 1) * ((2 * j + 1) * cur - j / 4 * ((2 * l + 1)**2 - j * j) * prev)
+        value = prev if k == -1 else cur
+    return value / Z**k
@@ -0,0 +1,103 @@
+"""
+Radial nodes of hydrogen-like wavefunctions from the Laguerre roots.
+
+The n-l-1 nodes of R_{nl} are the zeros of L_{n-l-1}^(2l+1)(rho) with
+rho = 2Zr/n.  They are obtained as eigenvalues of the symmetric tridiagonal
+Jacobi matrix of the Laguerre weight (Golub-Welsch) and optionally polished
+with Newton steps, so the cost depends on the number of nodes and not on
+any radial grid.
+"""
+import numpy as np
+
+from .instrumentation import traced
+
+
+def _jacobi_matrices(k, alpha):
+    """Stack of k x k Jacobi matrices, one per entry of alpha."""
+    alpha = np.asarray(alpha, dtype=float)[:, None]
+    j = np.arange(k)
+    J = np.zeros((alpha.shape[0], k, k))
+    J[:, j, j] = 2 * j + alpha + 1
+    if k > 1:
+        off = np.sqrt((j[1:]) * (j[1:] + alpha))
+        J[:, j[1:], j[:-1]] = off
+        J[:, j[:-1], j[1:]] = off
+    return J
+
+
+def _newton_polish(x, k, alpha, steps):
+    """Refine roots x of L_k^(alpha), using x L_k' = k L_k - (k + alpha) L_{k-1}."""
+    for _ in range(steps):
+        prev = np.ones_like(x)
+        cur = 1 + alpha - x
+        for j in range(1, k):
+            prev, cur = cur, ((2 * j + 1 + alpha - x) * cur - (j + alpha) * prev) / (j + 1)
+        deriv = (k * cur - (k + alpha) * prev) / x
+        x = x - cur / deriv
+    return x
+
+
+def laguerre_roots(k, alpha, polish=1):
+    """
+    Roots of the generalized Laguerre polynomials L_k^(alpha) for many alpha.
+
+    Parameters:
+        k (int): Polynomial degree (k >= 1).
+        alpha (array_like): One or more values of alpha > -1.
+        polish (int): Number of Newton steps applied to the eigenvalues.
+
+    Returns:
+        ndarray: Array of shape (len(alpha), k) with ascending roots per row.
+    """
+    alpha = np.atleast_1d(np.asarray(alpha, dtype=float))
+    x = np.linalg.eigvalsh(_jacobi_matrices(k, alpha))
+    if polish:
+        x = _newton_polish(x, k, alpha[:, None], polish)
+    return x
+
+
+@traced()
+def radial_nodes(n, l, Z=1, polish=1, r=None):
+    """
+    Computes the radial nodes of R_{nl}(r).
+
+    Parameters:
+        n (int): Principal quantum number.
+        l (int): Angular momentum quantum number.
+        Z (float): Nuclear charge.
+        polish (int): Newton steps used to refine the eigenvalue roots.
+        r (array_like, optional): Radial grid; only nodes inside its range are kept.
+
+    Returns:
+        ndarray: The n-l-1 node positions (units of a0) in ascending order.
+    """
+    if n < 1 or not 0 <= l < n:
+        raise ValueError(f"Invalid quantum numbers n={n}, l={l} (need n >= 1, 0 <= l < n).")
+    k = n - l - 1
+    if k == 0:
+        return np.empty(0)
+    nodes = laguerre_roots(k, [2 * l + 1], polish)[0] * n / (2 * Z)
+    if r is not None:
+        nodes = nodes[(nodes >= np.min(r)) & (nodes <= np.max(r))]
+    return nodes
+
+
+@traced()
+def all_radial_nodes(n_max, Z=1, polish=1):
+    """
+    Computes the radial nodes of every state with n <= n_max.
+
+    States sharing the node count k = n-l-1 are solved together as one
+    stacked eigenvalue problem.
+
+    Returns:
+        dict: Maps (n, l) to the ascending array of its node positions.
+    """
+    nodes = {(n, n - 1): np.empty(0) for n in range(1, n_max + 1)}
+    for k in range(1, n_max):
+        l = np.arange(n_max - k)
+        n = l + k + 1
+        x = laguerre_roots(k, 2 * l + 1, polish)
+        for li, ni, row in zip(l, n, x * (n / (2 * Z))[:, None]):
+            nodes[(int(ni), int(li))] = row
+    return nodes
@@ -0,0 +1,182 @@
+"""
+Stochastic ensembles of the consecutive reaction A -> X -> Z at small copy numbers.
+
+Every replicate starts with N0 molecules of A.  Two simulation methods are
+available, and both advance all replicates of a chunk together with array
+operations:
+
+    'ssa'   Gillespie's direct method.  Each pass of the loop fires one
+            event in every replicate still running.  Every replicate keeps
+            its own clock, and its state is credited to all output times it
+            skips over at once, through difference arrays.
+    'leap'  Leaps from one output time to the next.  The steps are first
+            order and the molecules do not interact, so over a leap of
+            length dt each A molecule independently ends as A, X or Z with
+            the probabilities conc_profiles(dt, 1, k1, k2), and each X
+            survives with probability exp(-k2 dt).  Binomial and
+            multinomial draws with these probabilities are exact for any dt.
+            The step therefore never has to resolve the fast 1/k2 timescale,
+            which makes this the method for the stiff k2 >> k1 regime.  The
+            cost is independent of N0.
+
+Replicates are simulated in chunks.  Chunk i draws from
+SeedSequence(seed).spawn(...)[i], so results do not depend on how many
+worker processes share the chunks.  Only running sums of the counts and
+their squares are kept, never the trajectories.  The ensemble mean
+converges to N0 times conc_profiles(t, 1, k1, k2).  The variance converges
+to N0 p (1 - p) for each species, where p is that species' fraction.
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .consecutive_kinetics import conc_profiles
+from .instrumentation import traced
+
+SPECIES = ("A", "X", "Z")
+
+EnsembleStatistics = namedtuple("EnsembleStatistics", "t mean variance replicates")
+EnsembleStatistics.__doc__ = """\
+Ensemble statistics of the molecule counts: mean and variance have shape
+(3, len(t)) with rows A, X, Z; replicates is the ensemble size they
+summarise.  The variance is the unbiased sample variance."""
+
+
+@traced()
+def _ssa_chunk(N0, k1, k2, t, n, seed):  # pylint: disable=design
+    """Sums and sums of squares of (A, X, Z) over n direct-method replicates."""
+    rng = np.random.default_rng(seed)
+    size = t.size + 1
+    diff = np.zeros((2, 3, size))      # difference arrays of the sums and of the squared sums
+    nA = np.full(n, N0, dtype=np.int64)
+    nX = np.zeros(n, dtype=np.int64)
+    time = np.full(n, t[0])
+    first = np.zeros(n, dtype=np.intp)  # first output time not yet credited
+    while nA.size:
+        a1 = k1 * nA
+        a0 = a1 + k2 * nX
+        with np.errstate(divide="ignore"):
+            t_next = time + rng.standard_exponential(nA.size) / a0
+        last = np.searchsorted(t, t_next, side="left")
+        # The current state holds on [time, t_next): credit it to the output
+        # times first..last-1 by adding at first and subtracting at last.
+        for s, count in enumerate((nA, nX, N0 - nA - nX)):
+            for p in (1, 2):
+                w = count.astype(float)**p
+                diff[p - 1, s] += (np.bincount(first, w, size) - np.bincount(last, w, size))
+        fire_1 = rng.random(nA.size) * a0 < a1
+        nA = nA - fire_1
+        nX = nX + np.where(fire_1, 1, -1)
+        running = last < t.size        # absorbed replicates have t_next = inf
+        nA, nX, time, first = nA[running], nX[running], t_next[running], last[running]
+    sums = np.cumsum(diff, axis=-1)[..., :-1]
+    return sums[0], sums[1]
+
+
+@traced()
+def _leap_chunk(N0, k1, k2, t, n, seed):  # pylint: disable=design
+    """Sums and sums of squares of (A, X, Z) over n replicates leaping between output times."""
+    rng = np.random.default_rng(seed)
+    sums = np.zeros((2, 3, t.size))
+    nA = np.full(n, N0, dtype=np.int64)
+    nX = np.zeros(n, dtype=np.int64)
+    dt = np.diff(t)
+    from_A = np.stack(conc_profiles(dt, 1.0, k1, k2), axis=-1)   # (T-1, 3) fates of one A
+    from_A[:, 2] = np.clip(1.0 - from_A[:, 0] - from_A[:, 1], 0.0, 1.0)
+    X_survives = np.exp(-k2 * dt)
+    for j in range(t.size):
+        if j:
+            fates = rng.multinomial(nA, from_A[j - 1] / from_A[j - 1].sum())
+            nX = rng.binomial(nX, X_survives[j - 1]) + fates[:, 1]
+            nA = fates[:, 0]
+        for s, count in enumerate((nA, nX, N0 - nA - nX)):
+            sums[0, s, j] = count.sum()
+            sums[1, s, j] = np.dot(count.astype(float), count)
+    return sums[0], sums[1]
+
+
+_METHODS = {"ssa": _ssa_chunk, "leap": _leap_chunk}
+
+
+def iter_ensemble(N0, k1, k2, t, replicates=1000, method="leap", seed=None, chunk_size=10000,  # pylint: disable=design
+                  workers=None):
+    """
+    Simulates the ensemble chunk by chunk, yielding the running statistics.
+
+    Parameters:
+        N0 (int): Initial number of A molecules in every replicate.
+        k1 (float): Rate constant of A -> X.
+        k2 (float): Rate constant of X -> Z.
+        t (array_like): Increasing output times; the first is the start time.
+        replicates (int): Ensemble size.
+        method (str): 'leap' (exact leaps between output times) or 'ssa'
+                      (Gillespie's direct method).
+        seed (int, optional): Root seed; equal seeds give equal results for
+                      any number of workers.
+        chunk_size (int): Replicates simulated together in one array pass.
+        workers (int, optional): Simulate chunks in this many worker
+                      processes; None or 1 runs them here.
+
+    Yields:
+        EnsembleStatistics: Statistics over the replicates finished so far,
+        after every chunk, in chunk order.
+    """
+    if method not in _METHODS:
+        raise ValueError(f"method must be 'leap' or 'ssa', got {method!r}.")
+    if replicates < 1 or chunk_size < 1:
+        raise ValueError(f"replicates and chunk_size must be >= 1, got {replicates} and {chunk_size}.")
+    t = np.asarray(t, dtype=float)
+    if t.ndim != 1 or np.any(np.diff(t) < 0):
+        raise ValueError("t must be a one-dimensional increasing array.")
+    sizes = [min(chunk_size, replicates - start) for start in range(0, replicates, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    simulate = _METHODS[method]
+    args = [(int(N0), float(k1), float(k2), t, n, s) for n, s in zip(sizes, seeds)]
+
+    total = np.zeros((2, 3, t.size))
+    done = 0
+
+    def statistics():
+        mean = total[0] / done
+        variance = (total[1] - done * mean**2) / max(done - 1, 1)
+        return EnsembleStatistics(t, mean, np.maximum(variance, 0.0), done)
+
+    if workers is None or workers == 1 or len(args) == 1:
+        results = (simulate(*a) for a in args)
+        for (s1, s2), n in zip(results, sizes):
+            total += (s1, s2)
+            done += n
+            yield statistics()
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(simulate, *a) for a in args]
+            for future, n in zip(futures, sizes):
+                s1, s2 = future.result()
+                total += (s1, s2)
+                done += n
+                yield statistics()
+
+
+@traced()
+def ensemble_statistics(N0, k1, k2, t, replicates=1000, method="leap", seed=None,  # pylint: disable=design
+                        chunk_size=10000, workers=None):
+    """
+    Mean and variance of the A, X and Z counts over a stochastic ensemble.
+
+    Takes the arguments of iter_ensemble and returns its final EnsembleStatistics.
+    """
+    stats = None
+    for stats in iter_ensemble(N0, k1, k2, t, replicates, method, seed, chunk_size, workers):
+        pass
+    return stats
+
+
+def binomial_statistics(N0, k1, k2, t):
+    """
+    Exact mean and variance of the counts, N0 p and N0 p (1 - p).
+
+    p comes from conc_profiles(t, 1, k1, k2).  Both arrays have shape (3, len(t)).
+    """
+    p = np.stack(conc_profiles(np.asarray(t, dtype=float), 1.0, k1, k2))
+    return N0 * p, N0 * p * (1 - p)
@@ -0,0 +1,236 @@
+"""
+Binary column tables for the computed quantities (wavefunctions, potentials,
+concentration profiles, angular grids).
+
+A table is a directory holding one raw little-endian file per column and a
+table.json header:
+
+    {"format": "teaching_support.table", "version": 1, "rows": 1000,
+     "columns": [{"name": "theta", "unit": "rad", "dtype": "<f8", "file": "0.bin"}, ...],
+     "metadata": {"grid": {"kind": "linspace", "start": 0, "stop": 3.14159, "num": 1000}}}
+
+metadata is free-form JSON for quantum numbers, rate constants, grid specs
+and the like.  Rows are appended by writing to the end of every column file,
+so a table can be streamed chunk by chunk; the header is rewritten after each
+chunk, so a reader never sees more rows than every column holds; reopening
+a table for appending cuts off what an interrupted append left past the
+header's row count.  Columns are
+read back as read-only np.memmap views, without parsing or copying.  CSV
+remains available as an export through export_csv.
+"""
+import csv
+import json
+import os
+
+import numpy as np
+
+FORMAT = "teaching_support.table"
+VERSION = 1
+HEADER = "table.json"
+
+
+def _write_header(path, header):
+    tmp = os.path.join(path, HEADER + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(header, fh, indent=2)
+    os.replace(tmp, os.path.join(path, HEADER))
+
+
+class TableWriter:
+    """
+    Streams rows into a binary column table.
+
+    Parameters:
+        path (str): Table directory; created if missing.
+        columns (sequence of str): Column names, in order.
+        units (dict, optional): Unit string per column name.
+        metadata (dict, optional): JSON-serialisable description of the data.
+        dtypes (dict, optional): NumPy dtype per column (default float64).
+        mode (str): 'w' starts a new table (an existing one is replaced);
+                    'a' appends to an existing table with the same columns.
+
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, path, columns=None, units=None, metadata=None, dtypes=None, mode="w"):  # pylint: disable=design
+        if mode not in ("w", "a"):
+            raise ValueError(f"mode must be 'w' or 'a', got {mode!r}.")
+        self.path = path
+        if mode == "a":
+            self.header = read_header(path)
+            names = [c["name"] for c in self.header["columns"]]
+            if columns is not None and list(columns) != names:
+                raise ValueError(f"Columns {list(columns)} do not match the table's {names}.")
+            # Drop bytes written after the last header update (an append that
+            # was interrupted part way), so the columns stay row-aligned.
+            for col in self.header["columns"]:
+                file = os.path.join(path, col["file"])
+                size = self.header["rows"] * np.dtype(col["dtype"]).itemsize
+                if os.path.getsize(file) < size:
+                    raise ValueError(f"Column file {file!r} holds fewer than {self.header['rows']} rows.")
+                os.truncate(file, size)
+        else:
+            if not columns:
+                raise ValueError("A new table needs at least one column.")
+            units, dtypes = units or {}, dtypes or {}
+            os.makedirs(path, exist_ok=True)
+            if os.path.exists(os.path.join(path, HEADER)):  # drop the replaced table's columns
+                for col in read_header(path)["columns"]:
+                    os.remove(os.path.join(path, col["file"]))
+            self.header = {
+                "format": FORMAT,
+                "version": VERSION,
+                "rows": 0,
+                "columns": [{"name": name, "unit": units.get(name, ""),
+                             "dtype": np.dtype(dtypes.get(name, float)).newbyteorder("<").str,
+                             "file": f"{i}.bin"}
+                            for i, name in enumerate(columns)],
+                "metadata": metadata or {},
+            }
+            for col in self.header["columns"]:
+                with open(os.path.join(path, col["file"]), "wb"):
+                    pass
+            _write_header(path, self.header)
+        # Kept open between appends; close() (or leaving the with block) closes them.
+        self._files = [open(os.path.join(path, col["file"]), "ab")  # pylint: disable=consider-using-with
+                       for col in self.header["columns"]]
+
+    def append(self, *arrays, **named):
+        """
+        Appends rows given as one array per column, positionally or by name.
+
+        Scalars are broadcast against the other columns.
+        """
+        cols = self.header["columns"]
+        if named:
+            if arrays:
+                raise TypeError("Pass the columns either positionally or by name, not both.")
+            missing = [c["name"] for c in cols if c["name"] not in named]
+            if missing or len(named) != len(cols):
+                raise ValueError(f"append needs exactly the columns {[c['name'] for c in cols]}.")
+            arrays = [named[c["name"]] for c in cols]
+        if len(arrays) != len(cols):
+            raise ValueError(f"Expected {len(cols)} columns, got {len(arrays)}.")
+        arrays = np.broadcast_arrays(*(np.asarray(a) for a in arrays))
+        for fh, col, a in zip(self._files, cols, arrays):
+            fh.write(np.ascontiguousarray(a.ravel(), dtype=col["dtype"]).tobytes())
+            fh.flush()
+        self.header["rows"] += arrays[0].size
+        _write_header(self.path, self.header)
+        return self
+
+    def close(self):
+        """Closes the column files; the header already holds every appended row."""
+        for fh in self._files:
+            fh.close()
+        self._files = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Table:
+    """
+    A binary column table opened for reading.
+
+    Columns are read-only np.memmap arrays (or in-memory copies with
+    mmap=False), looked up by name: table["theta"].  len(table) is the row
+    count; units and metadata come from the header.
+    """
+
+    def __init__(self, path, mmap=True):
+        self.path = path
+        self.header = read_header(path)
+        self.rows = self.header["rows"]
+        self.units = {c["name"]: c["unit"] for c in self.header["columns"]}
+        self.metadata = self.header["metadata"]
+        self._columns = {}
+        for col in self.header["columns"]:
+            file = os.path.join(path, col["file"])
+            if self.rows == 0:
+                data = np.empty(0, dtype=col["dtype"])
+            elif mmap:
+                data = np.memmap(file, dtype=col["dtype"], mode="r", shape=(self.rows,))
+            else:
+                data = np.fromfile(file, dtype=col["dtype"], count=self.rows)
+            self._columns[col["name"]] = data
+
+    @property
+    def columns(self):
+        """Column names in file order."""
+        return list(self._columns)
+
+    def __getitem__(self, name):
+        return self._columns[name]
+
+    def __len__(self):
+        return self.rows
+
+    def __repr__(self):
+        return f"Table({self.path!r}, rows={self.rows}, columns={self.columns})"
+
+
+def read_header(path):
+    """Returns the parsed table.json header of a table directory."""
+    with open(os.path.join(path, HEADER), encoding="utf-8") as fh:
+        header = json.load(fh)
+    if header.get("format") != FORMAT:
+        raise ValueError(f"{path!r} is not a {FORMAT} directory.")
+    if header.get("version", 0) > VERSION:
+        raise ValueError(f"{path!r} has table version {header['version']}; this code reads up to {VERSION}.")
+    return header
+
+
+def write_table(path, columns, units=None, metadata=None):
+    """
+    Writes a complete table in one call.
+
+    Parameters:
+        path (str): Table directory (replaced if it exists).
+        columns (dict): Column name -> array; every array must broadcast to the same shape.
+        units (dict, optional): Unit string per column name.
+        metadata (dict, optional): JSON-serialisable description of the data.
+
+    Returns:
+        Table: The table opened for reading.
+    """
+    dtypes = {name: np.asarray(a).dtype for name, a in columns.items()}
+    with TableWriter(path, list(columns), units, metadata, dtypes) as writer:
+        writer.append(**columns)
+    return Table(path)
+
+
+def read_table(path, mmap=True):
+    """Opens a table written by write_table or TableWriter."""
+    return Table(path, mmap=mmap)
+
+
+def linspace_spec(start, stop, num):
+    """Grid description for metadata: the arguments of np.linspace."""
+    return {"kind": "linspace", "start": float(start), "stop": float(stop), "num": int(num)}
+
+
+def export_csv(table, path, columns=None, chunk_rows=1 << 16, fmt=None):
+    """
+    Writes (some of) a table's columns as CSV, chunk by chunk.
+
+    The header row holds the column names, with the unit in parentheses
+    where one is set, e.g. "theta (rad)".  Values are written as the
+    shortest text that reads back to the same number, unless a
+    printf-style fmt such as "%.6e" is given.
+    """
+    if isinstance(table, str):
+        table = Table(table)
+    columns = list(columns or table.columns)
+    names = [f"{c} ({table.units[c]})" if table.units[c] else c for c in columns]
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        csv.writer(fh, lineterminator="\n").writerow(names)
+        for start in range(0, len(table), chunk_rows):
+            block = np.column_stack([table[c][start:start + chunk_rows] for c in columns])
+            if fmt is None:
+                fh.writelines(",".join(map(repr, row)) + "\n" for row in block.tolist())
+            else:
+                np.savetxt(fh, block, fmt=fmt, delimiter=",")
@@ -0,0 +1,114 @@
+"""
+Memoised radial wavefunctions shared between plots and runs.
+
+Arrays are keyed on (engine version, n, l, Z, grid fingerprint), held in
+memory under a byte budget with least-recently-used eviction, and optionally
+written to a cache directory so later runs load them instead of recomputing.
+Files are written under a temporary name and renamed into place, so a killed
+process never leaves a truncated array behind.  Set the
+WAVEFUNCTION_CACHE_DIR environment variable to give the default cache a
+directory.
+"""
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+from .radial_engine import ENGINE_VERSION, radial_wavefunction
+
+
+def grid_fingerprint(r):
+    """Return a short hex digest identifying the contents of a radial grid."""
+    r = np.ascontiguousarray(r, dtype=float)
+    h = hashlib.blake2b(digest_size=12)
+    h.update(str(r.shape).encode())
+    h.update(r.tobytes())
+    return h.hexdigest()
+
+
+def _save_atomic(path, array):
+    """np.save to path through a temporary file in the same directory."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            np.save(fh, array)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+class WavefunctionCache:
+    """
+    LRU cache of R_{nl}(r) arrays.
+
+    Parameters:
+        max_bytes (int): Memory budget for the in-memory arrays.  The least
+                         recently used entries are evicted once it is exceeded.
+        cache_dir (str, optional): Directory for persistent .npy copies.
+                                   Nothing is written to disk if omitted.
+    """
+
+    def __init__(self, max_bytes=256 * 2**20, cache_dir=None):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.nbytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _path(self, key):
+        version, n, l, Z, fp = key
+        return os.path.join(self.cache_dir, f"R_v{version}_n{n}_l{l}_Z{Z!r}_{fp}.npy")
+
+    def _store(self, key, R):
+        R.setflags(write=False)  # shared between callers, so never mutated in place
+        if R.nbytes > self.max_bytes:
+            return
+        self._entries[key] = R
+        self.nbytes += R.nbytes
+        while self.nbytes > self.max_bytes:
+            _, old = self._entries.popitem(last=False)
+            self.nbytes -= old.nbytes
+
+    def get(self, r, n, l, Z=1):
+        """Return R_{nl}(r), computing it only if no cached copy exists."""
+        key = (ENGINE_VERSION, n, l, float(Z), grid_fingerprint(r))
+        R = self._entries.get(key)
+        if R is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return R
+
+        path = self._path(key) if self.cache_dir is not None else None
+        if path is not None and os.path.exists(path):
+            R = np.load(path)
+            self.disk_hits += 1
+        else:
+            R = radial_wavefunction(r, n, l, Z)
+            self.misses += 1
+            if path is not None:
+                _save_atomic(path, R)
+        self._store(key, R)
+        return R
+
+    def clear(self):
+        """Drop every in-memory entry (files on disk are kept)."""
+        self._entries.clear()
+        self.nbytes = 0
+
+
+default_cache = WavefunctionCache(cache_dir=os.environ.get("WAVEFUNCTION_CACHE_DIR"))
+
+
+def cached_radial_wavefunction(r, n, l, Z=1):
+    """radial_wavefunction backed by the module-level default cache."""
+    return default_cache.get(r, n, l, Z)
@@ -1,19 +1,35 @@
+"""cos(theta) on a fine grid of theta, saved as a table."""
+import argparse
+
 import numpy as np
-import pandas as pd
 
-# Generate a fine grid of 1000 theta values from 0 to pi
-theta = np.linspace(0, np.pi, 1000)
-z = np.cos(theta)
+from teaching_support.tables import export_csv, linspace_spec, write_table
+
+
+def main(argv=None):
+    """Tabulate cos(theta) on a fine grid as a binary table, optionally exporting CSV."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--csv", action="store_true", help="also write cos_theta_fine_grid.csv")
+    args = parser.parse_args(argv)
+
+    # Generate a fine grid of 1000 theta values from 0 to pi
+    theta = np.linspace(0, np.pi, 1000)
+    z = np.cos(theta)
+
+    # Save as a binary column table (read back with teaching_support.tables.read_table)
+    table = write_table('cos_theta_fine_grid.tab', {'theta': theta, 'cos(theta)': z},
+                        units={'theta': 'rad'},
+                        metadata={'grid': linspace_spec(0, np.pi, 1000)})
 
-# Save to a DataFrame
-df = pd.DataFrame({
-    'theta (rad)': theta,
-    'cos(theta)': z
-})
+    # Export to CSV if needed
+    if args.csv:
+        export_csv(table, 'cos_theta_fine_grid.csv')
 
-# Export to CSV if needed
-df.to_csv('cos_theta_fine_grid.csv', index=False)
+    # Optional: Print first few rows
+    print(f"{'theta (rad)':>22s} {'cos(theta)':>22s}")
+    for row in zip(table['theta'][:5], table['cos(theta)'][:5]):
+        print(f"{row[0]:22.17g} {row[1]:22.17g}")
 
-# Optional: Print first few rows
-print(df.head())
 
+if __name__ == "__main__":
+    main()
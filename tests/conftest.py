@@ -0,0 +1,17 @@
+"""
+Shared pytest setup: the repository root on sys.path and a headless matplotlib.
+
+Run from the repository root with python -m pytest.
+"""
+import os
+import sys
+
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_DIR not in sys.path:
+    sys.path.insert(0, REPO_DIR)
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+# np.trapz was renamed np.trapezoid in NumPy 2.0; the CI matrix still runs 1.x.
+trapezoid = getattr(np, "trapezoid", None) or getattr(np, "trapz")
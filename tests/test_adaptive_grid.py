@@ -0,0 +1,42 @@
+"""adaptive_grid: the refined grid meets its interpolation tolerance."""
+import numpy as np
+import pytest
+
+from teaching_support.adaptive_grid import adaptive_radial_grid, tail_radius
+from teaching_support.radial_engine import radial_wavefunction
+
+STATES = [(1, 0), (3, 1), (5, 2), (6, 0)]
+
+
+def test_grid_is_sorted_from_the_origin():
+    r = adaptive_radial_grid(STATES)
+    assert r[0] == 0.0
+    assert np.all(np.diff(r) > 0)
+    assert r[-1] == pytest.approx(max(tail_radius(n) for n, _ in STATES))
+
+
+@pytest.mark.parametrize("tol", [1e-3, 1e-5])
+def test_linear_interpolation_meets_tolerance(tol):
+    r = adaptive_radial_grid(STATES, tol=tol)
+    check = np.linspace(0, r[-1], 200001)
+    for n, l in STATES:
+        exact = radial_wavefunction(check, n, l)
+        interpolated = np.interp(check, r, radial_wavefunction(r, n, l))
+        assert np.abs(interpolated - exact).max() <= 2 * tol * np.abs(exact).max()
+
+
+def test_tighter_tolerance_needs_more_points():
+    assert adaptive_radial_grid(STATES, tol=1e-5).size > adaptive_radial_grid(STATES, tol=1e-3).size
+
+
+def test_tail_has_decayed_at_r_max():
+    for n, l in STATES:
+        r = adaptive_radial_grid([(n, l)], tol=1e-4)
+        R = radial_wavefunction(r, n, l)
+        assert abs(R[-1]) < 1e-3 * np.abs(R).max()  # tail_radius is an estimate of where R falls to ~tol
+
+
+def test_max_points_is_respected_with_a_warning():
+    with pytest.warns(UserWarning, match="max_points"):
+        r = adaptive_radial_grid(STATES, tol=1e-8, max_points=300)
+    assert r.size <= 300
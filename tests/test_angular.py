@@ -0,0 +1,77 @@
+"""angular: orthonormality and conventions of the spherical harmonics engine."""
+import numpy as np
+import pytest
+import scipy.special
+
+from teaching_support.angular import (angular_mesh, harmonic_index, harmonic_list, legendre_table,
+                                      spherical_harmonic, spherical_harmonics)
+from tests.conftest import trapezoid
+
+L_MAX = 5
+
+
+def scipy_sph_harm(l, m, theta, phi):
+    """scipy's Y_l^m(theta, phi); sph_harm_y (SciPy >= 1.15) or the older sph_harm(m, l, phi, theta)."""
+    if hasattr(scipy.special, "sph_harm_y"):
+        return getattr(scipy.special, "sph_harm_y")(l, m, theta, phi)
+    return getattr(scipy.special, "sph_harm")(m, l, phi, theta)
+
+
+def gram_matrix(Y, mesh):
+    """<Y_i|Y_j> over the sphere by the trapezoidal rule on the plotting mesh."""
+    weights = np.sin(mesh.theta)[None, :]
+    integrand = np.einsum("ipt,jpt->ijpt", np.conj(Y), Y) * weights
+    return trapezoid(trapezoid(integrand, mesh.theta, axis=-1), mesh.phi, axis=-1)
+
+
+@pytest.mark.parametrize("kind", ["real", "complex"])
+def test_spherical_harmonics_are_orthonormal(kind):
+    Y = spherical_harmonics(L_MAX, n_theta=401, n_phi=201, kind=kind)
+    assert Y.shape == ((L_MAX + 1)**2, 201, 401)
+    gram = gram_matrix(Y, angular_mesh(401, 201))
+    np.testing.assert_allclose(gram, np.eye(len(Y)), atol=2e-4)
+
+
+@pytest.mark.parametrize("kind", ["real", "complex"])
+def test_gauss_quadrature_orthonormality(kind):
+    x, w = np.polynomial.legendre.leggauss(L_MAX + 1)
+    phi = np.linspace(0, 2 * np.pi, 2 * L_MAX + 2, endpoint=False)
+    theta, phi_grid = np.meshgrid(np.arccos(x), phi)
+    weights = w[None, :] * (2 * np.pi / phi.size)
+    Y = np.array([spherical_harmonic(l, m, theta, phi_grid, kind) for l, m in harmonic_list(L_MAX)])
+    gram = np.einsum("ipt,jpt,pt->ij", np.conj(Y), Y, weights)
+    np.testing.assert_allclose(gram, np.eye(len(Y)), atol=1e-13)
+
+
+@pytest.mark.parametrize("kind", ["real", "complex"])
+def test_table_matches_single_harmonics(kind):
+    Y = spherical_harmonics(4, n_theta=31, n_phi=17, kind=kind)
+    mesh = angular_mesh(31, 17)
+    theta, phi = np.meshgrid(mesh.theta, mesh.phi)
+    for l, m in harmonic_list(4):
+        np.testing.assert_allclose(Y[harmonic_index(l, m)], spherical_harmonic(l, m, theta, phi, kind),
+                                   atol=1e-13)
+
+
+def test_complex_convention_is_scipys():
+    theta = np.linspace(0, np.pi, 7)[:, None]
+    phi = np.linspace(0, 2 * np.pi, 9)[None, :]
+    for l, m in harmonic_list(6):
+        np.testing.assert_allclose(spherical_harmonic(l, m, theta, phi, "complex"),
+                                   scipy_sph_harm(l, m, theta, phi), atol=1e-13)
+
+
+def test_real_p_orbitals_point_along_the_axes():
+    assert spherical_harmonic(1, 1, np.pi / 2, 0.0) > 0           # p_x along +x
+    assert spherical_harmonic(1, -1, np.pi / 2, np.pi / 2) > 0    # p_y along +y
+    assert spherical_harmonic(1, 0, 0.0, 0.0) > 0                 # p_z along +z
+
+
+def test_high_degree_stays_finite():
+    P = legendre_table(300, np.linspace(-1, 1, 11))
+    assert np.all(np.isfinite(P))
+
+
+def test_invalid_order_raises():
+    with pytest.raises(ValueError):
+        spherical_harmonic(2, 3, 0.0, 0.0)
@@ -0,0 +1,86 @@
+"""batch_render: jobs render headlessly, failures are reported, the manifest is written."""
+import json
+import os
+
+import matplotlib.pyplot as plt
+
+from teaching_support.batch_render import render_batch, render_job
+
+GOOD = {"name": "intermediate", "function": "teaching_support.plotting:plot_exponential_difference",
+        "params": {"k1": 0.5, "k2": 2.0}}
+BAD = {"name": "broken", "function": "teaching_support.plotting:no_such_figure"}
+
+
+def test_render_job_saves_every_format(tmp_path):
+    entry = render_job(GOOD, str(tmp_path), formats=("png", "svg"), dpi=50)
+    assert entry["status"] == "ok" and not entry["cached"]
+    assert sorted(os.path.basename(p) for p in entry["outputs"]) == ["intermediate.png", "intermediate.svg"]
+    assert all(os.path.getsize(p) > 0 for p in entry["outputs"])
+
+
+def test_broken_job_is_reported_not_raised(tmp_path):
+    entry = render_job(BAD, str(tmp_path))
+    assert entry["status"] == "error"
+    assert "AttributeError" in entry["error"]
+    assert not entry["outputs"]
+
+
+def test_render_batch_writes_a_manifest(tmp_path):
+    out_dir = tmp_path / "figures"
+    manifest = render_batch([GOOD, BAD], out_dir=str(out_dir), workers=2, dpi=50, cache_dir=None)
+    assert manifest["failed"] == 1
+    assert [job["status"] for job in manifest["jobs"]] == ["ok", "error"]
+    assert (out_dir / "intermediate.png").exists()
+    with open(out_dir / "manifest.json", encoding="utf-8") as fh:
+        assert json.load(fh)["failed"] == 1
+
+
+def test_second_batch_is_served_from_the_cache(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    first = render_batch([GOOD], out_dir=str(tmp_path / "a"), workers=1, dpi=50, cache_dir=cache_dir)
+    second = render_batch([GOOD], out_dir=str(tmp_path / "b"), workers=1, dpi=50, cache_dir=cache_dir)
+    assert first["cache"]["hits"] == 0 and second["cache"]["hits"] == 1
+    a, b = (tmp_path / d / "intermediate.png" for d in "ab")
+    assert a.read_bytes() == b.read_bytes()
+
+
+SCRIPT = '''
+import matplotlib.pyplot as plt
+plt.style.use("ggplot")
+plt.plot([0, 1], [0, float(input("slope? "))])
+plt.savefig("own_figure.png")
+with open("notes.txt", "w") as fh:
+    fh.write("written by the script")
+plt.show()
+'''
+
+
+def test_files_a_script_saves_are_outputs_and_cached(tmp_path):
+    script = tmp_path / "draw.py"
+    script.write_text(SCRIPT)
+    job = {"name": "scripted", "script": str(script), "inputs": ["2"]}
+    cache_dir = str(tmp_path / "cache")
+    first_dir, second_dir = tmp_path / "first", tmp_path / "second"
+    first_dir.mkdir()
+    second_dir.mkdir()
+
+    first = render_job(job, str(first_dir), dpi=50, cache_dir=cache_dir)
+    assert first["status"] == "ok", first.get("traceback")
+    names = sorted(os.path.basename(p) for p in first["outputs"])
+    assert names == ["notes.txt", "own_figure.png", "scripted.png"]
+    assert sorted(p.name for p in first_dir.iterdir()) == names  # the private working directory is gone
+
+    second = render_job(job, str(second_dir), dpi=50, cache_dir=cache_dir)
+    assert second["cached"]
+    assert sorted(p.name for p in second_dir.iterdir()) == names
+    assert (second_dir / "notes.txt").read_text() == "written by the script"
+
+
+def test_script_key_ignores_the_worker_style(tmp_path):
+    script = tmp_path / "draw.py"
+    script.write_text(SCRIPT)
+    job = {"name": "scripted", "script": str(script), "inputs": ["2"]}
+    cache_dir = str(tmp_path / "cache")
+    render_job(job, str(tmp_path), dpi=50, cache_dir=cache_dir)
+    with plt.rc_context({"lines.linewidth": 9}):  # the script picks its own style
+        assert render_job(job, str(tmp_path), dpi=50, cache_dir=cache_dir)["cached"]
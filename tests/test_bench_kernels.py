@@ -0,0 +1,61 @@
+"""benchmarks/bench_kernels.py: measurement, history comparison and the command line."""
+import importlib.util
+import os
+
+import pytest
+
+from tests.conftest import REPO_DIR
+
+_SPEC = importlib.util.spec_from_file_location("bench_kernels",
+                                               os.path.join(REPO_DIR, "benchmarks", "bench_kernels.py"))
+bench = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(bench)
+
+
+def test_measure_reports_time_and_memory():
+    result = bench.measure(lambda: bytearray(1 << 20), repeat=2, min_time=0.01)
+    assert result["seconds"] > 0
+    assert result["peak_bytes"] >= 1 << 20
+
+
+def test_compare_flags_regressions(capsys):
+    base = {"results": {"a": {"seconds": 1.0}, "b": {"seconds": 1.0}, "c": {"seconds": 1.0}}}
+    head = {"results": {"a": {"seconds": 1.5}, "b": {"seconds": 1.1}, "d": {"seconds": 1.0}}}
+    assert bench.compare(base, head, threshold=0.2) == ["a"]
+    assert "SLOWER" in capsys.readouterr().out
+
+
+def test_history_round_trip_and_lookup(tmp_path):
+    path = str(tmp_path / "history.json")
+    assert bench.load_history(path) == []
+    runs = [{"commit": "abc123", "results": {}}, {"commit": "def456", "results": {}}]
+    bench.save_history(path, runs)
+    history = bench.load_history(path)
+    assert bench.find_run(history, "#0")["commit"] == "abc123"
+    assert bench.find_run(history, "def456")["commit"] == "def456"
+    with pytest.raises(SystemExit):
+        bench.find_run(history, "0123456789")
+
+
+def test_list_and_run_one_case(tmp_path, capsys):
+    assert bench.main(["--list", "--quick", "-k", "conc_profiles*"]) == 0
+    listed = capsys.readouterr().out.split()
+    assert listed and all(case.startswith("conc_profiles") for case in listed)
+
+    history = str(tmp_path / "history.json")
+    assert bench.main(["--quick", "-k", "conc_profiles*", "--repeat", "1", "--history", history]) == 0
+    assert list(bench.load_history(history)[0]["results"]) == listed
+
+
+def test_listing_builds_no_inputs(monkeypatch, capsys):
+    monkeypatch.setattr(bench, "synthetic_kinetics", lambda *args: pytest.fail("inputs built for --list"))
+    monkeypatch.setattr(bench, "Mechanism", lambda *args: pytest.fail("inputs built for --list"))
+    assert bench.main(["--list"]) == 0
+    assert "fit_consecutive[D=1000,T=60]" in capsys.readouterr().out.split("\n")
+
+
+def test_filter_treats_brackets_literally():
+    cases = bench.build_cases(quick=True)
+    assert bench.select_cases(cases, "conc_profiles[N=1000]") == ["conc_profiles[N=1000]"]
+    assert bench.select_cases(cases, "radial_table[n_max=10,*") == ["radial_table[n_max=10,N=1000]",
+                                                                    "radial_table[n_max=10,N=10000]"]
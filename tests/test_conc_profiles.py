@@ -0,0 +1,65 @@
+"""consecutive_kinetics.conc_profiles: broadcasting sweeps and the k1 = k2 limit."""
+import numpy as np
+import pytest
+
+from teaching_support.consecutive_kinetics import conc_profiles, profile_derivatives
+
+
+def textbook(t, A0, k1, k2):
+    """The closed form of [A], [X] and [Z] for k1 != k2."""
+    A = A0 * np.exp(-k1 * t)
+    X = A0 * k1 / (k2 - k1) * (np.exp(-k1 * t) - np.exp(-k2 * t))
+    return A, X, A0 - A - X
+
+
+def test_matches_textbook_solution():
+    t = np.linspace(0, 20, 401)
+    for got, expected in zip(conc_profiles(t, 2.0, 0.3, 1.7), textbook(t, 2.0, 0.3, 1.7)):
+        np.testing.assert_allclose(got, expected, rtol=1e-12, atol=1e-15)
+
+
+def test_parameter_sweep_broadcasts_like_a_loop():
+    t = np.linspace(0, 10, 50)
+    k1 = np.array([0.1, 1.0, 3.0])[:, None, None]
+    k2 = np.array([0.5, 1.0])[None, :, None]
+    A, X, Z = conc_profiles(t, 1.5, k1, k2)
+    assert A.shape == X.shape == Z.shape == (3, 2, 50)
+    for i, a in enumerate(k1.ravel()):
+        for j, b in enumerate(k2.ravel()):
+            np.testing.assert_array_equal(X[i, j], conc_profiles(t, 1.5, a, b)[1])
+    np.testing.assert_allclose(A + X + Z, 1.5, rtol=1e-14)
+
+
+def test_equal_rate_constants_are_exact_and_continuous():
+    t = np.linspace(0, 30, 301)
+    k = 0.7
+    X_equal = conc_profiles(t, 1.0, k, k)[1]
+    np.testing.assert_allclose(X_equal, k * t * np.exp(-k * t), rtol=1e-14)
+    for eps in (1e-12, 1e-8, -1e-8):
+        np.testing.assert_allclose(conc_profiles(t, 1.0, k, k * (1 + eps))[1], X_equal,
+                                   rtol=10 * abs(eps) * t.max(), atol=1e-15)
+
+
+def test_out_buffers_and_chunks_give_the_same_result():
+    t = np.linspace(0, 5, 1001)
+    expected = conc_profiles(t, 1.0, 2.0, 0.5)
+    out = tuple(np.empty_like(t) for _ in range(3))
+    result = conc_profiles(t, 1.0, 2.0, 0.5, out=out, chunk_size=64)
+    assert all(r is o for r, o in zip(result, out))
+    for got, want in zip(out, expected):
+        np.testing.assert_array_equal(got, want)
+
+
+@pytest.mark.parametrize("k1, k2", [(0.4, 1.3), (1.3, 0.4), (0.9, 0.9)])
+def test_derivatives_match_finite_differences(k1, k2):
+    t = np.linspace(0.1, 8, 40)
+    params = np.array([1.2, k1, k2])
+    jac = profile_derivatives(t, *params)
+    assert jac.shape == (3, 3, t.size)
+    for j in range(3):
+        h = 1e-6 * params[j]
+        up, down = params.copy(), params.copy()
+        up[j] += h
+        down[j] -= h
+        numeric = (np.array(conc_profiles(t, *up)) - np.array(conc_profiles(t, *down))) / (2 * h)
+        np.testing.assert_allclose(jac[:, j], numeric, rtol=1e-5, atol=1e-8)
@@ -0,0 +1,43 @@
+"""density_volume: memory-mapped |psi|^2 volumes and their isosurfaces."""
+import numpy as np
+import pytest
+
+from teaching_support.angular import spherical_harmonic
+from teaching_support.density_volume import density_volume, isosurface_level, wavefunction_values
+from teaching_support.radial_engine import radial_wavefunction
+
+
+def test_wavefunction_values_at_a_point():
+    x, y, z = 0.3, -1.2, 0.8
+    r = np.sqrt(x * x + y * y + z * z)
+    expected = radial_wavefunction(r, 3, 2) * spherical_harmonic(2, -1, np.arccos(z / r), np.arctan2(y, x))
+    assert wavefunction_values(x, y, z, 3, 2, -1) == pytest.approx(expected)
+
+
+def test_volume_is_normalised_and_memory_mapped(tmp_path):
+    path = str(tmp_path / "2p.npy")
+    volume = density_volume(path, 2, 1, 0, size=64, extent=16, workers=1, slab=5)
+    assert isinstance(volume.data, np.memmap) and volume.data.shape == (64, 64, 64)
+    dx = volume.axis[1] - volume.axis[0]
+    assert float(volume.data.sum(dtype=float)) * dx**3 == pytest.approx(1.0, abs=0.02)
+    np.testing.assert_array_equal(np.load(path), volume.data)
+
+
+def test_worker_processes_give_the_same_volume(tmp_path):
+    serial = density_volume(str(tmp_path / "a.npy"), 3, 2, 1, size=24, workers=1, slab=4)
+    pooled = density_volume(str(tmp_path / "b.npy"), 3, 2, 1, size=24, workers=2, slab=4)
+    np.testing.assert_array_equal(serial.data, pooled.data)
+
+
+def test_isosurface_level_encloses_the_fraction(tmp_path):
+    volume = density_volume(str(tmp_path / "2p.npy"), 2, 1, 1, size=64, extent=16, workers=1)
+    data = np.asarray(volume.data, dtype=float)
+    for fraction in (0.5, 0.9):
+        level = isosurface_level(volume, fraction)
+        enclosed = data[data >= level].sum() / data.sum()
+        assert fraction <= enclosed < fraction + 0.01
+
+
+def test_invalid_order_raises(tmp_path):
+    with pytest.raises(ValueError):
+        density_volume(str(tmp_path / "bad.npy"), 2, 1, 2, size=4)
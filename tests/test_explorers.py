@@ -0,0 +1,58 @@
+"""explorers: the slider figures update their artists in place."""
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from teaching_support.consecutive_kinetics import conc_profiles, kinetic_features, kinetic_time_grid
+from teaching_support.explorers import KineticsExplorer, PotentialExplorer
+from teaching_support.potentials import effective_potential
+
+
+def test_kinetics_explorer_draws_the_profiles():
+    explorer = KineticsExplorer(A0=1.0, k1=0.5, k2=5.0)
+    try:
+        explorer.update(k1=2.0, A0=1.5)
+        t = explorer.lines[0].get_xdata()
+        for line, expected in zip(explorer.lines, conc_profiles(t, 1.5, 2.0, 5.0)):
+            np.testing.assert_allclose(line.get_ydata(), expected)
+        features = kinetic_features(1.5, 2.0, 5.0)
+        assert explorer.peak.get_xdata()[0] == pytest.approx(float(features["t_max"]))
+        assert explorer.peak.get_ydata()[0] == pytest.approx(float(features["X_max"]))
+    finally:
+        plt.close(explorer.fig)
+
+
+def test_kinetics_slider_moves_rate_constants_on_a_log_scale():
+    explorer = KineticsExplorer()
+    try:
+        explorer.sliders["k2"].set_val(1.0)
+        assert explorer.k2 == pytest.approx(10.0)
+        assert explorer.sliders["k2"].valtext.get_text() == "10"
+    finally:
+        plt.close(explorer.fig)
+
+
+def test_potential_explorer_updates_l_and_z():
+    explorer = PotentialExplorer(l=1, Z=1)
+    try:
+        explorer.update(l=2, Z=3)
+        expected = effective_potential(explorer.r, 2, Z=3)[0]
+        np.testing.assert_allclose(explorer.lines[2].get_ydata(), expected)
+        assert explorer.minimum.get_xdata()[0] == pytest.approx(explorer.r[np.argmin(expected)], rel=0.02)
+    finally:
+        plt.close(explorer.fig)
+
+
+def test_kinetics_explorer_resolves_a_fast_rise():
+    explorer = KineticsExplorer(A0=1.0, k1=0.01, k2=0.01, t_end=1000.0)
+    try:
+        t, buffers = explorer.t, explorer.buffers
+        explorer.update(k1=1000.0)
+        assert explorer.t is t and explorer.buffers is buffers and t.size == 500
+        np.testing.assert_allclose(explorer.lines[1].get_xdata(), kinetic_time_grid(1000.0, 0.01, 1000.0, 500))
+        assert t[-1] == pytest.approx(1000.0)
+        assert np.count_nonzero(t < 5 / 1000.0) > 50  # the rise of [X] within a few 1/k1
+        X = explorer.lines[1].get_ydata()
+        assert X.max() == pytest.approx(float(kinetic_features(1.0, 1000.0, 0.01)["X_max"]), rel=1e-3)
+    finally:
+        plt.close(explorer.fig)
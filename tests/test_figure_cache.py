@@ -0,0 +1,104 @@
+"""figure_cache: stable keys, and savefig served from the cache on a hit."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+
+from teaching_support.figure_cache import FigureCache, code_fingerprint, figure_key
+
+
+class CountingFigure:  # pylint: disable=too-few-public-methods
+    """Stands in for a matplotlib figure: savefig writes fixed bytes and is counted."""
+
+    def __init__(self, payload=b"figure"):
+        self.payload = payload
+        self.calls = 0
+
+    def savefig(self, path, **kwargs):
+        """Writes the payload and the keyword arguments to path."""
+        self.calls += 1
+        with open(path, "wb") as fh:
+            fh.write(self.payload + repr(sorted(kwargs.items())).encode())
+
+
+def test_key_depends_on_params_code_and_style(tmp_path):
+    source = tmp_path / "figure.py"
+    source.write_text("x = 1\n")
+    key = figure_key({"k1": 1.0}, [str(source)], style="a")
+    assert key == figure_key({"k1": 1.0}, [str(source)], style="a")
+    assert key != figure_key({"k1": 2.0}, [str(source)], style="a")
+    assert key != figure_key({"k1": 1.0}, [str(source)], style="b")
+    fingerprint = code_fingerprint(str(source))
+    source.write_text("x = 2\n")
+    assert code_fingerprint(str(source)) != fingerprint
+    assert key != figure_key({"k1": 1.0}, [str(source)], style="a")
+
+
+def test_key_follows_the_active_style():
+    key = figure_key({"k1": 1.0})
+    with plt.rc_context({"lines.linewidth": 7}):
+        assert figure_key({"k1": 1.0}) != key
+    assert figure_key({"k1": 1.0}) == key
+
+
+def test_savefig_hit_skips_rendering(tmp_path):
+    cache = FigureCache(str(tmp_path / "cache"))
+    fig = CountingFigure()
+    path = str(tmp_path / "out" / "plot.png")
+    os.makedirs(os.path.dirname(path))
+
+    assert cache.savefig(fig, path, params={"n": 3}, dpi=100) == path
+    assert fig.calls == 1 and cache.stats()["misses"] == 1
+    with open(path, "rb") as fh:
+        rendered = fh.read()
+
+    os.remove(path)
+    assert cache.savefig(fig, path, params={"n": 3}, dpi=100) == path
+    assert fig.calls == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+    with open(path, "rb") as fh:
+        assert fh.read() == rendered
+
+    cache.savefig(fig, path, params={"n": 3}, dpi=200)  # other savefig options: a new render
+    assert fig.calls == 2
+
+
+def test_store_lookup_and_restore(tmp_path):
+    cache = FigureCache(str(tmp_path / "cache"))
+    files = []
+    for name in ("a.png", "a.pdf"):
+        files.append(tmp_path / name)
+        files[-1].write_bytes(name.encode())
+    assert cache.lookup("ab" * 32) is None
+    cache.store("ab" * 32, [str(f) for f in files])
+    assert [os.path.basename(p) for p in cache.lookup("ab" * 32)] == ["a.pdf", "a.png"]
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    restored = cache.restore("ab" * 32, str(dest))
+    assert sorted(os.path.basename(p) for p in restored) == ["a.pdf", "a.png"]
+    assert (dest / "a.png").read_bytes() == b"a.png"
+    assert os.listdir(tmp_path / "cache" / "ab") == ["ab" * 32]
+
+
+def test_concurrent_stores_of_one_key(tmp_path):
+    source = tmp_path / "a.png"
+    source.write_bytes(b"png")
+    cache = FigureCache(str(tmp_path / "cache"))
+    key = "cd" * 32
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: cache.store(key, [str(source)]), range(32)))
+    assert [os.path.basename(p) for p in cache.lookup(key)] == ["a.png"]
+    assert os.listdir(tmp_path / "cache" / "cd") == [key]  # no temporary directories left
+
+
+def test_relative_cache_dir_survives_a_chdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cache = FigureCache(".figure_cache")
+    (tmp_path / "job").mkdir()
+    monkeypatch.chdir(tmp_path / "job")
+    source = tmp_path / "a.png"
+    source.write_bytes(b"png")
+    cache.store("ef" * 32, [str(source)])
+    assert cache.cache_dir == str(tmp_path / ".figure_cache")
+    assert cache.lookup("ef" * 32) is not None
+    assert not (tmp_path / "job" / ".figure_cache").exists()
@@ -0,0 +1,98 @@
+"""instrumentation: spans cost nothing when off and nest, time and flush when on."""
+# pylint: disable=protected-access  # the tests record into in-memory _Recorder instances
+import json
+import tracemalloc
+
+import numpy as np
+
+from teaching_support import instrumentation
+from teaching_support.instrumentation import summarize_traces, trace_span, traced, tracing_enabled
+
+
+@traced()
+def inner(x):
+    """A traced leaf span."""
+    return x + 1
+
+
+@traced("outer")
+def outer(x):
+    """A traced span with a block and inner nested in it."""
+    with trace_span("block", size=x):
+        return inner(x) * 2
+
+
+def test_off_by_default(monkeypatch):
+    monkeypatch.setattr(instrumentation, "_recorder", None)
+    assert not tracing_enabled()
+    assert outer(1) == 4
+    # A span attribute may be called name too; the span name is positional-only.
+    assert trace_span("anything", name="x") is trace_span("other")  # pylint: disable=kwarg-superseded-by-positional-arg
+
+
+def test_spans_nest_and_are_counted(monkeypatch):
+    recorder = instrumentation._Recorder(None)
+    monkeypatch.setattr(instrumentation, "_recorder", recorder)
+    assert tracing_enabled()
+    for x in range(3):
+        assert outer(x) == 2 * (x + 1)
+    summary = recorder.summary()
+    assert summary["outer"]["count"] == 3
+    assert summary["test_instrumentation.inner"]["count"] == 3
+    assert summary["outer"]["self_s"] <= summary["outer"]["wall_s"]
+    assert set(recorder.folded) == {"outer", "outer;block", "outer;block;test_instrumentation.inner"}
+    block = next(e for e in recorder.events if e["name"] == "block")
+    assert block["args"]["size"] == 0
+    assert recorder.flush() is None  # no directory: nothing written
+
+
+def test_memory_peaks(monkeypatch):
+    was_tracing = tracemalloc.is_tracing()
+    recorder = instrumentation._Recorder(None, memory=True)
+    monkeypatch.setattr(instrumentation, "_recorder", recorder)
+    try:
+        with trace_span("allocate"):
+            np.ones(2**20).sum()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    assert recorder.summary()["allocate"]["alloc_peak_mb"] >= 8.0
+
+
+def test_flush_and_summarize(monkeypatch, tmp_path):
+    recorder = instrumentation._Recorder(None)
+    monkeypatch.setattr(instrumentation, "_recorder", recorder)
+    outer(1)
+    recorder.directory = str(tmp_path)
+    path = recorder.flush()
+    with open(path, encoding="utf-8") as fh:
+        trace = json.load(fh)
+    assert [e["name"] for e in trace["traceEvents"] if e["ph"] == "X"] == [
+        "test_instrumentation.inner", "block", "outer"]
+    assert trace["summary"]["outer"]["count"] == 1
+
+    merged = summarize_traces(str(tmp_path), folded=str(tmp_path / "all.folded"))
+    assert merged["processes"] == 1
+    assert merged["spans"]["outer"]["count"] == 1
+    assert (tmp_path / "all.folded").exists()
+
+
+def test_memory_peaks_without_reset_peak(monkeypatch):
+    monkeypatch.delattr(tracemalloc, "reset_peak")  # as on Python 3.8
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing:
+        tracemalloc.stop()
+    recorder = instrumentation._Recorder(None, memory=True)
+    monkeypatch.setattr(instrumentation, "_recorder", recorder)
+    try:
+        with trace_span("allocate"):
+            np.ones(2**20).sum()
+        with trace_span("small"):
+            np.ones(16).sum()
+    finally:
+        tracemalloc.stop()
+        if was_tracing:
+            tracemalloc.start()
+    summary = recorder.summary()
+    assert summary["allocate"]["alloc_peak_mb"] >= 8.0
+    assert summary["small"]["alloc_peak_mb"] < 1.0
@@ -0,0 +1,80 @@
+"""consecutive_kinetics: _phi and the closed-form kinetic features, through k1 = k2."""
+import builtins
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import concentration_vs_time_plots
+from teaching_support.consecutive_kinetics import _phi, conc_profiles, kinetic_features
+
+
+def test_phi_limit_and_small_arguments():
+    assert _phi(0.0) == 1.0
+    z = np.logspace(-15, -3, 50)
+    np.testing.assert_allclose(_phi(z), 1 - z / 2 + z**2 / 6 - z**3 / 24, rtol=1e-13)
+    z = np.array([0.1, 1.0, 10.0, 700.0])
+    np.testing.assert_allclose(_phi(z), (1 - np.exp(-z)) / z, rtol=1e-14)
+
+
+@pytest.mark.parametrize("k1, k2", [(0.2, 3.0), (3.0, 0.2), (1e-3, 1e3), (1.0, 1.0)])
+def test_peak_matches_dense_sampling(k1, k2):
+    features = kinetic_features(2.0, k1, k2)
+    t_max = float(features["t_max"])
+    t = np.linspace(0.5 * t_max, 1.5 * t_max, 200001)
+    X = conc_profiles(t, 2.0, k1, k2)[1]
+    assert t_max == pytest.approx(t[np.argmax(X)], rel=1e-4)
+    assert float(features["X_max"]) == pytest.approx(X.max(), rel=1e-9)
+
+
+def test_peak_time_formula():
+    features = kinetic_features(1.0, 0.5, 4.0)
+    assert float(features["t_max"]) == pytest.approx(np.log(8) / 3.5, rel=1e-14)
+
+
+def test_features_are_continuous_through_equal_rates():
+    k = 0.8
+    at = kinetic_features(1.0, k, k)
+    assert float(at["t_max"]) == pytest.approx(1 / k, rel=1e-15)
+    assert float(at["X_max"]) == pytest.approx(np.exp(-1), rel=1e-15)
+    for eps in (1e-12, 1e-6, -1e-6, 1e-3):
+        near = kinetic_features(1.0, k, k * (1 + eps))
+        assert float(near["t_max"]) == pytest.approx(1 / k, rel=2 * abs(eps))
+        assert float(near["X_max"]) == pytest.approx(np.exp(-1), rel=2 * abs(eps))
+
+
+@pytest.mark.parametrize("k1, k2", [(0.3, 2.0), (2.0, 0.3), (1.0, 1.0)])
+def test_inflection_points(k1, k2):
+    features = kinetic_features(1.0, k1, k2)
+    h = 1e-4 * float(features["t_max"])
+
+    def second_derivative(species, t):
+        values = [conc_profiles(t + d, 1.0, k1, k2)[species] for d in (-h, 0.0, h)]
+        return (values[0] - 2 * values[1] + values[2]) / h**2
+
+    scale = abs(second_derivative(1, 0.0 + 2 * h))
+    assert abs(second_derivative(1, float(features["t_inflection_X"]))) < 1e-5 * scale
+    assert abs(second_derivative(2, float(features["t_inflection_Z"]))) < 1e-5 * scale
+
+
+def test_features_broadcast():
+    features = kinetic_features([1.0, 2.0], np.array([[0.1], [1.0], [2.0]]), 0.5)
+    assert all(v.shape == (3, 2) for v in features.values())
+    np.testing.assert_allclose(features["half_life_1"][:, 0], np.log(2) / np.array([0.1, 1.0, 2.0]))
+
+
+@pytest.mark.parametrize("k1, k2", [(0.5, 5.0), (0.01, 0.02)])
+def test_script_labels_stay_inside_the_horizon(k1, k2, monkeypatch):
+    answers = iter(["1.0", str(k1), str(k2)])
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(answers))
+    monkeypatch.setattr(plt, "show", lambda: None)
+    concentration_vs_time_plots.main([])
+    try:
+        ax = plt.gca()
+        t_end = ax.lines[0].get_xdata()[-1]
+        labels = {text.get_text().strip(): text.get_position() for text in ax.texts}
+        assert labels["[X](t)"][0] <= t_end
+        if float(kinetic_features(1.0, k1, k2)["t_max"]) > t_end:
+            assert labels["[X](t)"][0] == t_end
+    finally:
+        plt.close("all")
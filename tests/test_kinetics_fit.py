@@ -0,0 +1,51 @@
+"""kinetics_fit: batched Levenberg-Marquardt recovers known rate constants."""
+import numpy as np
+import pytest
+
+from teaching_support.consecutive_kinetics import conc_profiles
+from teaching_support.kinetics_fit import fit_consecutive
+
+T = np.linspace(0, 12, 60)
+
+
+def test_recovers_rate_constants_from_exact_data():
+    k1 = np.array([0.3, 1.0, 2.5, 0.8])
+    k2 = np.array([1.5, 1.0, 0.4, 0.8000001])
+    A, X, _ = conc_profiles(T, 1.0, k1[:, None], k2[:, None])
+    fit = fit_consecutive(T, A=A, X=X)
+    assert fit.k1.shape == (4,)
+    assert np.all(fit.converged)
+    np.testing.assert_allclose(fit.k1, k1, rtol=1e-6)
+    np.testing.assert_allclose(fit.k2, k2, rtol=1e-6)
+
+
+def test_fits_a0_from_a_single_species():
+    X = conc_profiles(T, 2.0, 0.5, 1.7)[1]
+    fit = fit_consecutive(T, X=X, A0=1.0, fit_A0=True, k0=(0.4, 2.0))
+    assert (float(fit.k1), float(fit.k2), float(fit.A0)) == pytest.approx((0.5, 1.7, 2.0), rel=1e-6)
+
+
+def test_noisy_data_errors_are_consistent():
+    rng = np.random.default_rng(3)
+    sigma = 0.01
+    A, X, Z = conc_profiles(T, 1.0, 0.6, 2.0)
+    noisy = [v + rng.normal(0, sigma, (200, T.size)) for v in (A, X, Z)]
+    fit = fit_consecutive(T, *noisy, sigma=sigma)
+    pull = (fit.k1 - 0.6) / fit.k1_err
+    assert abs(pull.mean()) < 0.3 and pull.std() == pytest.approx(1.0, abs=0.2)
+    assert np.mean(fit.chi2 / fit.dof) == pytest.approx(1.0, abs=0.05)
+
+
+def test_missing_points():
+    A, X, _ = conc_profiles(T, 1.0, 0.9, 0.3)
+    X = X.copy()
+    X[::3] = np.nan
+    fit = fit_consecutive(T, A=A, X=X)
+    assert (float(fit.k1), float(fit.k2)) == pytest.approx((0.9, 0.3), rel=1e-6)
+
+
+def test_needs_data():
+    with pytest.raises(ValueError):
+        fit_consecutive(T)
+    with pytest.raises(ValueError):
+        fit_consecutive(T[:2], X=[0.0, 0.1])
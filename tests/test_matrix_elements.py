@@ -0,0 +1,84 @@
+"""matrix_elements: <n l | r^k | n' l'> tables, their known values and caching."""
+# pylint: disable=protected-access  # the LRU tests inspect the in-memory tables
+import numpy as np
+import pytest
+
+from teaching_support import matrix_elements
+from teaching_support.matrix_elements import (clear_memory_cache, dipole_radial_table,
+                                              radial_matrix_elements)
+from teaching_support.radial_engine import state_index, state_list
+from teaching_support.radial_moments import hydrogenic_moment
+
+
+def test_one_s_two_p_dipole():
+    table = radial_matrix_elements(2, k=1)
+    expected = 128 * np.sqrt(6) / 243
+    assert table[state_index(1, 0), state_index(2, 1)] == pytest.approx(expected, rel=1e-12)
+    assert table[state_index(2, 1), state_index(1, 0)] == pytest.approx(expected, rel=1e-12)
+    assert radial_matrix_elements(2, k=1, Z=2)[0, 2] == pytest.approx(expected / 2, rel=1e-12)
+
+
+def test_known_transition_values():
+    table = radial_matrix_elements(3, k=1)
+    # <n l-1|r|n l> = 3/2 n sqrt(n^2 - l^2) a0: 3 sqrt(3) for 2s-2p, 9 sqrt(5) / 2 for 3p-3d.
+    assert abs(table[state_index(2, 0), state_index(2, 1)]) == pytest.approx(3 * np.sqrt(3), rel=1e-12)
+    assert abs(table[state_index(3, 1), state_index(3, 2)]) == pytest.approx(9 * np.sqrt(5) / 2, rel=1e-12)
+
+
+def test_diagonal_is_the_expectation_value_and_overlaps_are_orthonormal():
+    states = state_list(6)
+    r1 = radial_matrix_elements(6, k=1)
+    np.testing.assert_allclose(np.diag(r1), [hydrogenic_moment(n, l, 1) for n, l in states], rtol=1e-12)
+    np.testing.assert_allclose(r1, r1.T, rtol=1e-12, atol=1e-12)
+    overlap = radial_matrix_elements(6, k=0)
+    same_l = np.array([[l == l2 for _, l2 in states] for _, l in states])
+    np.testing.assert_allclose(overlap[same_l], np.eye(len(states))[same_l], atol=1e-12)
+
+
+def test_dipole_table_keeps_only_delta_l_of_one():
+    table = dipole_radial_table(5)
+    full = radial_matrix_elements(5, k=1)
+    for i, (_, l) in enumerate(state_list(5)):
+        for j, (_, l2) in enumerate(state_list(5)):
+            if abs(l - l2) == 1:
+                assert table[i, j] == pytest.approx(full[i, j], rel=1e-12)
+            else:
+                assert table[i, j] == 0.0
+
+
+def test_tables_are_read_only_and_saved(tmp_path):
+    clear_memory_cache()
+    table = radial_matrix_elements(4, k=2, cache_dir=str(tmp_path))
+    assert not table.flags.writeable
+    assert radial_matrix_elements(4, k=2, cache_dir=str(tmp_path)) is table
+    assert [p.name.startswith("rk_v") for p in tmp_path.iterdir()] == [True]  # no temporary files left
+    clear_memory_cache()
+    reloaded = radial_matrix_elements(4, k=2, cache_dir=str(tmp_path))
+    assert reloaded is not table
+    np.testing.assert_array_equal(reloaded, table)
+
+
+def test_invalid_n_max():
+    with pytest.raises(ValueError):
+        radial_matrix_elements(0)
+
+
+def test_uncached_tables_bypass_memory_and_disk(tmp_path):
+    clear_memory_cache()
+    table = radial_matrix_elements(3, k=1, cache_dir=str(tmp_path), cache=False)
+    assert not table.flags.writeable
+    assert not list(tmp_path.iterdir())
+    assert not matrix_elements._memo
+    assert radial_matrix_elements(3, k=1, cache=False) is not table
+
+
+def test_memory_cache_is_bounded(monkeypatch):
+    clear_memory_cache()
+    monkeypatch.setattr(matrix_elements, "MEMORY_ENTRIES", 2)
+    first = radial_matrix_elements(2, k=0, cache_dir=None)
+    radial_matrix_elements(2, k=1, cache_dir=None)
+    assert radial_matrix_elements(2, k=0, cache_dir=None) is first  # now the most recent
+    radial_matrix_elements(2, k=2, cache_dir=None)
+    assert len(matrix_elements._memo) == 2
+    assert radial_matrix_elements(2, k=0, cache_dir=None) is first
+    assert (2, 1.0, 1.0, None, 128) not in matrix_elements._memo
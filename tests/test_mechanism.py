@@ -0,0 +1,75 @@
+"""mechanism: parsing, the analytic A -> X -> Z case and the stiff integrator."""
+import numpy as np
+import pytest
+
+from teaching_support.consecutive_kinetics import conc_profiles
+from teaching_support.mechanism import Mechanism, parse_reactions
+
+CONSECUTIVE = "A -> X : k1; X -> Z : k2"
+
+
+def test_parse_reactions():
+    steps = parse_reactions("A -> X : k1\n2 X -> D : kd; X <-> Y : kf, kr; Y -> : kloss")
+    assert steps == [({"A": 1}, {"X": 1}, "k1"), ({"X": 2}, {"D": 1}, "kd"),
+                     ({"X": 1}, {"Y": 1}, "kf"), ({"Y": 1}, {"X": 1}, "kr"), ({"Y": 1}, {}, "kloss")]
+    with pytest.raises(ValueError):
+        parse_reactions("A X : k1")
+
+
+@pytest.mark.parametrize("method", ["exact", "rosenbrock"])
+def test_integrate_matches_conc_profiles(method):
+    mech = Mechanism(CONSECUTIVE)
+    t = np.linspace(0, 10, 101)
+    k1 = np.array([0.3, 1.0, 2.0])
+    solution = mech.integrate(t, {"A": 1.0}, {"k1": k1, "k2": 1.0}, method=method, rtol=1e-8, atol=1e-12)
+    assert solution.c.shape == (3, 101, 3)
+    tol = 1e-10 if method == "exact" else 1e-5
+    for species, expected in zip("AXZ", conc_profiles(t, 1.0, k1[:, None], 1.0)):
+        np.testing.assert_allclose(solution[species], expected, atol=tol)
+
+
+def test_stiff_network_conserves_mass():
+    mech = Mechanism("A -> X : k1; X -> Z : k2")
+    t = np.linspace(0, 1e3, 50)
+    solution = mech.integrate(t, {"A": 1.0}, {"k1": 1e-3, "k2": 1e6}, method="rosenbrock")
+    np.testing.assert_allclose(solution.c.sum(axis=-1), 1.0, rtol=1e-8)
+    np.testing.assert_allclose(solution["A"], np.exp(-1e-3 * t), rtol=1e-4)
+
+
+def test_reversible_step_reaches_equilibrium():
+    mech = Mechanism("X <-> Y : kf, kr")
+    solution = mech.integrate([0.0, 50.0], {"X": 1.0}, {"kf": 2.0, "kr": 0.5})
+    assert solution["Y"][-1] / solution["X"][-1] == pytest.approx(4.0, rel=1e-8)
+
+
+def test_second_order_dimerisation():
+    mech = Mechanism("2 X -> D : kd")
+    assert not mech.first_order
+    t = np.linspace(0, 5, 21)
+    solution = mech.integrate(t, {"X": 1.0}, {"kd": 0.5}, rtol=1e-9)
+    # dX/dt = -2 kd X^2, so X = 1 / (1 + 2 kd t).
+    np.testing.assert_allclose(solution["X"], 1 / (1 + t), rtol=1e-6)
+
+
+def test_jacobian_matches_finite_differences_and_sparsity():
+    mech = Mechanism("A + B -> C : k1; 2 C -> D : k2; D -> A : k3")
+    c = np.array([0.7, 1.3, 0.4, 0.2])
+    k = {"k1": 1.5, "k2": 0.8, "k3": 0.3}
+    jac = mech.jacobian(c, k)
+    h = 1e-7
+    numeric = np.column_stack([(mech.rates(c + h * e, k) - mech.rates(c - h * e, k)) / (2 * h)
+                               for e in np.eye(4)])
+    np.testing.assert_allclose(jac, numeric, rtol=1e-6, atol=1e-9)
+    assert np.all(mech.jacobian_sparsity()[jac != 0])
+
+
+def test_invalid_arguments():
+    mech = Mechanism(CONSECUTIVE)
+    with pytest.raises(ValueError):
+        mech.integrate([0, 1], {"A": 1.0}, {"k1": 1.0})
+    with pytest.raises(ValueError):
+        mech.integrate([0, 1], {"Q": 1.0}, {"k1": 1.0, "k2": 1.0})
+    with pytest.raises(ValueError):
+        mech.integrate([0, 1], {"A": 1.0}, {"k1": 1.0, "k2": 1.0}, method="euler")
+    with pytest.raises(ValueError):
+        Mechanism("2 X -> D : kd").integrate([0, 1], {"X": 1.0}, {"kd": 1.0}, method="exact")
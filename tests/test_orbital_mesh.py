@@ -0,0 +1,52 @@
+"""orbital_mesh: reduced surfaces, welded meshes and their export."""
+import numpy as np
+import pytest
+
+from teaching_support.angular import harmonic_index, spherical_harmonics
+from teaching_support.orbital_mesh import (FINE_PHI, FINE_THETA, orbital_mesh, orbital_surface_grid,
+                                           reduce_orbital_surface, save_mesh)
+
+
+def test_reduced_grid_lies_on_the_surface():
+    x, y, z, values = orbital_surface_grid(2, 1)
+    assert x.shape == y.shape == z.shape == values.shape
+    assert x.shape[0] < FINE_PHI and x.shape[1] < FINE_THETA
+    np.testing.assert_allclose(np.sqrt(x**2 + y**2 + z**2), np.abs(values), atol=1e-12)
+    assert np.abs(values).max() == pytest.approx(1.0)
+
+
+def test_looser_tolerance_gives_fewer_triangles():
+    fine = orbital_surface_grid(3, 2, tol=1e-3)[0]
+    coarse = orbital_surface_grid(3, 2, tol=2e-2)[0]
+    assert coarse.size < fine.size
+
+
+def test_triangle_budget():
+    Y = spherical_harmonics(4, FINE_THETA, FINE_PHI)[harmonic_index(4, -3)]
+    x = reduce_orbital_surface(Y, tol=1e-4, max_triangles=5000)[0]
+    assert 2 * (x.shape[0] - 1) * (x.shape[1] - 1) <= 5000
+
+
+@pytest.mark.parametrize("l, m", [(0, 0), (1, 1), (2, 0), (3, -2)])
+def test_mesh_is_welded_and_non_degenerate(l, m):
+    vertices, faces, values = orbital_mesh(l, m)
+    assert vertices.dtype == np.float32 and faces.dtype == np.int32
+    assert len(values) == len(vertices)
+    assert faces.min() == 0 and faces.max() == len(vertices) - 1
+    assert np.all(np.isin(np.arange(len(vertices)), faces))
+    p0, p1, p2 = (vertices[faces[:, i]].astype(float) for i in range(3))
+    assert np.linalg.norm(np.cross(p1 - p0, p2 - p0), axis=1).min() > 0
+    np.testing.assert_allclose(np.linalg.norm(vertices, axis=1), np.abs(values), atol=1e-6)
+
+
+def test_save_mesh_formats(tmp_path):
+    mesh = orbital_mesh(1, 0, tol=1e-2)
+    save_mesh(mesh, str(tmp_path / "pz.npz"))
+    with np.load(tmp_path / "pz.npz") as data:
+        np.testing.assert_array_equal(data["faces"], mesh.faces)
+    save_mesh(mesh, str(tmp_path / "pz.ply"))
+    header = (tmp_path / "pz.ply").read_bytes().split(b"end_header\n")[0].decode()
+    assert f"element vertex {len(mesh.vertices)}" in header
+    assert f"element face {len(mesh.faces)}" in header
+    with pytest.raises(ValueError):
+        save_mesh(mesh, str(tmp_path / "pz.obj"))
@@ -0,0 +1,58 @@
+"""The teaching_support package: lazy exports, cheap import and the command line."""
+import subprocess
+import sys
+
+import matplotlib
+import matplotlib.pyplot as plt
+import pytest
+
+import teaching_support
+from teaching_support.cli import main
+from teaching_support.plotting import plot_exponential_difference, plot_radial_data
+from tests.conftest import REPO_DIR
+
+
+def test_every_export_resolves():
+    for name in teaching_support.__all__:
+        assert getattr(teaching_support, name) is not None
+    with pytest.raises(AttributeError):
+        getattr(teaching_support, "no_such_name")
+
+
+def test_import_does_not_pull_in_plotting_libraries():
+    code = ("import sys, teaching_support; teaching_support.radial_table; teaching_support.conc_profiles; "
+            "print(sorted(m for m in ('matplotlib', 'scipy', 'seaborn', 'pandas') if m in sys.modules))")
+    out = subprocess.run([sys.executable, "-c", code], cwd=REPO_DIR, capture_output=True, text=True,
+                         check=True)
+    assert out.stdout.strip() == "[]"
+
+
+def test_cli_nodes(capsys):
+    main(["nodes", "3", "0"])
+    values = [float(v) for v in capsys.readouterr().out.split()]
+    assert values == pytest.approx([1.9019237886, 7.0980762114])
+
+
+def test_cli_kinetics(capsys):
+    main(["kinetics", "--k1", "1", "--k2", "1"])
+    assert "t_max" in capsys.readouterr().out
+
+
+def test_plot_exponential_difference_returns_the_figure():
+    fig = plot_exponential_difference(0.5, 2.0)
+    try:
+        t = fig.axes[0].lines[0].get_xdata()
+        assert t[0] == 0.0 and t[-1] > 0
+    finally:
+        plt.close(fig)
+
+
+def test_plot_radial_data_leaves_the_global_style_alone():
+    before = dict(matplotlib.rcParams)
+    figures = plot_radial_data(3, r_max=20)
+    try:
+        assert figures[0].axes[0].get_facecolor()[:3] == (1.0, 1.0, 1.0)
+        assert dict(matplotlib.rcParams) == before
+    finally:
+        for fig in figures:
+            plt.close(fig)
@@ -0,0 +1,69 @@
+"""potentials: the broadcast V_eff engine and its analytic extrema."""
+import numpy as np
+import pytest
+
+from teaching_support.potentials import (compute_potential_terms, effective_potential,
+                                         effective_potential_extrema, V_eff)
+
+HARTREE_EV = 27.211386245988
+BOHR_ANGSTROM = 0.529177210903
+
+
+def test_atomic_units_formula():
+    r = np.linspace(0.2, 20, 300)
+    V = effective_potential(r, [0, 1, 3], Z=2, units="atomic")
+    assert V.shape == (3, r.size)
+    for row, l in zip(V, [0, 1, 3]):
+        np.testing.assert_allclose(row, l * (l + 1) / (2 * r**2) - 2 / r, rtol=1e-13, atol=1e-14)
+
+
+def test_broadcast_over_charges_and_components():
+    r = np.linspace(0.5, 5, 10)
+    V = effective_potential(r, [1, 2], Z=[1, 2, 3])
+    assert V.shape == (3, 2, 10)
+    np.testing.assert_allclose(V[2, 1], effective_potential(r, 2, Z=3)[0])
+    centrifugal, coulomb, total = effective_potential(r, [1, 2], Z=2, components=True)
+    np.testing.assert_allclose(centrifugal + coulomb, total)
+
+
+def test_V_eff_keeps_scalars_scalar():
+    value = V_eff(1e-10, 1)
+    assert isinstance(value, float)
+    assert value == pytest.approx(float(V_eff(np.array([1e-10]), 1)[0]))
+
+
+def test_out_buffer():
+    r = np.linspace(1, 2, 5)
+    out = np.empty((2, 5))
+    assert effective_potential(r, [1, 2], out=out) is out
+    with pytest.raises(ValueError):
+        effective_potential(r, [1, 2], out=np.empty((5,)))
+
+
+@pytest.mark.parametrize("l, Z", [(1, 1), (2, 3), (5, 1.5)])
+def test_extrema_match_the_sampled_curve(l, Z):
+    extrema = effective_potential_extrema(l, Z, units="atomic")
+    assert float(extrema["r_min"]) == pytest.approx(l * (l + 1) / Z)
+    assert float(extrema["V_min"]) == pytest.approx(-Z**2 / (2 * l * (l + 1)))
+    r = np.linspace(0.05, 4 * float(extrema["r_min"]), 400001)
+    V = effective_potential(r, l, Z, units="atomic")[0]
+    assert r[np.argmin(V)] == pytest.approx(float(extrema["r_min"]), rel=1e-4)
+    assert V.min() == pytest.approx(float(extrema["V_min"]), rel=1e-9)
+    assert effective_potential([float(extrema["r_zero"])], l, Z, units="atomic")[0, 0] == pytest.approx(
+        0.0, abs=1e-12)
+
+
+def test_extrema_units_and_s_states():
+    atomic = effective_potential_extrema([0, 1, 2], 1, units="atomic")
+    ev = effective_potential_extrema([0, 1, 2], 1, units="eV/angstrom")
+    assert np.all(np.isnan([values[0] for values in atomic.values()]))
+    np.testing.assert_allclose(ev["V_min"][1:], atomic["V_min"][1:] * HARTREE_EV, rtol=1e-8)
+    np.testing.assert_allclose(ev["r_min"][1:], atomic["r_min"][1:] * BOHR_ANGSTROM, rtol=1e-8)
+
+
+def test_legacy_wrappers_agree():
+    r_m = np.linspace(0.3e-10, 5e-10, 20)
+    joule = V_eff(r_m, 1)
+    centrifugal, coulomb, total = compute_potential_terms(1, r_m)
+    np.testing.assert_allclose(joule / 1.602176634e-19, total, rtol=1e-6)
+    np.testing.assert_allclose(centrifugal + coulomb, total)
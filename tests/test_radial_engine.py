@@ -0,0 +1,63 @@
+"""radial_engine: the batched R_nl recurrences against scipy's Laguerre polynomials."""
+import math
+
+import numpy as np
+import pytest
+from scipy.special import genlaguerre
+
+from teaching_support.radial_engine import (radial_probability_density, radial_shell, radial_table,
+                                            radial_wavefunction, state_index, state_list)
+from tests.conftest import trapezoid
+
+
+def reference_R(r, n, l, Z=1):
+    """Textbook R_nl from the associated Laguerre polynomial."""
+    rho = 2 * Z * r / n
+    norm = math.sqrt((2 * Z / n)**3 * math.factorial(n - l - 1) / (2 * n * math.factorial(n + l)))
+    return norm * np.exp(-rho / 2) * rho**l * genlaguerre(n - l - 1, 2 * l + 1)(rho)
+
+
+@pytest.mark.parametrize("Z", [1, 3])
+def test_radial_table_matches_genlaguerre(Z):
+    r = np.linspace(0, 60 / Z, 1201)
+    table = radial_table(6, r, Z)
+    assert table.shape == (21, r.size)
+    for row, (n, l) in enumerate(state_list(6)):
+        expected = reference_R(r, n, l, Z)
+        np.testing.assert_allclose(table[row], expected, rtol=1e-9, atol=1e-12 * np.abs(expected).max())
+
+
+def test_shell_and_single_state_agree_with_table():
+    r = np.linspace(0, 50, 500)
+    table = radial_table(5, r)
+    for n in range(1, 6):
+        shell = radial_shell(r, n)
+        assert shell.shape == (n, r.size)
+        for l in range(n):
+            np.testing.assert_allclose(shell[l], table[state_index(n, l)], rtol=1e-12, atol=1e-300)
+            np.testing.assert_allclose(radial_wavefunction(r, n, l), shell[l], rtol=1e-12, atol=1e-300)
+
+
+def test_state_list_and_index_are_consistent():
+    states = state_list(7)
+    assert len(states) == 7 * 8 // 2
+    assert [state_index(n, l) for n, l in states] == list(range(len(states)))
+
+
+@pytest.mark.parametrize("n, l", [(1, 0), (4, 2), (30, 0), (40, 39)])
+def test_states_are_normalised(n, l):
+    r = np.linspace(0, 6 * n * (n + 5), 400001)
+    density = radial_probability_density(r, n, l)
+    assert np.all(np.isfinite(density))
+    assert trapezoid(density, r) == pytest.approx(1.0, abs=1e-6)
+
+
+def test_broadcasts_over_grid_shape():
+    r = np.linspace(0, 10, 12).reshape(3, 4)
+    assert radial_wavefunction(r, 3, 1).shape == (3, 4)
+    assert radial_shell(r, 3).shape == (3, 3, 4)
+
+
+def test_invalid_state_raises():
+    with pytest.raises(ValueError):
+        radial_wavefunction(np.ones(3), 2, 2)
@@ -0,0 +1,57 @@
+"""radial_moments: Gauss-Laguerre <r^k> against the closed forms."""
+import math
+
+import numpy as np
+import pytest
+
+from teaching_support.radial_engine import state_list
+from teaching_support.radial_moments import (expectation_value, gauss_laguerre, hydrogenic_moment,
+                                             radial_moments)
+
+POWERS = (-2, -1, 0, 1, 2, 3)
+
+
+@pytest.mark.parametrize("Z", [1, 2.5])
+def test_quadrature_matches_hydrogenic_moment(Z):
+    moments = radial_moments(6, k=POWERS, Z=Z)
+    assert moments.shape == (21, len(POWERS))
+    for row, (n, l) in zip(moments, state_list(6)):
+        expected = [hydrogenic_moment(n, l, k, Z) for k in POWERS]
+        np.testing.assert_allclose(row, expected, rtol=1e-12)
+
+
+def test_textbook_values():
+    for n in range(1, 8):
+        for l in range(n):
+            assert hydrogenic_moment(n, l, 0) == pytest.approx(1.0)
+            assert hydrogenic_moment(n, l, 1) == pytest.approx((3 * n * n - l * (l + 1)) / 2)
+            assert hydrogenic_moment(n, l, 2) == pytest.approx(n * n * (5 * n * n + 1 - 3 * l * (l + 1)) / 2)
+            assert hydrogenic_moment(n, l, -1) == pytest.approx(1 / n**2)
+
+
+def test_single_state_and_divergent_moments():
+    assert expectation_value(4, 2, k=1) == pytest.approx(hydrogenic_moment(4, 2, 1), rel=1e-12)
+    assert expectation_value(3, 0, k=-3) == np.inf
+    assert hydrogenic_moment(3, 0, -3) == np.inf
+    moments = radial_moments(2, k=(-3, 0))
+    assert np.isinf(moments[0, 0]) and np.isinf(moments[1, 0])
+    assert moments[2, 0] == pytest.approx(hydrogenic_moment(2, 1, -3), rel=1e-12)
+
+
+def test_scalar_power_and_fractional_moment():
+    assert radial_moments(3, k=1).shape == (6,)
+    # <r^1/2> of 1s is 4 Gamma(7/2) / 2^(7/2); a half-integer power is not exact, only close.
+    assert radial_moments(1, k=0.5, order=160)[0] == pytest.approx(4 * math.gamma(3.5) / 2**3.5, rel=1e-7)
+
+
+def test_gauss_laguerre_integrates_polynomials_exactly():
+    x, w = gauss_laguerre(10)
+    for p in range(20):
+        assert np.sum(w * np.exp(-x) * x**p) == pytest.approx(float(np.prod(np.arange(1, p + 1))), rel=1e-12)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        radial_moments(0)
+    with pytest.raises(ValueError):
+        hydrogenic_moment(2, 0, -4)
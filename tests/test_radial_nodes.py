@@ -0,0 +1,50 @@
+"""radial_nodes: node positions from the Laguerre roots against scipy."""
+import numpy as np
+import pytest
+from scipy.special import roots_genlaguerre
+
+from teaching_support.radial_engine import radial_wavefunction
+from teaching_support.radial_nodes import all_radial_nodes, laguerre_roots, radial_nodes
+
+
+@pytest.mark.parametrize("n", [2, 5, 12, 25])
+@pytest.mark.parametrize("Z", [1, 2.5])
+def test_nodes_match_roots_genlaguerre(n, Z):
+    for l in range(n - 1):
+        expected = roots_genlaguerre(n - l - 1, 2 * l + 1)[0] * n / (2 * Z)
+        np.testing.assert_allclose(radial_nodes(n, l, Z), expected, rtol=1e-10)
+
+
+def test_wavefunction_vanishes_at_the_nodes():
+    for n in range(2, 9):
+        for l in range(n - 1):
+            nodes = radial_nodes(n, l)
+            r = np.linspace(0, nodes[-1] * 1.5, 20001)
+            scale = np.abs(radial_wavefunction(r, n, l)).max()
+            assert np.abs(radial_wavefunction(nodes, n, l)).max() < 1e-10 * scale
+
+
+def test_nodeless_states_and_grid_range():
+    assert radial_nodes(3, 2).size == 0
+    nodes = radial_nodes(6, 0)
+    inside = radial_nodes(6, 0, r=np.linspace(0, nodes[2], 10))
+    np.testing.assert_array_equal(inside, nodes[:3])
+
+
+def test_all_radial_nodes_matches_single_states():
+    table = all_radial_nodes(7, Z=2)
+    assert set(table) == {(n, l) for n in range(1, 8) for l in range(n)}
+    for (n, l), nodes in table.items():
+        np.testing.assert_allclose(nodes, radial_nodes(n, l, Z=2), rtol=1e-12)
+
+
+def test_laguerre_roots_batches_over_alpha():
+    roots = laguerre_roots(4, [1, 3, 5])
+    assert roots.shape == (3, 4)
+    for alpha, row in zip([1, 3, 5], roots):
+        np.testing.assert_allclose(row, roots_genlaguerre(4, alpha)[0], rtol=1e-12)
+
+
+def test_invalid_quantum_numbers():
+    with pytest.raises(ValueError):
+        radial_nodes(2, 2)
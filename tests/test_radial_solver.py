@@ -0,0 +1,49 @@
+"""radial_solver: the tridiagonal eigensolver against hydrogen."""
+import numpy as np
+import pytest
+
+from teaching_support.radial_engine import radial_wavefunction
+from teaching_support.radial_solver import (coulomb, radial_grid, screened_coulomb, solve_radial,
+                                            truncated_coulomb)
+
+
+@pytest.mark.parametrize("Z", [1, 2])
+def test_coulomb_energies(Z):
+    solution = solve_radial(coulomb(Z), l=[0, 1, 2], n_states=4, n_points=40000)
+    assert solution.energies.shape == (3, 4)
+    for l, row in zip(solution.l, solution.energies):
+        n = l + 1 + np.arange(4)
+        np.testing.assert_allclose(row, -Z**2 / (2 * n**2), rtol=1e-5)
+
+
+def test_eigenvectors_are_hydrogen_wavefunctions():
+    solution = solve_radial(coulomb(), l=1, n_states=3, n_points=30000)
+    r = solution.r
+    for i, u in enumerate(solution.u[0]):
+        expected = r * radial_wavefunction(r, 2 + i, 1)
+        assert np.abs(u - expected).max() < 1e-4 * np.abs(expected).max()
+
+
+def test_workers_give_the_same_result():
+    serial = solve_radial(coulomb(), l=[0, 1], n_states=2, n_points=2000)
+    pooled = solve_radial(coulomb(), l=[0, 1], n_states=2, n_points=2000, workers=2)
+    np.testing.assert_array_equal(serial.energies, pooled.energies)
+
+
+def test_modified_potentials_raise_the_levels():
+    hydrogen = solve_radial(coulomb(), l=0, n_states=2, n_points=5000).energies
+    screened = solve_radial(screened_coulomb(1, 5.0), l=0, n_states=2, n_points=5000).energies
+    truncated = solve_radial(truncated_coulomb(1, 0.5), l=0, n_states=2, n_points=5000).energies
+    assert np.all(screened > hydrogen) and np.all(truncated > hydrogen)
+
+
+def test_grids_and_validation():
+    r = radial_grid(50, 1000)
+    assert r[0] == 0 and r[-1] == 50 and np.all(np.diff(r) > 0)
+    assert np.diff(r)[0] < np.diff(r)[-1]
+    with pytest.raises(ValueError):
+        radial_grid(50, 100, kind="log")
+    with pytest.raises(ValueError):
+        solve_radial(coulomb(), r=np.linspace(0.1, 10, 100))
+    with pytest.raises(ValueError):
+        solve_radial(coulomb(), n_states=10, r=np.linspace(0, 10, 5))
@@ -0,0 +1,49 @@
+"""stochastic_kinetics: ensemble statistics against the binomial solution."""
+import numpy as np
+import pytest
+
+from teaching_support.stochastic_kinetics import (binomial_statistics, ensemble_statistics,
+                                                  iter_ensemble)
+
+T = np.linspace(0, 6, 13)
+
+
+def test_binomial_statistics_is_n0_p():
+    mean, variance = binomial_statistics(50, 0.7, 1.3, T)
+    assert mean.shape == variance.shape == (3, T.size)
+    np.testing.assert_allclose(mean.sum(axis=0), 50)
+    np.testing.assert_allclose(variance, mean * (1 - mean / 50))
+
+
+@pytest.mark.parametrize("method", ["leap", "ssa"])
+def test_ensemble_mean_is_n0_p(method):
+    stats = ensemble_statistics(40, 0.7, 1.3, T, replicates=4000, method=method, seed=1)
+    mean, variance = binomial_statistics(40, 0.7, 1.3, T)
+    assert stats.replicates == 4000
+    np.testing.assert_allclose(stats.mean.sum(axis=0), 40)
+    # Five standard errors of the sample mean (exact zeros at t = 0 allowed).
+    assert np.all(np.abs(stats.mean - mean) <= 5 * np.sqrt(variance / 4000) + 1e-12)
+    np.testing.assert_allclose(stats.variance[:, 1:], variance[:, 1:], rtol=0.15)
+
+
+def test_seed_fixes_the_result_for_any_worker_count():
+    serial = ensemble_statistics(20, 1.0, 2.0, T, replicates=3000, seed=7, chunk_size=1000)
+    pooled = ensemble_statistics(20, 1.0, 2.0, T, replicates=3000, seed=7, chunk_size=1000, workers=2)
+    np.testing.assert_array_equal(serial.mean, pooled.mean)
+    np.testing.assert_array_equal(serial.variance, pooled.variance)
+
+
+def test_iter_ensemble_yields_running_statistics():
+    sizes = [s.replicates for s in iter_ensemble(10, 1.0, 1.0, T, replicates=250, chunk_size=100, seed=0)]
+    assert sizes == [100, 200, 250]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        ensemble_statistics(10, 1.0, 1.0, T, method="euler")
+    with pytest.raises(ValueError):
+        ensemble_statistics(10, 1.0, 1.0, T[::-1])
+    with pytest.raises(ValueError):
+        ensemble_statistics(10, 1.0, 1.0, T, replicates=0)
+    with pytest.raises(ValueError):
+        ensemble_statistics(10, 1.0, 1.0, T, chunk_size=0)
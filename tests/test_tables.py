@@ -0,0 +1,99 @@
+"""tables: the binary column format, appends and CSV export."""
+import csv
+import json
+
+import numpy as np
+import pytest
+
+from teaching_support.tables import Table, TableWriter, export_csv, read_table, write_table
+
+
+def test_write_read_round_trip(tmp_path):
+    theta = np.linspace(0, np.pi, 101)
+    columns = {"theta": theta, "cos_theta": np.cos(theta), "index": np.arange(101, dtype=np.int32)}
+    table = write_table(str(tmp_path / "t"), columns, units={"theta": "rad"},
+                        metadata={"grid": "linspace"})
+    for mmap in (True, False):
+        read = read_table(str(tmp_path / "t"), mmap=mmap)
+        assert read.columns == ["theta", "cos_theta", "index"]
+        assert len(read) == 101
+        assert read.units == {"theta": "rad", "cos_theta": "", "index": ""}
+        assert read.metadata == {"grid": "linspace"}
+        for name, values in columns.items():
+            np.testing.assert_array_equal(read[name], values)
+            assert read[name].dtype == values.dtype
+    assert isinstance(table["theta"], np.memmap)
+
+
+def test_streamed_and_appended_rows(tmp_path):
+    path = str(tmp_path / "t")
+    with TableWriter(path, ["t", "X"]) as writer:
+        writer.append(np.arange(3.0), 0.5)
+        writer.append(t=np.arange(3.0, 5.0), X=[1.0, 2.0])
+    with TableWriter(path, mode="a") as writer:
+        writer.append([5.0], [3.0])
+    table = Table(path)
+    np.testing.assert_array_equal(table["t"], np.arange(6.0))
+    np.testing.assert_array_equal(table["X"], [0.5, 0.5, 0.5, 1.0, 2.0, 3.0])
+
+
+def test_rewrite_replaces_the_table(tmp_path):
+    path = str(tmp_path / "t")
+    write_table(path, {"a": np.arange(5.0), "b": np.ones(5)})
+    write_table(path, {"c": np.arange(2.0)})
+    assert Table(path).columns == ["c"]
+    assert sorted(p.name for p in (tmp_path / "t").iterdir()) == ["0.bin", "table.json"]
+
+
+def test_invalid_use(tmp_path):
+    path = str(tmp_path / "t")
+    write_table(path, {"a": np.arange(3.0)})
+    with pytest.raises(ValueError):
+        TableWriter(path, ["b"], mode="a")
+    with pytest.raises(ValueError):
+        TableWriter(path, mode="x")
+    with TableWriter(path, mode="a") as writer, pytest.raises(ValueError):
+        writer.append([1.0], [2.0])
+    header = json.loads((tmp_path / "t" / "table.json").read_text())
+    header["version"] = 99
+    (tmp_path / "t" / "table.json").write_text(json.dumps(header))
+    with pytest.raises(ValueError):
+        Table(path)
+
+
+def test_export_csv_reads_back_exactly(tmp_path):
+    theta = np.linspace(0, np.pi, 1000)
+    write_table(str(tmp_path / "t"), {"theta": theta, "cos_theta": np.cos(theta)}, units={"theta": "rad"})
+    export_csv(str(tmp_path / "t"), str(tmp_path / "t.csv"), chunk_rows=64)
+    lines = (tmp_path / "t.csv").read_text().splitlines()
+    assert lines[0] == "theta (rad),cos_theta"
+    values = np.loadtxt(tmp_path / "t.csv", delimiter=",", skiprows=1)
+    np.testing.assert_array_equal(values[:, 0], theta)
+    np.testing.assert_array_equal(values[:, 1], np.cos(theta))
+
+
+def test_export_csv_quotes_header_fields(tmp_path):
+    write_table(str(tmp_path / "t"), {"E": np.arange(3.0), "n": np.arange(3.0)}, units={"E": "kJ, per mol"})
+    export_csv(str(tmp_path / "t"), str(tmp_path / "t.csv"))
+    with open(tmp_path / "t.csv", newline="", encoding="utf-8") as fh:
+        rows = list(csv.reader(fh))
+    assert rows[0] == ["E (kJ, per mol)", "n"]
+    assert [len(row) for row in rows] == [2] * 4
+
+
+def test_append_drops_an_interrupted_chunk(tmp_path):
+    path = str(tmp_path / "t")
+    write_table(path, {"t": np.arange(3.0), "n": np.arange(3, dtype=np.int32)})
+    with open(tmp_path / "t" / "0.bin", "ab") as fh:  # a chunk written without its header update
+        fh.write(np.arange(10.0).tobytes())
+    with TableWriter(path, mode="a") as writer:
+        writer.append([3.0], [3])
+    table = Table(path)
+    np.testing.assert_array_equal(table["t"], np.arange(4.0))
+    np.testing.assert_array_equal(table["n"], np.arange(4))
+    assert (tmp_path / "t" / "0.bin").stat().st_size == 4 * 8
+
+    with open(tmp_path / "t" / "1.bin", "r+b") as fh:
+        fh.truncate(4)
+    with pytest.raises(ValueError):
+        TableWriter(path, mode="a")
@@ -0,0 +1,43 @@
+"""consecutive_kinetics: timescale-aware time grids and the streamed profiles."""
+import numpy as np
+import pytest
+
+from teaching_support.consecutive_kinetics import (conc_profiles, iter_conc_profiles, iter_time_grid,
+                                                   kinetic_time_grid)
+
+
+@pytest.mark.parametrize("k1, k2, t_end", [(1.0, 2.0, None), (1e4, 1.0, 20.0), (1.0, 1e4, 5.0),
+                                           (0.5, 0.5, 3.0)])
+def test_grid_shape_and_end_points(k1, k2, t_end):
+    t = kinetic_time_grid(k1, k2, t_end, n_points=500)
+    assert t.size == 500
+    assert t[0] == 0.0
+    assert t[-1] == (t_end if t_end is not None else 10 / min(k1, k2))
+    assert np.all(np.diff(t) > 0)
+
+
+@pytest.mark.parametrize("k1, k2", [(1e4, 1.0), (1.0, 1e4)])
+def test_stiff_rise_is_resolved(k1, k2):
+    t = kinetic_time_grid(k1, k2, n_points=1000)
+    fast = 1 / max(k1, k2)
+    assert np.count_nonzero(t < 5 * fast) >= 100
+    # The [X] peak itself is sampled finely enough to see.
+    X = conc_profiles(t, 1.0, k1, k2)[1]
+    t_max = np.log(k2 / k1) / (k2 - k1)
+    assert np.abs(t[np.argmax(X)] - t_max) < 0.1 * t_max
+
+
+def test_chunks_concatenate_to_the_grid():
+    t = kinetic_time_grid(3.0, 0.01, 1e3, n_points=1234)
+    chunks = list(iter_time_grid(3.0, 0.01, 1e3, n_points=1234, chunk_size=100))
+    assert max(c.size for c in chunks) == 100
+    np.testing.assert_array_equal(np.concatenate(chunks), t)
+
+
+def test_streamed_profiles_match_conc_profiles():
+    t = kinetic_time_grid(2.0, 0.2, n_points=300)
+    pieces = list(iter_conc_profiles(1.5, 2.0, 0.2, n_points=300, chunk_size=64))
+    streamed = [np.concatenate(column) for column in zip(*pieces)]
+    np.testing.assert_array_equal(streamed[0], t)
+    for got, want in zip(streamed[1:], conc_profiles(t, 1.5, 2.0, 0.2)):
+        np.testing.assert_array_equal(got, want)
@@ -0,0 +1,84 @@
+"""wavefunction_cache: LRU hits and evictions, and the persistent .npy copies."""
+import numpy as np
+
+from teaching_support import wavefunction_cache
+from teaching_support.radial_engine import radial_wavefunction
+from teaching_support.wavefunction_cache import WavefunctionCache, grid_fingerprint
+
+R_GRID = np.linspace(0, 30, 1000)
+
+
+def test_hit_returns_the_same_read_only_array():
+    cache = WavefunctionCache()
+    first = cache.get(R_GRID, 3, 1)
+    second = cache.get(R_GRID, 3, 1)
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert not first.flags.writeable
+    np.testing.assert_array_equal(first, radial_wavefunction(R_GRID, 3, 1))
+
+
+def test_key_covers_grid_and_charge():
+    cache = WavefunctionCache()
+    cache.get(R_GRID, 2, 0)
+    cache.get(R_GRID.copy(), 2, 0)
+    cache.get(R_GRID, 2, 0, Z=2)
+    cache.get(R_GRID[:-1], 2, 0)
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert grid_fingerprint(R_GRID) == grid_fingerprint(R_GRID.copy())
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = WavefunctionCache(max_bytes=2 * R_GRID.nbytes)
+    cache.get(R_GRID, 1, 0)
+    cache.get(R_GRID, 2, 0)
+    cache.get(R_GRID, 1, 0)  # 1s is now the most recent
+    cache.get(R_GRID, 3, 0)  # evicts 2s
+    assert len(cache) == 2
+    assert cache.nbytes <= cache.max_bytes
+    cache.get(R_GRID, 1, 0)
+    cache.get(R_GRID, 2, 0)
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_disk_copies_are_reused_by_a_new_cache(tmp_path):
+    WavefunctionCache(cache_dir=str(tmp_path)).get(R_GRID, 4, 2)
+    files = [p.name for p in tmp_path.iterdir()]
+    assert len(files) == 1 and files[0].endswith(".npy")
+
+    cache = WavefunctionCache(cache_dir=str(tmp_path))
+    R = cache.get(R_GRID, 4, 2)
+    assert (cache.disk_hits, cache.misses) == (1, 0)
+    np.testing.assert_array_equal(R, radial_wavefunction(R_GRID, 4, 2))
+
+
+def test_clear_keeps_files(tmp_path):
+    cache = WavefunctionCache(cache_dir=str(tmp_path))
+    cache.get(R_GRID, 2, 1)
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+    cache.get(R_GRID, 2, 1)
+    assert cache.disk_hits == 1
+
+
+def test_interrupted_write_leaves_no_file(tmp_path, monkeypatch):
+    def killed(fh, _array):
+        fh.write(b"\x93NUMPY partial")
+        raise KeyboardInterrupt
+
+    cache = WavefunctionCache(cache_dir=str(tmp_path))
+    monkeypatch.setattr(np, "save", killed)
+    try:
+        cache.get(R_GRID, 2, 0)
+    except KeyboardInterrupt:
+        pass
+    assert not list(tmp_path.iterdir())
+
+
+def test_engine_version_is_part_of_the_key(tmp_path, monkeypatch):
+    WavefunctionCache(cache_dir=str(tmp_path)).get(R_GRID, 3, 2)
+    monkeypatch.setattr(wavefunction_cache, "ENGINE_VERSION", wavefunction_cache.ENGINE_VERSION + 1)
+    cache = WavefunctionCache(cache_dir=str(tmp_path))
+    cache.get(R_GRID, 3, 2)
+    assert (cache.disk_hits, cache.misses) == (0, 1)
+    assert len(list(tmp_path.glob("*.npy"))) == 2